@@ -0,0 +1,66 @@
+"""
+Benchmark of the conversion of large synthetic ak.wwise.core.object.get results into columns: time to convert, memory
+held by the objects and by the columns, and time of an analysis over each.
+
+Usage:
+  python benchmarks/columns.py [object count] [repeat]
+"""
+import json
+import sys
+import timeit
+import tracemalloc
+
+from json_serializer import make_result_message
+
+from waapi.client.columns import available_columns_backends, to_columns
+
+
+def loudest_from_objects(objects):
+    return max(obj["Volume"] for obj in objects), sum(obj["Pitch"] for obj in objects) / len(objects)
+
+
+def loudest_from_columns(columns):
+    volumes, pitches = columns["Volume"], columns["Pitch"]
+    if hasattr(volumes, "max"):
+        return volumes.max(), pitches.mean()
+    return max(volumes), sum(pitches) / len(pitches)
+
+
+def measure_memory(make):
+    """
+    :return: Result of make and the memory it holds in MB
+    """
+    tracemalloc.start()
+    result = make()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size / 1e6
+
+
+def main():
+    object_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    payload = json.dumps(make_result_message(object_count)[4])
+    objects, objects_memory = measure_memory(lambda: json.loads(payload)["return"])
+    analysis = min(timeit.repeat(lambda: loudest_from_objects(objects), number=1, repeat=repeat))
+
+    print("{} objects, best of {}".format(object_count, repeat))
+    print("{:<14} {:>14} {:>12} {:>14}".format("format", "convert (ms)", "memory (MB)", "analysis (ms)"))
+    print("{:<14} {:>14} {:>12.1f} {:>14.2f}".format("list of dicts", "", objects_memory, analysis * 1000))
+
+    # Measured first: converting the objects interns their strings, which would no longer be traced
+    columns_memory = {}
+    for backend in available_columns_backends():
+        _, columns_memory[backend] = measure_memory(lambda: to_columns(json.loads(payload)["return"], backend=backend))
+
+    for backend in available_columns_backends():
+        convert = min(timeit.repeat(lambda: to_columns(objects, backend=backend), number=1, repeat=repeat))
+        columns = to_columns(objects, backend=backend)
+        analysis = min(timeit.repeat(lambda: loudest_from_columns(columns), number=1, repeat=repeat))
+        assert loudest_from_columns(columns) == loudest_from_objects(objects)
+        print("{:<14} {:>14.1f} {:>12.1f} {:>14.2f}".format(
+            backend, convert * 1000, columns_memory[backend], analysis * 1000))
+
+if __name__ == "__main__":
+    main()
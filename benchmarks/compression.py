@@ -0,0 +1,50 @@
+"""
+Benchmark of the permessage-deflate compression of WebSocket messages on large synthetic ak.wwise.core.object.get
+results: bytes on the wire and CPU time per message for each window size.
+
+Usage:
+  python benchmarks/compression.py [object count] [repeat]
+"""
+import sys
+import timeit
+import zlib
+
+from json_serializer import make_result_message
+
+from waapi.wamp.serializer import WaapiJsonObjectSerializer
+
+
+def compress(payload, window_bits, mem_level):
+    """
+    Compress a message as permessage-deflate does: raw deflate, flushed at the end of the message
+    """
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -window_bits, mem_level)
+    return compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def decompress(data, window_bits):
+    decompressor = zlib.decompressobj(-window_bits)
+    return decompressor.decompress(data + b"\x00\x00\xff\xff")
+
+
+def main():
+    object_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    payload = WaapiJsonObjectSerializer("json").serialize(make_result_message(object_count))
+    print("{} objects, {:.2f} MB payload, best of {}".format(object_count, len(payload) / 1e6, repeat))
+    print("{:<12} {:>10} {:>8} {:>16} {:>18}".format(
+        "window bits", "wire (KB)", "ratio", "compress (ms)", "decompress (ms)"))
+
+    for window_bits in range(9, 16):
+        data = compress(payload, window_bits, 8)
+        assert decompress(data, window_bits) == payload
+        compress_time = min(timeit.repeat(lambda: compress(payload, window_bits, 8), number=1, repeat=repeat))
+        decompress_time = min(timeit.repeat(lambda: decompress(data, window_bits), number=1, repeat=repeat))
+        print("{:<12} {:>10.1f} {:>8.3f} {:>16.2f} {:>18.2f}".format(
+            window_bits, len(data) / 1e3, float(len(data)) / len(payload), compress_time * 1000,
+            decompress_time * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark of the JSON serializers of WAMP messages on large synthetic ak.wwise.core.object.get results.
+
+Usage:
+  python benchmarks/json_serializer.py [object count] [repeat]
+"""
+import sys
+import timeit
+
+from autobahn.wamp.serializer import JsonObjectSerializer
+
+from waapi.wamp.serializer import WaapiJsonObjectSerializer, available_json_backends
+
+
+def make_result_message(object_count):
+    """
+    :return: WAMP RESULT message of an object.get query returning object_count objects with a few properties
+    :rtype: list
+    """
+    objects = [
+        {
+            "id": "{{{:08X}-0000-0000-0000-000000000000}}".format(index),
+            "name": "Sound_{}".format(index),
+            "type": "Sound",
+            "path": "\\Actor-Mixer Hierarchy\\Default Work Unit\\Folder_{}\\Sound_{}".format(index // 100, index),
+            "parent": {"id": "{{{:08X}-0000-0000-0000-000000000001}}".format(index // 100), "name": "Folder"},
+            "Volume": -6.5,
+            "Pitch": 0,
+            "IsStreamingEnabled": index % 2 == 0,
+            "notes": u"Voix française",
+        }
+        for index in range(object_count)
+    ]
+    return [50, 1, {}, [], {"return": objects}]
+
+
+def main():
+    object_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    message = make_result_message(object_count)
+    serializers = [("autobahn", JsonObjectSerializer())]
+    serializers += [(backend, WaapiJsonObjectSerializer(backend)) for backend in available_json_backends()]
+
+    payload = serializers[0][1].serialize(message)
+    print("{} objects, {:.1f} MB payload, best of {}".format(object_count, len(payload) / 1e6, repeat))
+    print("{:<10} {:>12} {:>12}".format("serializer", "decode (ms)", "encode (ms)"))
+
+    for name, serializer in serializers:
+        assert serializer.unserialize(payload) == [message]
+        decode = min(timeit.repeat(lambda: serializer.unserialize(payload), number=1, repeat=repeat))
+        encode = min(timeit.repeat(lambda: serializer.serialize(message), number=1, repeat=repeat))
+        print("{:<10} {:>12.1f} {:>12.1f}".format(name, decode * 1000, encode * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of the snapshots of ProjectMirror on a synthetic hierarchy: size of the file, time to write it and to read
+it back, compared to the same objects as JSON.
+
+Usage:
+  python benchmarks/mirror_snapshot.py [object count] [repeat]
+"""
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from waapi.client.snapshot import MirrorSnapshot
+
+PROJECT = "C:\\Projects\\Game\\Game.wproj"
+ROOTS = ["\\Actor-Mixer Hierarchy"]
+
+
+def make_objects(object_count, work_unit_count=100, folder_size=100):
+    """
+    :return: Objects of a hierarchy of work units, containing folders of sounds, parents before children
+    :rtype: list[dict]
+    """
+    objects = [{"id": "{ROOT}", "name": "Actor-Mixer Hierarchy", "type": "Folder", "path": ROOTS[0],
+                "parent": {"id": "{PROJECT}"}, "workunit": None}]
+    for work_unit_index in range(work_unit_count):
+        work_unit_id = "{{{:08X}-0000-0000-0000-000000000000}}".format(work_unit_index)
+        objects.append({"id": work_unit_id, "name": "Work Unit {}".format(work_unit_index), "type": "WorkUnit",
+                        "path": None, "parent": {"id": "{ROOT}"}, "workunit": {"id": work_unit_id}})
+
+    index = 0
+    while len(objects) < object_count:
+        work_unit_id = objects[1 + index % work_unit_count]["id"]
+        folder_id = "{{{:08X}-0000-0000-0000-000000000001}}".format(index)
+        objects.append({"id": folder_id, "name": "Folder_{}".format(index), "type": "ActorMixer", "path": None,
+                        "parent": {"id": work_unit_id}, "workunit": {"id": work_unit_id}})
+        for sound_index in range(folder_size):
+            objects.append({"id": "{{{:08X}-{:04X}-0000-0000-000000000002}}".format(index, sound_index),
+                            "name": "Sound_{}".format(sound_index), "type": "Sound", "path": None,
+                            "parent": {"id": folder_id}, "workunit": {"id": work_unit_id}})
+        index += 1
+    return objects
+
+
+def main():
+    object_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    objects = make_objects(object_count)
+    tokens = {obj["id"]: ["C:\\Projects\\Game\\" + obj["name"] + ".wwu", 0, 0]
+              for obj in objects if obj["type"] == "WorkUnit"}
+    directory = tempfile.mkdtemp()
+    try:
+        snapshot = MirrorSnapshot(directory)
+        write = min(timeit.repeat(lambda: snapshot.write(PROJECT, ROOTS, objects, tokens), number=1, repeat=repeat))
+        read = min(timeit.repeat(lambda: snapshot.read(PROJECT, ROOTS), number=1, repeat=repeat))
+        assert snapshot.read(PROJECT, ROOTS) == (objects, tokens)
+        size = os.path.getsize(snapshot.path_of(PROJECT, ROOTS))
+
+        json_path = os.path.join(directory, "objects.json")
+
+        def write_json():
+            with open(json_path, "w") as json_file:
+                json.dump({"objects": objects, "tokens": tokens}, json_file)
+
+        def read_json():
+            with open(json_path) as json_file:
+                return json.load(json_file)
+
+        json_write = min(timeit.repeat(write_json, number=1, repeat=repeat))
+        json_read = min(timeit.repeat(read_json, number=1, repeat=repeat))
+        json_size = os.path.getsize(json_path)
+    finally:
+        shutil.rmtree(directory)
+
+    print("{} objects, best of {}".format(len(objects), repeat))
+    print("{:<10} {:>10} {:>12} {:>12}".format("format", "size (MB)", "write (ms)", "read (ms)"))
+    print("{:<10} {:>10.2f} {:>12.1f} {:>12.1f}".format("snapshot", size / 1e6, write * 1000, read * 1000))
+    print("{:<10} {:>10.2f} {:>12.1f} {:>12.1f}".format("json", json_size / 1e6, json_write * 1000, json_read * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark of the validation of calls: time to compile a schema, overhead of validating a call, and round trip to the
+server saved by rejecting an invalid call locally.
+
+A schema similar to the one of ak.wwise.core.object.get is measured, as well as the schema of the URI from the server
+when it is reachable.
+
+Usage:
+  python benchmarks/validation.py [uri] [repeat]
+"""
+import logging
+import sys
+import timeit
+
+from waapi import WaapiClient, CannotConnectToWaapiException, compile_schema
+
+GUID_PATTERN = "^\\{[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12}\\}$"
+
+OBJECT_GET_SCHEMA = {
+    "argsSchema": {
+        "type": "object",
+        "properties": {
+            "waql": {"type": "string"},
+            "from": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "array", "items": {"$ref": "#/definitions/guid"}},
+                    "search": {"type": "array", "items": {"type": "string"}},
+                    "path": {"type": "array", "items": {"type": "string"}},
+                    "ofType": {"type": "array", "items": {"type": "string"}},
+                    "query": {"type": "array", "items": {"$ref": "#/definitions/guid"}},
+                },
+                "additionalProperties": False,
+                "minProperties": 1,
+                "maxProperties": 1,
+            },
+            "transform": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "select": {"type": "array", "items": {"enum": [
+                            "parent", "children", "descendants", "ancestors", "referencesTo"
+                        ]}},
+                        "range": {"type": "array", "items": {"type": "integer", "minimum": 0}, "maxItems": 2},
+                        "where": {"type": "array", "minItems": 2, "maxItems": 2},
+                    },
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "additionalProperties": False,
+        "oneOf": [{"required": ["waql"]}, {"required": ["from"]}],
+        "definitions": {"guid": {"type": "string", "pattern": GUID_PATTERN}},
+    },
+    "optionsSchema": {
+        "type": "object",
+        "properties": {
+            "return": {"type": "array", "items": {"type": "string"}, "uniqueItems": True},
+            "platform": {"anyOf": [{"$ref": "#/definitions/guid"}, {"type": "string"}]},
+            "language": {"anyOf": [{"$ref": "#/definitions/guid"}, {"type": "string"}]},
+        },
+        "additionalProperties": False,
+        "definitions": {"guid": {"type": "string", "pattern": GUID_PATTERN}},
+    },
+}
+
+ARGS = {
+    "from": {"path": ["\\Actor-Mixer Hierarchy\\Default Work Unit\\Folder_{}".format(index) for index in range(10)]},
+    "transform": [{"select": ["descendants"]}],
+}
+OPTIONS = {"return": ["id", "name", "type", "path", "parent", "Volume"]}
+
+
+def best_of(function, number, repeat):
+    """
+    :return: Best time of a single execution in microseconds
+    """
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    uri = sys.argv[1] if len(sys.argv) > 1 else "ak.wwise.core.object.get"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    logging.getLogger("WampClientAutobahn").setLevel(logging.CRITICAL)
+
+    try:
+        client = WaapiClient()
+    except CannotConnectToWaapiException:
+        client = None
+
+    schemas = [("object.get-like schema", OBJECT_GET_SCHEMA)]
+    if client is not None:
+        server_schema = client.call("ak.wwise.waapi.getSchema", {"uri": uri})
+        if server_schema:
+            schemas.append(("schema from the server", server_schema))
+
+    print("{:<32} {:>14} {:>14}".format("best of {} (us)".format(repeat), "compile", "validate"))
+    for name, schema in schemas:
+        compile_time = best_of(
+            lambda: (compile_schema(schema.get("argsSchema")), compile_schema(schema.get("optionsSchema"))),
+            100, repeat
+        )
+        validate_args = compile_schema(schema.get("argsSchema"))
+        validate_options = compile_schema(schema.get("optionsSchema"))
+        validate_time = best_of(lambda: (validate_args(ARGS, "$"), validate_options(OPTIONS, "$.options")),
+                                10000, repeat)
+        print("{:<32} {:>14.1f} {:>14.1f}".format(name, compile_time, validate_time))
+
+    if client is not None:
+        invalid_args = dict(ARGS, invalidArgument=True)
+        round_trip_time = best_of(lambda: client.call(uri, invalid_args, options=OPTIONS), 100, repeat)
+        print("round trip of an invalid {} call: {:.1f} us".format(uri, round_trip_time))
+        client.disconnect()
+
+
+if __name__ == "__main__":
+    main()
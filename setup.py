@@ -15,6 +15,12 @@ setup(
       'autobahn',
       'six'
     ],
+    extras_require={
+      'orjson': ['orjson'],
+      'ujson': ['ujson'],
+      'numpy': ['numpy'],
+      'pyarrow': ['pyarrow']
+    },
     license='Apache License 2.0',
     platforms=['any'],
     scripts=[],
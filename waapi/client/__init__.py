@@ -1,2 +1,14 @@
 from waapi.client.client import *
+from waapi.client.async_client import *
 from waapi.client.event import *
+from waapi.client.stream import *
+from waapi.client.runtime import *
+from waapi.client.cluster import *
+from waapi.client.pool import *
+from waapi.client.http_client import *
+from waapi.client.cache import *
+from waapi.client.schema import *
+from waapi.client.validation import *
+from waapi.client.snapshot import *
+from waapi.client.mirror import *
+from waapi.client.columns import *
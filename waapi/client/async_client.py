@@ -0,0 +1,244 @@
+from copy import copy
+
+from waapi.client.client import _merge_args_to_kwargs
+from waapi.client.event import EventHandler
+from waapi.client.interface import UnsubscribeHandler
+from waapi.client.stream import AsyncEventStream
+from waapi.wamp.interface import WampRequest, WampRequestType, CannotConnectToWaapiException
+from waapi.wamp.async_compatibility import asyncio
+from waapi.wamp.async_native_client import WampClientAutobahnNative, start_native_autobahn_client
+from waapi.wamp.serializer import make_serializers
+from waapi.wamp.transport import TransportStats
+
+
+class AsyncWaapiClient(UnsubscribeHandler):
+    """
+    Pythonic Wwise Authoring API client for applications already running an asyncio event loop.
+
+    Unlike WaapiClient, no background thread is started: the connection lives on the event loop of the caller and
+    requests are awaited directly. Event callbacks are called on the event loop; coroutine functions are supported and
+    may themselves await requests on the client.
+
+    The client connects when entering an async with statement, or when awaiting connect:
+      async with AsyncWaapiClient() as client:
+          result = await client.call("ak.wwise.core.getInfo")
+
+    Import as:
+      from waapi import AsyncWaapiClient
+    """
+    def __init__(self, url=None, allow_exception=False, serializer=None, compression=False):
+        """
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to ws://127.0.0.1:8080/waapi
+        :type: str
+        :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
+        :type allow_exception: bool
+        :param serializer: JSON library used to encode and decode messages, see WaapiClient
+        :type serializer: str | None
+        :param compression: Compression of WebSocket messages, see WaapiClient
+        :type compression: WebSocketCompression | bool
+        :raises: ValueError if the serializer is unknown or not installed
+        """
+        super(AsyncWaapiClient, self).__init__()
+
+        self._serializers = make_serializers(serializer)
+        self._compression = compression
+        self._transport_stats = TransportStats()
+
+        self._allow_exception = allow_exception
+        self._url = url or "ws://127.0.0.1:8080/waapi"
+
+        self._session = None
+        """:type: WampClientAutobahnNative"""
+
+        self._subscriptions = set()
+        """:type: set[EventHandler]"""
+
+    async def connect(self):
+        """
+        Connect to the Waapi server on the running event loop.
+
+        :raises: CannotConnectToWaapiException
+        """
+        if self.is_connected():
+            return
+
+        self._session = await start_native_autobahn_client(
+            self._url, WampClientAutobahnNative, self._allow_exception, self._serializers, self._compression,
+            self._transport_stats)
+        if self._session is None:
+            raise CannotConnectToWaapiException("Could not connect to " + self._url)
+
+    async def disconnect(self):
+        """
+        Gracefully disconnect from the Waapi server.
+
+        :return: True if the call caused a successful disconnection, False otherwise.
+        :rtype: bool
+        """
+        if not self.is_connected():
+            return False
+
+        session = self._session
+        self._session = None
+        for event_handler in self._subscriptions:
+            if isinstance(event_handler, AsyncEventStream):
+                event_handler.close()
+        self._subscriptions.clear()  # No need to unsubscribe, subscriptions will be dropped anyways
+        await session.leave_and_wait()
+        return True
+
+    def is_connected(self):
+        """
+        :return: True if the client is connected, False otherwise.
+        :rtype: bool
+        """
+        return bool(self._session and self._session.has_joined())
+
+    def traffic_stats(self):
+        """
+        Measure the traffic of the connection, e.g. to evaluate the compression settings. Reconnections are included.
+
+        :return: Number of "bytes_sent" and "bytes_received" on the wire, "payload_bytes_sent" and
+                 "payload_bytes_received" before compression and their "compression_ratio_sent" and
+                 "compression_ratio_received", "messages_sent" and "messages_received", CPU time in seconds spent to
+                 "compress_time" and "decompress_time" the "compressed_messages" and "decompressed_messages", and the
+                 negotiated "compression" extension, None if messages are not compressed.
+        :rtype: dict
+        """
+        return self._transport_stats.as_dict()
+
+    async def call(self, _uri, *args, **kwargs):
+        """
+        Do a Remote Procedure Call (RPC) to the Waapi server.
+        Arguments and options are accepted in the same forms as WaapiClient.call.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Result from the remote procedure call, None if failed.
+        :rtype: dict | None
+        :raises: WaapiRequestFailed
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        return await self.__do_request(WampRequestType.CALL, _uri, **kwargs)
+
+    async def subscribe(self, _uri, callback_or_handler=None, *args, **kwargs):
+        """
+        Subscribe to a topic on the Waapi server.
+        Options are accepted in the same forms as WaapiClient.subscribe.
+
+        The callback is called on the event loop: it must not block. When it is a coroutine function, it is scheduled
+        as a task on the event loop.
+
+        :param _uri: URI of the topic to subscribe to
+        :type _uri: str
+        :param callback_or_handler: A callback that will be called when the server publishes on the provided topic.
+                                    The instance can be a function with a matching signature or an instance of a
+                                    EventHandler (or subclass).
+        :type callback_or_handler: callable | EventHandler
+        :rtype: EventHandler | None
+        :raises: WaapiRequestFailed
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+
+        if callback_or_handler is not None and isinstance(callback_or_handler, EventHandler):
+            event_handler = callback_or_handler
+        else:
+            event_handler = EventHandler(self, callback_or_handler)
+
+        subscription = await self.__do_request(
+            WampRequestType.SUBSCRIBE,
+            _uri,
+            event_handler,
+            **kwargs
+        )
+        if subscription is not None:
+            event_handler.subscription = subscription
+            event_handler._unsubscribe_handler = self
+            self._subscriptions.add(event_handler)
+            return event_handler
+
+    async def subscribe_stream(self, _uri, *args, maxsize=AsyncEventStream.DEFAULT_MAXSIZE,
+                               overflow=AsyncEventStream.BLOCK, timeout=None, **kwargs):
+        """
+        Subscribe to a topic on the Waapi server and consume its events with an async for statement, e.g.:
+          stream = await client.subscribe_stream("ak.wwise.core.object.created", maxsize=10000)
+          async for event in stream:
+              print(event["object"])
+        Arguments are accepted in the same forms as WaapiClient.subscribe_stream.
+
+        :param _uri: URI of the topic to subscribe to
+        :type _uri: str
+        :param maxsize: Maximum number of events buffered by the stream, 0 for no limit
+        :type maxsize: int
+        :param overflow: What to do with an event received when the stream is full: AsyncEventStream.BLOCK,
+                         AsyncEventStream.DROP_OLDEST or AsyncEventStream.DROP_NEWEST
+        :type overflow: str
+        :param timeout: Number of seconds to wait for an event when iterating before raising asyncio.TimeoutError, None
+                        to wait until the stream is closed
+        :type timeout: float | None
+        :rtype: AsyncEventStream | None
+        :raises: WaapiRequestFailed
+        """
+        stream = AsyncEventStream(self, maxsize, overflow, timeout)
+        return await self.subscribe(_uri, stream, *args, **kwargs)
+
+    async def unsubscribe(self, event_handler):
+        """
+        Unsubscribe from a topic managed by the passed EventHandler instance.
+
+        Alternatively, you may await the unsubscribe method on the EventHandler directly.
+
+        :param event_handler: Event handler that can be found in this client instance's subscriptions
+        :type event_handler: EventHandler
+        :return: True if successfully unsubscribed, False otherwise.
+        :rtype: bool
+        """
+        if event_handler not in self._subscriptions:
+            return False
+
+        success = await self.__do_request(
+            WampRequestType.UNSUBSCRIBE,
+            callback=event_handler,
+            subscription=event_handler.subscription
+        )
+        if success:
+            self._subscriptions.remove(event_handler)
+            event_handler.subscription = None
+        return success
+
+    def subscriptions(self):
+        """
+        :return: A copy of the set of subscriptions belonging to client instance.
+        :rtype: set[EventHandler]
+        """
+        return copy(self._subscriptions)
+
+    async def __do_request(self, request_type, _uri=None, callback=None, subscription=None, **kwargs):
+        """
+        Create a generic WAMP request and process it directly on the session
+
+        :type request_type: WampRequestType
+        :type _uri: str | None
+        :type callback: (*Any) -> None | None
+        :type subscription: Subscription | None
+        :return: Result from WampRequest, None if request failed.
+        :rtype: dict | None
+        """
+        if not self.is_connected():
+            return
+
+        future = asyncio.get_event_loop().create_future()
+        request = WampRequest(request_type, _uri, kwargs, callback, subscription, future)
+        await self._session.handle_request(request)
+
+        # The session completes the future unless the request type is unknown
+        if future.done():
+            return future.result()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
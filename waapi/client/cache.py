@@ -0,0 +1,196 @@
+import json
+from collections import OrderedDict
+from copy import deepcopy
+from threading import Lock
+
+from waapi.client.event import EventHandler
+from waapi.wamp.dispatch import DispatchMode
+
+
+class ResultCache:
+    """
+    Least recently used cache of the results of read-only calls of a WaapiClient, e.g.:
+      with WaapiClient(cache=ResultCache(maxsize=4096)) as client:
+          client.call("ak.wwise.core.object.get", query)  # Sent to the server
+          client.call("ak.wwise.core.object.get", query)  # Result from the cache
+          print(client.cache.stats())
+
+    Results are keyed by the URI, the arguments and the options of the call. The client subscribes to the topics
+    notifying changes to the project, and any change, or any call that is not read-only, invalidates the results
+    depending on the project. Results of calls that completed after an invalidation they started before are not cached.
+
+    Results are copied out of the cache: callers may modify them.
+
+    Import as:
+      from waapi import ResultCache
+    """
+    DEFAULT_MAXSIZE = 1024
+
+    DEFAULT_URIS = frozenset((
+        u"ak.wwise.core.getInfo",
+        u"ak.wwise.core.getProjectInfo",
+        u"ak.wwise.core.object.get",
+        u"ak.wwise.core.object.getPropertyAndReferenceNames",
+        u"ak.wwise.core.object.getPropertyInfo",
+        u"ak.wwise.core.object.getPropertyNames",
+        u"ak.wwise.core.object.getTypes",
+        u"ak.wwise.waapi.getFunctions",
+        u"ak.wwise.waapi.getSchema",
+        u"ak.wwise.waapi.getTopics",
+    ))
+    """Read-only remote procedures cached by default"""
+
+    PROJECT_INDEPENDENT_URIS = frozenset((
+        u"ak.wwise.core.getInfo",
+        u"ak.wwise.core.object.getTypes",
+        u"ak.wwise.waapi.getFunctions",
+        u"ak.wwise.waapi.getSchema",
+        u"ak.wwise.waapi.getTopics",
+    ))
+    """Remote procedures whose results do not change with the project, never invalidated"""
+
+    INVALIDATION_TOPICS = (
+        u"ak.wwise.core.object.created",
+        u"ak.wwise.core.object.preDeleted",
+        u"ak.wwise.core.object.nameChanged",
+        u"ak.wwise.core.object.propertyChanged",
+        u"ak.wwise.core.object.childAdded",
+        u"ak.wwise.core.object.childRemoved",
+        u"ak.wwise.core.object.referenceChanged",
+        u"ak.wwise.core.object.notesChanged",
+    )
+    """Topics notifying changes to the project"""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, uris=DEFAULT_URIS, topics=INVALIDATION_TOPICS):
+        """
+        :param maxsize: Maximum number of results kept, the least recently used results are evicted first
+        :type maxsize: int
+        :param uris: Remote procedures whose results are cached, which must be read-only
+        :type uris: collections.abc.Iterable[str]
+        :param topics: Topics whose events invalidate the results depending on the project
+        :type topics: collections.abc.Iterable[str]
+        """
+        self.maxsize = max(1, maxsize)
+        self.uris = frozenset(uris)
+        self.topics = tuple(topics)
+
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        """:type: OrderedDict[str, (str, Any)]"""
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def is_cacheable(self, uri):
+        """
+        :type uri: str
+        :rtype: bool
+        """
+        return uri in self.uris
+
+    @staticmethod
+    def make_key(uri, kwargs):
+        """
+        :type uri: str
+        :param kwargs: Arguments and options of the call
+        :type kwargs: dict
+        :return: Key that is equal for the same call, regardless of the order of the arguments and options
+        :rtype: str
+        """
+        return uri + json.dumps(kwargs, sort_keys=True, separators=(",", ":"), default=repr)
+
+    def generation(self):
+        """
+        :return: Number of invalidations so far, to pass to put when the call completes
+        :rtype: int
+        """
+        with self._lock:
+            return self._generation
+
+    def get(self, key):
+        """
+        :type key: str
+        :return: Whether the result is cached, and a copy of the result
+        :rtype: (bool, Any)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            result = entry[1]
+        return True, deepcopy(result)
+
+    def put(self, key, uri, result, generation):
+        """
+        Cache the result of a call, unless the cache was invalidated since the call started. The cache keeps the result
+        itself, which must no longer be modified.
+
+        :type key: str
+        :type uri: str
+        :param generation: Generation of the cache when the call started
+        :type generation: int
+        :return: True if the result was cached
+        :rtype: bool
+        """
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._entries[key] = (uri, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def invalidate(self, *args, **kwargs):
+        """
+        Remove the results depending on the project, e.g. when it changes.
+        Accepts any argument to be used directly as an event callback.
+        """
+        with self._lock:
+            self._generation += 1
+            self._invalidations += 1
+            for key in [key for key, (uri, _) in self._entries.items() if uri not in self.PROJECT_INDEPENDENT_URIS]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Remove all the results
+        """
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        """
+        :return: Number of "hits" and "misses", "size" and "maxsize" of the cache, number of results removed by
+                 "evictions" and number of "invalidations"
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+class _CacheInvalidationHandler(EventHandler):
+    """
+    Invalidate a cache as soon as an event is received, before the responses received after it are processed
+    """
+    dispatch_mode = DispatchMode.INLINE
+
+    def __init__(self, cache):
+        """
+        :type cache: ResultCache
+        """
+        super(_CacheInvalidationHandler, self).__init__(callback=cache.invalidate)
@@ -1,12 +1,24 @@
-from sys import platform
-from copy import copy
-
+import concurrent.futures
+import itertools
+from collections import deque
+from copy import copy, deepcopy
+from pprint import pformat
+from threading import BoundedSemaphore, Lock
+
+from waapi.client.cache import ResultCache, _CacheInvalidationHandler
 from waapi.client.event import EventHandler
+from waapi.client.runtime import WaapiRuntime
+from waapi.client.stream import EventStream
+from waapi.client.validation import ArgumentValidator
 from waapi.client.interface import UnsubscribeHandler
-from waapi.wamp.interface import WampRequest, WampRequestType, CannotConnectToWaapiException, WaapiRequestFailed
+from waapi.wamp.interface import WampRequest, WampRequestType, CannotConnectToWaapiException, WaapiRequestFailed, \
+    READ_ONLY_URIS
 from waapi.wamp.async_decoupled_client import WampClientAutobahn
+from waapi.wamp.dispatch import EventDispatcher
 from waapi.wamp.async_compatibility import asyncio
 from waapi.wamp.ak_autobahn import start_decoupled_autobahn_client
+from waapi.wamp.serializer import make_serializers
+from waapi.wamp.transport import TransportStats, WebSocketCompression
 
 
 def connect(url=None):
@@ -27,6 +39,246 @@ def enable_debug_log():
     WampClientAutobahn.enable_debug_log()
 
 
+def wait_all(futures, timeout=None, return_exceptions=False):
+    """
+    Wait for the completion of futures returned by the asynchronous methods of a client.
+
+    :param futures: Futures returned by e.g. WaapiClient.call_async
+    :type futures: collections.abc.Iterable[concurrent.futures.Future]
+    :param timeout: Maximum number of seconds to wait for all futures, None to wait indefinitely
+    :type timeout: float | None
+    :param return_exceptions: True to return exceptions as results, False to raise the first one
+    :type return_exceptions: bool
+    :return: Results of the futures, in the order of the futures
+    :rtype: list
+    :raises: concurrent.futures.TimeoutError
+    """
+    futures = list(futures)
+    done, not_done = concurrent.futures.wait(futures, timeout)
+    if not_done:
+        raise concurrent.futures.TimeoutError("{} of {} requests did not complete".format(len(not_done), len(futures)))
+
+    if return_exceptions:
+        return [future.exception() or future.result() for future in futures]
+    return [future.result() for future in futures]
+
+
+def as_completed(futures, timeout=None):
+    """
+    Iterate over futures returned by the asynchronous methods of a client as they complete.
+
+    :param futures: Futures returned by e.g. WaapiClient.call_async
+    :type futures: collections.abc.Iterable[concurrent.futures.Future]
+    :param timeout: Maximum number of seconds to wait for all futures, None to wait indefinitely
+    :type timeout: float | None
+    :return: Generator of the completed futures
+    :raises: concurrent.futures.TimeoutError
+    """
+    return concurrent.futures.as_completed(list(futures), timeout)
+
+
+def _completed(result):
+    """
+    :return: A future already completed with result
+    :rtype: concurrent.futures.Future
+    """
+    future = concurrent.futures.Future()
+    future.set_result(result)
+    return future
+
+
+def _then(future, transform):
+    """
+    Chain a transformation of the result of a future
+
+    :type future: concurrent.futures.Future
+    :type transform: (Any) -> Any
+    :return: Future completed with the transformed result, or the exception of the source future
+    :rtype: concurrent.futures.Future
+    """
+    chained_future = concurrent.futures.Future()
+
+    def on_done(done_future):
+        try:
+            chained_future.set_result(transform(done_future.result()))
+        except Exception as e:
+            chained_future.set_exception(e)
+
+    future.add_done_callback(on_done)
+    return chained_future
+
+
+def _chain(future, next_step):
+    """
+    Chain an asynchronous step after a future
+
+    :type future: concurrent.futures.Future
+    :param next_step: Function called with the result of the future, returning the future of the next step
+    :type next_step: (Any) -> concurrent.futures.Future
+    :return: Future completed with the outcome of the next step, or the exception of the source future
+    :rtype: concurrent.futures.Future
+    """
+    chained_future = concurrent.futures.Future()
+
+    def on_done(done_future):
+        try:
+            _forward(next_step(done_future.result()), chained_future)
+        except Exception as e:
+            chained_future.set_exception(e)
+
+    future.add_done_callback(on_done)
+    return chained_future
+
+
+def _forward(source, target):
+    """
+    Complete a future with the outcome of another once it is done
+
+    :type source: concurrent.futures.Future
+    :type target: concurrent.futures.Future
+    """
+    def forward(done_future):
+        if done_future.cancelled():
+            target.cancel()
+        elif done_future.exception() is not None:
+            target.set_exception(done_future.exception())
+        else:
+            target.set_result(done_future.result())
+
+    source.add_done_callback(forward)
+
+
+def _merge_args_to_kwargs(args, kwargs):
+    """
+    Merged a single dictionary passed as argument to a kwargs dictionary, if it exists.
+
+    :type args: tuple[dict] | tuple[]
+    :param kwargs: dict
+    :return: Updated kwargs
+    :rtype: dict
+    """
+    if len(args) > 0 and isinstance(args[0], dict):
+        kwargs.update(args[0])
+    return kwargs
+
+
+def _pages_of_query(kwargs, page_size):
+    """
+    Split the arguments of ak.wwise.core.object.get into the arguments of pages
+
+    :param kwargs: Arguments of ak.wwise.core.object.get, without options
+    :type kwargs: dict
+    :type page_size: int
+    :return: Generator of the arguments of each page, endless for WAQL queries
+    :rtype: collections.abc.Iterator[dict]
+    """
+    if "waql" in kwargs:
+        for index in itertools.count():
+            yield dict(kwargs, waql=u"{} skip {} take {}".format(kwargs["waql"], index * page_size, page_size))
+
+    source = kwargs.get("from") or {}
+    for key in (u"id", u"path"):
+        if isinstance(source.get(key), list):
+            items = source[key]
+            for start in range(0, len(items), page_size):
+                yield dict(kwargs, **{"from": dict(source, **{key: items[start:start + page_size]})})
+            return
+    yield dict(kwargs)
+
+
+class _SharedResultFuture(concurrent.futures.Future):
+    """
+    Future completed with the result of a request, which may be shared with others, e.g. kept by the cache. A shared
+    result is copied on the thread of the caller when it gets it, so that callers may modify their results without
+    slowing down the thread of the connection.
+    """
+    def __init__(self, source, share):
+        """
+        :param source: Future of the request
+        :type source: concurrent.futures.Future
+        :param share: Called with the result once the request completed, returns True if the result is shared
+        :type share: (Any) -> bool
+        """
+        super(_SharedResultFuture, self).__init__()
+        self._share = share
+        self._shared = False
+        source.add_done_callback(self._complete)
+
+    def _complete(self, source):
+        if source.cancelled():
+            self.cancel()
+        elif source.exception() is not None:
+            self.set_exception(source.exception())
+        else:
+            result = source.result()
+            self._shared = result is not None and self._share(result)
+            self.set_result(result)
+
+    def result(self, timeout=None):
+        result = super(_SharedResultFuture, self).result(timeout)
+        return deepcopy(result) if self._shared else result
+
+
+class _InFlightCall:
+    """
+    Request shared by identical calls
+    """
+    def __init__(self, future):
+        """
+        :type future: concurrent.futures.Future
+        """
+        self.future = future
+        self.caller_count = 1
+
+
+class _InFlightCalls:
+    """
+    Identical read-only calls in flight at the same time, sharing a single request to the server.
+    If a call was joined, each caller receives a copy of the result, so that callers may modify their results.
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self._calls = {}
+        """:type: dict[Hashable, _InFlightCall]"""
+        self.coalesced_count = 0
+
+    def call(self, key, send):
+        """
+        :param key: Key that is equal for identical calls
+        :type key: Hashable
+        :param send: Function sending the request, only called if no identical call is in flight, returning its future
+                     and a function sharing its result, see _SharedResultFuture
+        :type send: () -> (concurrent.futures.Future, (Any) -> bool)
+        :return: Future completed with the result of the call
+        :rtype: concurrent.futures.Future
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced_count += 1
+                call.caller_count += 1
+                return _SharedResultFuture(call.future, lambda _: True)
+
+            # Completed once sent: send may make other calls, which must not wait on the lock
+            call = self._calls[key] = _InFlightCall(concurrent.futures.Future())
+
+        # Removed before the result of the first caller is shared: the number of callers is final
+        call.future.add_done_callback(lambda _: self._remove(key, call))
+        try:
+            future, share = send()
+        except BaseException as e:
+            call.future.set_exception(e)
+            raise
+
+        _forward(future, call.future)
+        return _SharedResultFuture(call.future, lambda result: share(result) or call.caller_count > 1)
+
+    def _remove(self, key, call):
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+
 class WaapiClient(UnsubscribeHandler):
     """
     Pythonic Wwise Authoring API client with a synchronous looking API.
@@ -41,42 +293,105 @@ class WaapiClient(UnsubscribeHandler):
     Import as:
       from waapi import WaapiClient
     """
-    def __init__(self, url=None, allow_exception=False):
+    DEFAULT_PAGE_SIZE = 1000
+    DEFAULT_PAGES_IN_FLIGHT = 4
+
+    def __init__(self, url=None, allow_exception=False, max_in_flight=WampClientAutobahn.DEFAULT_MAX_IN_FLIGHT,
+                 event_workers=EventDispatcher.DEFAULT_MAX_WORKERS, ordered_events=False, reconnect=False,
+                 on_reconnect=None, runtime=None, serializer=None, compression=False, cache=None, coalesce_calls=False,
+                 validate=False):
         """
         :param url: URL of the Wwise Authoring API WAMP server, defaults to ws://127.0.0.1:8080/waapi
         :type: str
         :param allow_exception: Allow errors on call and subscribe to throw an exception. Default is False.
         :type allow_exception: bool
-        :raises: CannotConnectToWaapiException
+        :param max_in_flight: Maximum number of requests sent to the server concurrently when the client is used from
+                              multiple threads. Use 1 to process requests strictly one after the other.
+        :type max_in_flight: int
+        :param event_workers: Maximum number of threads on which subscription callbacks are called concurrently.
+                              Events received while all threads are busy are queued.
+        :type event_workers: int
+        :param ordered_events: True to call the callback of each subscription one event at a time, in the order the
+                               events were received. Callbacks of different subscriptions still run in parallel.
+        :type ordered_events: bool
+        :param reconnect: True to reconnect with an exponential backoff when the connection is lost, e.g. when Wwise
+                          restarts. Subscriptions are restored, and the requests interrupted by the loss of the
+                          connection are sent again if they are read-only, otherwise they fail. The initial connection
+                          must still succeed.
+        :type reconnect: bool
+        :param on_reconnect: Called on an event worker after each reconnection with a dictionary reporting the number of
+                             "attempts", the "downtime" in seconds since "disconnected_at" (a timestamp) during which
+                             events were missed, the number of subscriptions "resubscribed", the topics of the
+                             "failed_subscriptions", and the number of requests "replayed" and "dropped".
+        :type on_reconnect: (dict) -> None | None
+        :param runtime: Runtime whose event loop thread hosts the connection, which can be shared with other clients.
+                        By default, the client starts a runtime of its own and closes it when disconnecting.
+        :type runtime: WaapiRuntime | None
+        :param serializer: JSON library used to encode and decode messages: "orjson", "ujson", "json" for the standard
+                           library, or "auto" for the fastest one installed. Messages are decoded directly from the
+                           received bytes. By default, the JSON serializer of autobahn is used.
+        :type serializer: str | None
+        :param compression: permessage-deflate compression of WebSocket messages, offered to the server, e.g. when Wwise
+                            is reached over a slow link. True for the default settings, a WebSocketCompression to
+                            configure the window size and the minimum size of compressed messages, False to disable it
+                            (default), as it only costs CPU time on a local connection. See traffic_stats for its effect.
+        :type compression: WebSocketCompression | bool
+        :param cache: Cache of the results of read-only calls, True for a ResultCache with the default settings. The
+                      client subscribes to the topics invalidating the cache when connecting.
+        :type cache: ResultCache | bool | None
+        :param coalesce_calls: True to share a single request between identical read-only calls made while one of them
+                               is in flight, e.g. by many threads refreshing at once. Each caller of a shared request
+                               receives its own copy of the result, made on the thread of the caller.
+        :type coalesce_calls: bool
+        :param validate: True to validate the arguments and options of calls against the schemas of their remote
+                         procedures before sending them, an ArgumentValidator to get the schemas from elsewhere, e.g. a
+                         SchemaCache. Invalid calls fail locally with the error ak.wwise.schema_validation_failed.
+                         The schema of a remote procedure is requested the first time it is called, and the call is
+                         sent once it is validated, without blocking the caller of call_async.
+        :type validate: ArgumentValidator | bool
+        :raises: CannotConnectToWaapiException, ValueError if the serializer is unknown or not installed
         """
         super(WaapiClient, self).__init__()
 
+        # Set before anything can raise, for __del__ to disconnect
+        self._decoupler = None
+        """:type: AutobahnClientDecoupler"""
+
+        self._cache = ResultCache() if cache is True else cache or None
+        self._in_flight_calls = _InFlightCalls() if coalesce_calls else None
+        self._validator = ArgumentValidator(self.__get_schema) if validate is True else validate or None
+        if self._cache is not None:
+            on_reconnect = self.__invalidate_cache_on_reconnect(on_reconnect)
+
+        self._serializers = make_serializers(serializer)
+        self._compression = compression
+        self._transport_stats = TransportStats()
+
         self._allow_exception = allow_exception
+        self._max_in_flight = max_in_flight
+        self._reconnect = reconnect
+        self._on_reconnect = on_reconnect
         self._url = url or "ws://127.0.0.1:8080/waapi"
-        self._client_thread = None
-        """:type: Thread"""
-
-        self._loop = asyncio.get_event_loop()
-        if not self._loop.is_running():
-            if not self._loop.is_closed():
-                self._loop.close()
-            if platform == 'win32':
-                #  Prefer the ProactorEventLoop event loop on Windows
-                self._loop = asyncio.ProactorEventLoop()
-            else:
-                self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
+        self._client_future = None
+        """:type: concurrent.futures.Future"""
 
-        self._decoupler = None
-        """:type: AutobahnClientDecoupler"""
+        self._runtime = runtime or WaapiRuntime()
+        self._owns_runtime = runtime is None
+
+        self._dispatcher = EventDispatcher(event_workers, ordered_events)
 
         self._subscriptions = set()
         """:type: set[EventHandler]"""
 
         # Connect on instantiation (RAII idiom)
         if not self.__connect():
+            self._dispatcher.shutdown()
+            self.__close_runtime()
             raise CannotConnectToWaapiException("Could not connect to " + self._url)
 
+        if self._cache is not None:
+            self.__subscribe_cache_invalidation()
+
     def __connect(self):
         """
         Connect to the Waapi server.
@@ -87,14 +402,61 @@ class WaapiClient(UnsubscribeHandler):
         """
         # Arbitrary queue size of 32
         # TODO: Test if an unbounded queue might do the job for most cases, add the queue size as a parameter
-        self._client_thread, self._decoupler = \
-            start_decoupled_autobahn_client(self._url, WampClientAutobahn, 32, self._loop, self._allow_exception)
+        self._client_future, self._decoupler = \
+            start_decoupled_autobahn_client(
+                self._url,
+                WampClientAutobahn,
+                32,
+                self._runtime.loop,
+                self._allow_exception,
+                self._max_in_flight,
+                self._dispatcher,
+                self._reconnect,
+                self._on_reconnect,
+                self._serializers,
+                self._compression,
+                self._transport_stats
+            )
 
         # Return upon connection success
         self._decoupler.wait_for_joined()
 
-        # A failure is indicated by the runner client thread being terminated
-        return self._client_thread.is_alive()
+        # A failure is indicated by the client being stopped
+        return not self._decoupler.is_stopped()
+
+    def __subscribe_cache_invalidation(self):
+        """
+        Subscribe to the topics invalidating the cache. These subscriptions are not part of the subscriptions of the
+        client, and are dropped when disconnecting.
+        """
+        futures = []
+        for topic in self._cache.topics:
+            handler = _CacheInvalidationHandler(self._cache)
+            futures.append(self.__do_request_async(
+                WampRequestType.SUBSCRIBE, topic, handler, _allow_exception=False
+            ))
+        wait_all(futures)
+
+    def __invalidate_cache_on_reconnect(self, on_reconnect):
+        """
+        :param on_reconnect: Callback of the user
+        :type on_reconnect: (dict) -> None | None
+        :return: Callback invalidating the cache, as events were missed while disconnected, before calling on_reconnect
+        :rtype: (dict) -> None
+        """
+        def invalidate_and_notify(report):
+            self._cache.invalidate()
+            if on_reconnect is not None:
+                on_reconnect(report)
+        return invalidate_and_notify
+
+    @property
+    def cache(self):
+        """
+        :return: Cache of the results of read-only calls, see its stats method for hits and misses
+        :rtype: ResultCache | None
+        """
+        return self._cache
 
     def disconnect(self):
         """
@@ -104,18 +466,24 @@ class WaapiClient(UnsubscribeHandler):
         :rtype: bool
         """
         if self.is_connected() and self.__do_request(WampRequestType.STOP):
-            # Wait for the runner thread to gracefully exit and the asyncio loop to close
-            if self._client_thread.is_alive():
-                self._client_thread.join()
+            # Wait for the client to gracefully stop
+            concurrent.futures.wait([self._client_future])
 
+            self._close_streams()
             self._subscriptions.clear()  # No need to unsubscribe, subscriptions will be dropped anyways
 
-            # Create a new loop for upcoming uses
-            if asyncio.get_event_loop().is_closed():
-                asyncio.set_event_loop(asyncio.new_event_loop())
+            # Let callbacks of the events already received complete
+            self._dispatcher.shutdown()
+            self.__close_runtime()
 
             return True
 
+        if self._decoupler and self._decoupler.is_stopped():
+            # The connection was lost or never established
+            self._close_streams()
+            self._dispatcher.shutdown()
+            self.__close_runtime()
+
         # Only the caller that truly caused the disconnection return True
         return False
 
@@ -124,7 +492,20 @@ class WaapiClient(UnsubscribeHandler):
         :return: True if the client is connected, False otherwise.
         :rtype: bool
         """
-        return self._decoupler and self._decoupler.has_joined() and self._client_thread.is_alive()
+        return bool(self._decoupler and self._decoupler.has_joined() and not self._decoupler.is_stopped())
+
+    def traffic_stats(self):
+        """
+        Measure the traffic of the connection, e.g. to evaluate the compression settings. Reconnections are included.
+
+        :return: Number of "bytes_sent" and "bytes_received" on the wire, "payload_bytes_sent" and
+                 "payload_bytes_received" before compression and their "compression_ratio_sent" and
+                 "compression_ratio_received", "messages_sent" and "messages_received", CPU time in seconds spent to
+                 "compress_time" and "decompress_time" the "compressed_messages" and "decompressed_messages", and the
+                 negotiated "compression" extension, None if messages are not compressed.
+        :rtype: dict
+        """
+        return self._transport_stats.as_dict()
 
     def call(self, _uri, *args, **kwargs):
         """
@@ -152,15 +533,135 @@ class WaapiClient(UnsubscribeHandler):
         :rtype: dict | None
         :raises: WaapiRequestFailed
         """
-        kwargs = self.__merge_args_to_kwargs(args, kwargs)
-        return self.__do_request(WampRequestType.CALL, _uri, **kwargs)
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        return self.__call_async(_uri, kwargs).result()
+
+    def call_async(self, _uri, *args, **kwargs):
+        """
+        Non-blocking version of call: the request is sent and a future is returned immediately.
+        Arguments and options are accepted in the same forms as the call method.
+
+        Many requests can be in flight at once from a single thread, e.g.:
+          futures = [client.call_async("ak.wwise.core.object.get", query) for query in queries]
+          results = wait_all(futures)
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Future completed with the result from the remote procedure call, None if failed.
+                 When exceptions are allowed, the future is completed with WaapiRequestFailed on failure.
+        :rtype: concurrent.futures.Future
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        return self.__call_async(_uri, kwargs)
+
+    def call_many(self, requests, max_in_flight=WampClientAutobahn.DEFAULT_MAX_IN_FLIGHT):
+        """
+        Do many Remote Procedure Calls concurrently over the connection, e.g.:
+          results = client.call_many(
+              ("ak.wwise.core.object.setProperty", {"object": id, "property": "Volume", "value": -6})
+              for id in object_ids
+          )
+
+        Failures do not abort the batch: the result of a failed call is the WaapiRequestFailed describing the error,
+        whether or not the client allows exceptions.
+
+        :param requests: Calls to do, as tuples of (uri,), (uri, args) or (uri, args, options) where args and options
+                         are dictionaries or None. The iterable is consumed as calls complete.
+        :type requests: collections.abc.Iterable[tuple]
+        :param max_in_flight: Maximum number of calls of this batch waiting on a response at once, which is also bounded
+                              by the max_in_flight of the client
+        :type max_in_flight: int
+        :return: Results of the calls in the order of the requests. A result is a WaapiRequestFailed if the call failed,
+                 None if the client disconnected before it completed.
+        :rtype: list[dict | WaapiRequestFailed | None]
+        """
+        in_flight_limit = BoundedSemaphore(max(1, max_in_flight))
+        futures = []
+
+        for request in requests:
+            _uri, args, options = (tuple(request) + (None, None))[:3]
+            kwargs = dict(args) if args else {}
+            if options is not None:
+                kwargs["options"] = options
+
+            in_flight_limit.acquire()
+            future = self.__call_async(_uri, kwargs, _allow_exception=True)
+            future.add_done_callback(lambda _: in_flight_limit.release())
+            futures.append(future)
+
+        return wait_all(futures, return_exceptions=True)
+
+    def iter_objects(self, query, options=None, page_size=DEFAULT_PAGE_SIZE, pages_in_flight=DEFAULT_PAGES_IN_FLIGHT):
+        """
+        Iterate over the objects returned by ak.wwise.core.object.get, fetched in pages so that only a few pages are
+        held in memory at once, however many objects the query returns, e.g.:
+          for sound in client.iter_objects({"waql": "$ from type Sound"}, options={"return": ["id", "Volume"]}):
+              print(sound["id"], sound["Volume"])
+
+        WAQL queries are paged with skip and take, which only splits the results consistently if their order is fixed:
+        end the query with an orderby, e.g. "$ from type Sound orderby path". Objects created or deleted while the pages
+        are fetched may still be skipped or returned twice. Queries from lists of ids or paths are paged by batches of
+        ids or paths, each page returning the objects of a batch with its transforms. Other queries are done in a
+        single page.
+
+        The next pages are requested while the objects of the current page are consumed. Iteration stops at a page that
+        failed, raising WaapiRequestFailed if the client allows exceptions, and logging an error otherwise.
+
+        :param query: Arguments of ak.wwise.core.object.get, options may be passed using the key "options"
+        :type query: dict
+        :param options: Options of ak.wwise.core.object.get, e.g. {"return": ["id", "name"]}
+        :type options: dict | None
+        :param page_size: Number of objects, ids or paths per page
+        :type page_size: int
+        :param pages_in_flight: Maximum number of pages requested ahead of the page being consumed, plus one
+        :type pages_in_flight: int
+        :return: Generator of the objects, in the order of the pages
+        :rtype: collections.abc.Iterator[dict]
+        :raises: WaapiRequestFailed
+        """
+        kwargs = dict(query)
+        options = kwargs.pop("options", None) if options is None else options
+        kwargs.pop("options", None)
+        page_size = max(1, page_size)
+
+        open_ended = "waql" in kwargs
+        pages = _pages_of_query(kwargs, page_size)
+        futures = deque()
+        object_count = 0
+        while True:
+            while len(futures) < max(1, pages_in_flight):
+                page = next(pages, None)
+                if page is None:
+                    break
+                if options is not None:
+                    page["options"] = options
+                futures.append(self.__call_async(u"ak.wwise.core.object.get", page))
+
+            if not futures:
+                return
+            result = futures.popleft().result()
+            if result is None:
+                WampClientAutobahn.logger.error(
+                    "WampClientAutobahn (ERROR): iter_objects stopped at a failed page after {} objects, the results are "
+                    "incomplete".format(object_count))
+                return
+
+            objects = result.get("return", [])
+            object_count += len(objects)
+            result = None
+            for obj in objects:
+                yield obj
+            if open_ended and len(objects) < page_size:
+                # Last page, the pages requested ahead are empty
+                return
 
     def subscribe(self, _uri, callback_or_handler=None, *args, **kwargs):
         """
         Subscribe to a topic on the Waapi server.
         Named arguments are options to be passed for the subscription.
 
-        Note that the callback will be called from a different thread.
+        Note that the callback will be called from a different thread, one of the event_workers of the client.
         Use threading mechanisms to synchronize your code and avoid race conditions.
 
         Like the call method, you may pass a dictionary to avoid reserved keywords restrictions, e.g.:
@@ -173,6 +674,9 @@ class WaapiClient(UnsubscribeHandler):
         Note that any named arguments passed take precedence on the values of a dictionary passed as
         a positional argument.
 
+        Handlers subscribed to the same topic with the same options share a single subscription on the server, which
+        is only removed when the last of them unsubscribes.
+
         :param _uri: URI of the remote procedure to be called
         :type _uri: str
         :param callback_or_handler: A callback that will be called when the server publishes on the provided topic.
@@ -183,24 +687,70 @@ class WaapiClient(UnsubscribeHandler):
         :rtype: EventHandler | None
         :raises: WaapiRequestFailed
         """
-        kwargs = self.__merge_args_to_kwargs(args, kwargs)
+        return self.subscribe_async(_uri, callback_or_handler, *args, **kwargs).result()
+
+    def subscribe_async(self, _uri, callback_or_handler=None, *args, **kwargs):
+        """
+        Non-blocking version of subscribe: the request is sent and a future is returned immediately.
+        Options are accepted in the same forms as the subscribe method.
+
+        :param _uri: URI of the topic to subscribe to
+        :type _uri: str
+        :param callback_or_handler: A callback that will be called when the server publishes on the provided topic.
+                                    The instance can be a function with a matching signature or an instance of a
+                                    EventHandler (or subclass).
+        :type callback_or_handler: callable | EventHandler
+        :return: Future completed with the EventHandler managing the subscription, None if failed.
+                 When exceptions are allowed, the future is completed with WaapiRequestFailed on failure.
+        :rtype: concurrent.futures.Future
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
 
         if callback_or_handler is not None and isinstance(callback_or_handler, EventHandler):
             event_handler = callback_or_handler
         else:
             event_handler = EventHandler(self, callback_or_handler)
 
-        subscription = self.__do_request(
-            WampRequestType.SUBSCRIBE,
-            _uri,
-            event_handler.on_event,
-            **kwargs
+        def on_subscribed(subscription):
+            if subscription is not None:
+                event_handler.subscription = subscription
+                event_handler._unsubscribe_handler = self
+                self._subscriptions.add(event_handler)
+                return event_handler
+
+        return _then(
+            self.__do_request_async(
+                WampRequestType.SUBSCRIBE,
+                _uri,
+                event_handler,
+                **kwargs
+            ),
+            on_subscribed
         )
-        if subscription is not None:
-            event_handler.subscription = subscription
-            event_handler._unsubscribe_handler = self
-            self._subscriptions.add(event_handler)
-            return event_handler
+
+    def subscribe_stream(self, _uri, *args, maxsize=EventStream.DEFAULT_MAXSIZE, overflow=EventStream.BLOCK,
+                         timeout=None, **kwargs):
+        """
+        Subscribe to a topic on the Waapi server and consume its events by iterating over them, e.g.:
+          for event in client.subscribe_stream("ak.wwise.core.object.created", maxsize=10000):
+              print(event["object"])
+        Options are accepted in the same forms as the subscribe method.
+
+        :param _uri: URI of the topic to subscribe to
+        :type _uri: str
+        :param maxsize: Maximum number of events buffered by the stream, 0 for no limit
+        :type maxsize: int
+        :param overflow: What to do with an event received when the stream is full: EventStream.BLOCK,
+                         EventStream.DROP_OLDEST or EventStream.DROP_NEWEST
+        :type overflow: str
+        :param timeout: Number of seconds to wait for an event when iterating before raising TimeoutError, None to wait
+                        until the stream is closed
+        :type timeout: float | None
+        :rtype: EventStream | None
+        :raises: WaapiRequestFailed
+        """
+        stream = EventStream(self, maxsize, overflow, timeout)
+        return self.subscribe(_uri, stream, *args, **kwargs)
 
     def unsubscribe(self, event_handler):
         """
@@ -216,7 +766,12 @@ class WaapiClient(UnsubscribeHandler):
         if event_handler not in self._subscriptions:
             return False
 
-        success = self.__do_request(WampRequestType.UNSUBSCRIBE, subscription=event_handler.subscription)
+        # The callback orders the unsubscription after any pending subscription of the same handler
+        success = self.__do_request(
+            WampRequestType.UNSUBSCRIBE,
+            callback=event_handler,
+            subscription=event_handler.subscription
+        )
         if success:
             self._subscriptions.remove(event_handler)
             event_handler.subscription = None
@@ -229,23 +784,108 @@ class WaapiClient(UnsubscribeHandler):
         """
         return copy(self._subscriptions)
 
-    @staticmethod
-    def __merge_args_to_kwargs(args, kwargs):
+    def __close_runtime(self):
+        """
+        Close the runtime if it belongs to this client, a shared runtime is left to its owner
         """
-        Merged a single dictionary passed as argument to a kwargs dictionary, if it exists.
+        if self._owns_runtime:
+            self._runtime.close()
 
-        :type args: tuple[dict] | tuple[]
-        :param kwargs: dict
-        :return: Updated kwargs
-        :rtype: dict
+    def _close_streams(self):
+        """
+        End the iteration of the streams of this client, they no longer receive events
+        """
+        for event_handler in self._subscriptions:
+            if isinstance(event_handler, EventStream):
+                event_handler.close()
+
+    def __get_schema(self, uri):
+        """
+        :return: Future completed with the result of ak.wwise.waapi.getSchema for the URI, None if the call failed
+        :rtype: concurrent.futures.Future
+        """
+        # Sent directly: it is requested while sending another call, and the validator shares the lookups in flight
+        return self.__do_request_async(WampRequestType.CALL, u"ak.wwise.waapi.getSchema", _allow_exception=False, uri=uri)
+
+    def __call_async(self, _uri, kwargs, _allow_exception=None):
+        """
+        Call through the cache of results, the calls in flight and the validator, if any
+
+        :type _uri: str
+        :type kwargs: dict
+        :param _allow_exception: Overrides the allow_exception setting of the client for this call
+        :type _allow_exception: bool | None
+        :return: Future completed with the result from the remote procedure call
+        :rtype: concurrent.futures.Future
+        """
+        read_only = _uri in READ_ONLY_URIS
+        cache = self._cache if self._cache is not None and self._cache.is_cacheable(_uri) else None
+        coalesce = self._in_flight_calls is not None and read_only
+        key = ResultCache.make_key(_uri, kwargs) if cache is not None or coalesce else None
+
+        if cache is not None:
+            cached, result = cache.get(key)
+            if cached:
+                return _completed(result)
+
+        def send():
+            """
+            :return: Future of the request, and function putting its result in the cache, returning True if cached
+            :rtype: (concurrent.futures.Future, (Any) -> bool)
+            """
+            generation = cache.generation() if cache is not None else None
+            future = self.__send_call(_uri, kwargs, _allow_exception)
+            if cache is None and self._cache is not None and not read_only:
+                # The call may have changed the project
+                future.add_done_callback(lambda _: self._cache.invalidate())
+
+            def put_in_cache(result):
+                # The cache keeps the result itself, callers get copies
+                return cache is not None and cache.put(key, _uri, result, generation)
+            return future, put_in_cache
+
+        if coalesce:
+            return self._in_flight_calls.call((key, _allow_exception), send)
+        return _SharedResultFuture(*send())
+
+    def __send_call(self, _uri, kwargs, _allow_exception):
         """
-        if len(args) > 0 and isinstance(args[0], dict):
-            kwargs.update(args[0])
-        return kwargs
+        Send a call, once validated if the client validates calls. The schema of the remote procedure is requested the
+        first time it is called, without blocking the caller.
+
+        :return: Future completed with the result from the remote procedure call
+        :rtype: concurrent.futures.Future
+        """
+        if self._validator is None:
+            return self.__do_request_async(WampRequestType.CALL, _uri, _allow_exception=_allow_exception, **kwargs)
+
+        error_future = self._validator.validate_async(_uri, kwargs)
+        if error_future.done():
+            return self.__send_valid_call(_uri, kwargs, _allow_exception, error_future.result())
+        return _chain(error_future, lambda error: self.__send_valid_call(_uri, kwargs, _allow_exception, error))
+
+    def __send_valid_call(self, _uri, kwargs, _allow_exception, error):
+        """
+        :param error: Error describing why the call is invalid, None to send it
+        :type error: WaapiRequestFailed | None
+        :return: Future completed with the result from the remote procedure call, or the validation error
+        :rtype: concurrent.futures.Future
+        """
+        if error is None:
+            return self.__do_request_async(WampRequestType.CALL, _uri, _allow_exception=_allow_exception, **kwargs)
+
+        # Logged like the calls failing on the server
+        WampClientAutobahn.logger.error("WampClientAutobahn (ERROR): " + pformat(str(error)))
+        allow_exception = self._allow_exception if _allow_exception is None else _allow_exception
+        if not allow_exception:
+            return _completed(None)
+        future = concurrent.futures.Future()
+        future.set_exception(error)
+        return future
 
     def __do_request(self, request_type, _uri=None, callback=None, subscription=None, **kwargs):
         """
-        Create and forward a generic WAMP request to the decoupler
+        Create and forward a generic WAMP request to the decoupler, blocking until it is processed
 
         :type request_type: WampRequestType
         :type _uri: str | None
@@ -254,29 +894,42 @@ class WaapiClient(UnsubscribeHandler):
         :return: Result from WampRequest, None if request failed.
         :rtype: dict | None
         """
-        if not self._client_thread.is_alive():
-            return
+        return self.__do_request_async(request_type, _uri, callback, subscription, **kwargs).result()
 
-        # Make sure the current thread has the event loop set
-        asyncio.set_event_loop(self._loop)
-
-        async def _async_request(future):
-            """
-            :type future: asyncio.Future
-            """
-            request = WampRequest(request_type, _uri, kwargs, callback, subscription, future)
-            await self._decoupler.put_request(request)
-            await future  # The client worker is responsible for completing the future
+    def __do_request_async(self, request_type, _uri=None, callback=None, subscription=None, _allow_exception=None,
+                           **kwargs):
+        """
+        Create and forward a generic WAMP request to the decoupler
 
-        forwarded_future = asyncio.Future()
-        concurrent_future = asyncio.run_coroutine_threadsafe(_async_request(forwarded_future), self._loop)
-        self._decoupler.set_caller_future(concurrent_future)
-        concurrent_future.result()
-        self._decoupler.set_caller_future(None)
+        :type request_type: WampRequestType
+        :type _uri: str | None
+        :type callback: (*Any) -> None | None
+        :type subscription: Subscription | None
+        :param _allow_exception: Overrides the allow_exception setting of the client for this request
+        :type _allow_exception: bool | None
+        :return: Future completed with the result from WampRequest, None if request failed.
+        :rtype: concurrent.futures.Future
+        """
+        if self._decoupler.is_stopped():
+            return _completed(None)
 
-        # If the decoupled client worker never set the future, it failed and/or died and we return None
-        if forwarded_future.done():
-            return forwarded_future.result()
+        async def _async_request():
+            future = asyncio.get_event_loop().create_future()
+            request = WampRequest(request_type, _uri, kwargs, callback, subscription, future, _allow_exception)
+            await self._decoupler.put_request(request)
+            return await future  # The client worker is responsible for completing the future
+
+        coroutine = _async_request()
+        try:
+            concurrent_future = self._runtime.run_coroutine(coroutine)
+        except RuntimeError:
+            # The runtime was closed since the liveness check
+            coroutine.close()
+            return _completed(None)
+
+        # If the decoupled client worker dies before completing the request, the caller future is set to None
+        self._decoupler.track_caller_future(concurrent_future)
+        return concurrent_future
 
     def __del__(self):
         self.disconnect()
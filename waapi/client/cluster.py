@@ -0,0 +1,135 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from waapi.client.client import WaapiClient, wait_all, _completed, _merge_args_to_kwargs
+from waapi.client.runtime import WaapiRuntime
+from waapi.wamp.interface import CannotConnectToWaapiException
+
+
+class WaapiCluster:
+    """
+    Client of many Wwise Authoring API servers, e.g. one instance of Wwise per branch on a build machine.
+
+    Calls are broadcast concurrently to all the servers, or to a subset of them, and the results are returned per URL:
+      with WaapiCluster(["ws://127.0.0.1:8080/waapi", "ws://127.0.0.1:8081/waapi"]) as cluster:
+          results = cluster.call("ak.wwise.core.soundbank.generate", {"soundbanks": [{"name": "Main"}]})
+          for url, result in results.items():
+              if isinstance(result, Exception):
+                  print(url, "failed:", result)
+
+    The connections of the cluster share a single WaapiRuntime. Servers that cannot be reached when the cluster is
+    created are reported in unreachable_urls, and calls to them result in a CannotConnectToWaapiException.
+
+    Import as:
+      from waapi import WaapiCluster
+    """
+    def __init__(self, urls, runtime=None, **client_options):
+        """
+        :param urls: URLs of the Wwise Authoring API WAMP servers
+        :type urls: collections.abc.Iterable[str]
+        :param runtime: Runtime hosting the connections, by default the cluster starts a runtime of its own and closes
+                        it when disconnecting
+        :type runtime: WaapiRuntime | None
+        :param client_options: Options passed to each WaapiClient, e.g. max_in_flight or reconnect
+        """
+        self._urls = list(dict.fromkeys(urls))
+        self._runtime = runtime or WaapiRuntime()
+        self._owns_runtime = runtime is None
+
+        self._clients = {}
+        """:type: dict[str, WaapiClient]"""
+        self.unreachable_urls = {}
+        """:type: dict[str, CannotConnectToWaapiException]"""
+
+        # Failures are always returned per URL, regardless of the allow_exception option
+        client_options["allow_exception"] = True
+
+        def connect(url):
+            try:
+                self._clients[url] = WaapiClient(url, runtime=self._runtime, **client_options)
+            except CannotConnectToWaapiException as e:
+                self.unreachable_urls[url] = e
+
+        # Connect concurrently, each connection waits for its session to join
+        if self._urls:
+            try:
+                with ThreadPoolExecutor(max_workers=len(self._urls)) as executor:
+                    list(executor.map(connect, self._urls))
+            except BaseException:
+                # The loop thread of the runtime would keep the interpreter alive
+                self.disconnect()
+                raise
+
+    def urls(self):
+        """
+        :return: URLs of the servers of the cluster, including the unreachable ones
+        :rtype: list[str]
+        """
+        return list(self._urls)
+
+    def client(self, url):
+        """
+        :type url: str
+        :return: Client connected to the server at the URL, None if it is unreachable or not part of the cluster
+        :rtype: WaapiClient | None
+        """
+        return self._clients.get(url)
+
+    def call(self, _uri, *args, _urls=None, **kwargs):
+        """
+        Do a Remote Procedure Call (RPC) on all the servers concurrently, or on a subset of them, and wait for all of
+        them to complete.
+        Arguments and options are accepted in the same forms as WaapiClient.call.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param _urls: URLs of the servers to call, all the servers of the cluster by default
+        :type _urls: collections.abc.Iterable[str] | None
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Result for each URL: the result of the call, a WaapiRequestFailed or CannotConnectToWaapiException on
+                 failure, None if the client disconnected before the call completed.
+        :rtype: dict[str, dict | Exception | None]
+        """
+        futures = self.call_async(_uri, *args, _urls=_urls, **kwargs)
+        return dict(zip(futures.keys(), wait_all(futures.values(), return_exceptions=True)))
+
+    def call_async(self, _uri, *args, _urls=None, **kwargs):
+        """
+        Non-blocking version of call: the requests are sent and futures are returned immediately.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param _urls: URLs of the servers to call, all the servers of the cluster by default
+        :type _urls: collections.abc.Iterable[str] | None
+        :return: Future for each URL, completed with the result of the call or its failure
+        :rtype: dict[str, concurrent.futures.Future]
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+
+        futures = {}
+        for url in (self._urls if _urls is None else _urls):
+            client = self._clients.get(url)
+            if client is not None:
+                futures[url] = client.call_async(_uri, **kwargs)
+            else:
+                futures[url] = _completed(self.unreachable_urls.get(url) or CannotConnectToWaapiException(
+                    url + " is not part of the cluster"))
+        return futures
+
+    def disconnect(self):
+        """
+        Gracefully disconnect from all the servers.
+
+        :return: True if all the connected clients were disconnected successfully, False otherwise.
+        :rtype: bool
+        """
+        success = all([client.disconnect() for client in self._clients.values()])
+        self._clients.clear()
+        if self._owns_runtime:
+            self._runtime.close()
+        return success
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
@@ -0,0 +1,217 @@
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+COLUMNS_AUTO = "auto"
+COLUMNS_NUMPY = "numpy"
+COLUMNS_ARRAY = "array"
+COLUMNS_BACKENDS = (COLUMNS_NUMPY, COLUMNS_ARRAY)
+
+
+def available_columns_backends():
+    """
+    :return: Names of the libraries that can hold columns, fastest first
+    :rtype: list[str]
+    """
+    return [name for name in COLUMNS_BACKENDS if name != COLUMNS_NUMPY or numpy is not None]
+
+
+def _append_fields(columns, obj, row, add_fields, prefix=u""):
+    """
+    Set the values of the fields of an object in a row of the columns, with the fields of nested objects named with
+    dotted paths, e.g. "parent.id"
+
+    :type columns: dict[str, list]
+    :type obj: dict
+    :type row: int
+    :param add_fields: True to add columns for the fields not in columns, False to ignore them
+    :type add_fields: bool
+    :raises: ValueError if a column was requested for a nested object
+    """
+    for name, value in obj.items():
+        if isinstance(value, dict):
+            if not add_fields and prefix + name in columns:
+                raise ValueError("The {0} field is an object, request its fields instead: {1}".format(
+                    prefix + name, ", ".join(_flattened_names(value, prefix + name + u"."))))
+            _append_fields(columns, value, row, add_fields, prefix + name + u".")
+            continue
+        column = columns.get(prefix + name)
+        if column is None:
+            if not add_fields:
+                continue
+            column = columns[prefix + name] = []
+        if len(column) < row:
+            column.extend([None] * (row - len(column)))
+        column.append(value)
+
+
+def _flattened_names(obj, prefix):
+    """
+    :return: Dotted paths of the fields of an object and of its nested objects
+    :rtype: list[str]
+    """
+    names = []
+    for name, value in obj.items():
+        if isinstance(value, dict):
+            names += _flattened_names(value, prefix + name + u".")
+        else:
+            names.append(prefix + name)
+    return names
+
+
+def _collect(objects, fields):
+    """
+    :return: Values of each field, None where an object has no value
+    :rtype: dict[str, list]
+    """
+    if isinstance(objects, dict):
+        objects = objects.get("return", [])
+
+    columns = {name: [] for name in fields} if fields is not None else {}
+    row = 0
+    for obj in objects:
+        _append_fields(columns, obj, row, fields is None)
+        row += 1
+
+    for column in columns.values():
+        column.extend([None] * (row - len(column)))
+    return columns
+
+
+_KINDS = {bool: "bool", int: "int", float: "float", str: "str"}
+
+
+def _kind_of(values):
+    """
+    :return: "bool", "int", "float", "str" or "object", and whether values are missing
+    :rtype: (str, bool)
+    """
+    types = set(map(type, values))
+    missing = type(None) in types
+    types.discard(type(None))
+    kinds = {_KINDS.get(value_type, "object") for value_type in types}
+
+    if kinds <= {"int", "float"} and kinds:
+        return ("int" if kinds == {"int"} else "float"), missing
+    if len(kinds) == 1:
+        return kinds.pop(), missing
+    return "object", missing
+
+
+def _to_column(values, backend):
+    """
+    :param values: Values of a field, None where missing
+    :type values: list
+    :return: Numeric values as an array, missing numbers being NaN unless all are integers, strings interned
+    :rtype: numpy.ndarray | array | list
+    """
+    kind, missing = _kind_of(values)
+    if kind == "int" and missing:
+        kind = "float"
+
+    if kind == "float":
+        if missing:
+            values = [float("nan") if value is None else value for value in values]
+        return numpy.array(values, dtype=numpy.float64) if backend == COLUMNS_NUMPY else array("d", values)
+    if kind == "int":
+        try:
+            return numpy.array(values, dtype=numpy.int64) if backend == COLUMNS_NUMPY else array("q", values)
+        except OverflowError:
+            kind = "object"
+    if kind == "bool" and not missing:
+        return numpy.array(values, dtype=numpy.bool_) if backend == COLUMNS_NUMPY else array("b", values)
+    if kind == "str":
+        # Values repeated across objects, such as types, share a single string
+        if missing:
+            values = [sys.intern(value) if value is not None else None for value in values]
+        else:
+            values = list(map(sys.intern, values))
+
+    if backend == COLUMNS_NUMPY:
+        column = numpy.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+    return values
+
+
+def to_columns(objects, fields=None, backend=COLUMNS_AUTO):
+    """
+    Convert objects returned by ak.wwise.core.object.get into columns, e.g. for vectorized analysis with numpy:
+      result = client.call("ak.wwise.core.object.get", query, options={"return": ["id", "Volume"]})
+      columns = to_columns(result)
+      quiet = columns["id"][columns["Volume"] < -24]
+
+    Numeric fields become float64 arrays, or int64 arrays if all their values are integers and present, with NaN where
+    an object has no value. Boolean fields become bool arrays if no value is missing. Strings, e.g. ids, names and
+    types, are interned so that repeated values are stored once, in object arrays with numpy and lists otherwise.
+    Fields of nested objects are named with dotted paths, e.g. "parent.id".
+
+    :param objects: Objects, or the result of ak.wwise.core.object.get. Any iterable is consumed once, e.g. the
+                    generator of WaapiClient.iter_objects.
+    :type objects: collections.abc.Iterable[dict] | dict
+    :param fields: Fields to convert, by default all the fields of the objects in the order they appear
+    :type fields: collections.abc.Iterable[str] | None
+    :param backend: COLUMNS_NUMPY for numpy arrays, COLUMNS_ARRAY for arrays of the standard library, or COLUMNS_AUTO
+                    for numpy if it is installed
+    :type backend: str
+    :return: Column of each field
+    :rtype: dict[str, numpy.ndarray | array | list]
+    :raises: ValueError if the backend is unknown or not installed, or if a field is a nested object
+    """
+    if backend == COLUMNS_AUTO:
+        backend = available_columns_backends()[0]
+    elif backend not in COLUMNS_BACKENDS:
+        raise ValueError("Unknown columns backend: {}, expected one of {}".format(
+            backend, ", ".join((COLUMNS_AUTO,) + COLUMNS_BACKENDS)))
+    elif backend not in available_columns_backends():
+        raise ValueError("The {} columns backend is not installed".format(backend))
+
+    fields = list(fields) if fields is not None else None
+    return {name: _to_column(values, backend) for name, values in _collect(objects, fields).items()}
+
+
+def to_record_batch(objects, fields=None):
+    """
+    Convert objects returned by ak.wwise.core.object.get into an Arrow record batch, with the columns of to_columns.
+    Missing values are nulls. Requires pyarrow.
+
+    :param objects: Objects, or the result of ak.wwise.core.object.get
+    :type objects: collections.abc.Iterable[dict] | dict
+    :param fields: Fields to convert, by default all the fields of the objects in the order they appear
+    :type fields: collections.abc.Iterable[str] | None
+    :rtype: pyarrow.RecordBatch
+    :raises: ValueError if pyarrow is not installed, or if a field is a nested object
+    """
+    if pyarrow is None:
+        raise ValueError("pyarrow is not installed")
+
+    fields = list(fields) if fields is not None else None
+    columns = _collect(objects, fields)
+    arrays = []
+    for values in columns.values():
+        kind, _ = _kind_of(values)
+        if kind == "str":
+            column = pyarrow.array(values, pyarrow.string())
+            if len(set(values)) * 2 <= len(values):
+                # Repeated strings, such as types, are stored once
+                column = column.dictionary_encode()
+        elif kind == "object":
+            try:
+                column = pyarrow.array(values)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # Values of mixed types
+                column = pyarrow.array([repr(value) if value is not None else None for value in values])
+        else:
+            column = pyarrow.array(values)
+        arrays.append(column)
+    return pyarrow.RecordBatch.from_arrays(arrays, names=list(columns))
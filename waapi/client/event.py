@@ -1,5 +1,12 @@
+import logging
+from collections import OrderedDict
+from threading import Condition, RLock, Thread
+from time import monotonic
+
 from autobahn.wamp.request import Subscription
 
+from waapi.wamp.dispatch import DispatchMode
+
 
 class EventHandler:
     """
@@ -13,7 +20,14 @@ class EventHandler:
     members will be updated to match the client and their reference must remain unchanged to properly handle ownership.
 
     An instance of this class is also callable and can therefore be use as if it were a function reference.
+
+    The dispatch_mode attribute selects how the events are delivered to on_event with a WaapiClient: None uses the
+    setting of the client, DispatchMode.ORDERED delivers them one at a time in order and DispatchMode.INLINE calls
+    on_event directly on the thread of the connection, in which case it must be quick and never do blocking requests.
     """
+    dispatch_mode = None
+    """:type: DispatchMode | None"""
+
     def __init__(self, unsubscribe_handler=None, callback=None):
         """
         :param unsubscribe_handler: UnsubscribeHandler | None
@@ -40,6 +54,8 @@ class EventHandler:
 
     def unsubscribe(self):
         """
+        Note: with an AsyncWaapiClient, the returned value is a coroutine that must be awaited.
+
         :return: True if the EventHandler was unsubscribed successfully, False otherwise.
         :rtype: bool
         """
@@ -51,9 +67,11 @@ class EventHandler:
     def on_event(self, *args, **kwargs):
         """
         Callback on reception of an event related to the subscribed topic
+
+        :return: Result of the bound callback, which an AsyncWaapiClient awaits if it is a coroutine
         """
         if self._callback:
-            self._callback(*args, **kwargs)
+            return self._callback(*args, **kwargs)
 
     def bind(self, callback):
         """
@@ -73,4 +91,143 @@ class EventHandler:
         """
         Delegate to on_event
         """
-        self.on_event(*args, **kwargs)
+        return self.on_event(*args, **kwargs)
+
+
+class BatchEventHandler(EventHandler):
+    """
+    EventHandler that collects events and calls its callback once with the list of collected events
+
+    A batch starts with the first event received and is delivered when its window elapses, or as soon as it holds
+    max_count events. Events are passed to the callback as the dictionaries of the named arguments of the event, e.g.:
+      def on_objects_created(events):
+          for event in events:
+              print(event["object"])
+
+    With a key function, only the latest event of each key is kept in a batch, ordered by the time of their last
+    update. For instance, to only get the latest value of each property of each object:
+      BatchEventHandler(
+          callback=on_property_changes,
+          window=0.05,
+          key=lambda event: (event["object"]["id"], event["property"])
+      )
+
+    Batches are delivered one at a time, in order, from a thread owned by the handler. Like on_event for the
+    EventHandler, the on_batch method can be overridden in a subclass.
+    """
+    logger = logging.getLogger("BatchEventHandler")
+
+    IDLE_TIMEOUT = 5  # seconds without events before the delivery thread exits
+
+    def __init__(self, unsubscribe_handler=None, callback=None, window=0.05, max_count=None, key=None):
+        """
+        :param unsubscribe_handler: UnsubscribeHandler | None
+        :param callback: (list[dict]) -> None | None
+        :param window: Maximum number of seconds between the reception of the first event of a batch and its delivery
+        :type window: float
+        :param max_count: Number of events in a batch that triggers its delivery, None for no maximum
+        :type max_count: int | None
+        :param key: Function returning the key of an event, None to keep every event
+        :type key: (dict) -> Hashable | None
+        """
+        super(BatchEventHandler, self).__init__(unsubscribe_handler, callback)
+        self._window = window
+        self._max_count = max_count
+        self._key = key
+
+        self._condition = Condition()
+        # Reentrant, for on_batch to flush or unsubscribe
+        self._delivery_lock = RLock()
+        self._pending = OrderedDict()
+        """:type: OrderedDict[Hashable, dict]"""
+        self._event_count = 0
+        self._deadline = None
+        self._delivery_thread = None
+        """:type: Thread | None"""
+
+    @staticmethod
+    def by_object_id(event):
+        """
+        Key function keeping the latest event of each object
+        """
+        return event.get("object", {}).get("id")
+
+    def on_event(self, *args, **kwargs):
+        """
+        Add an event related to the subscribed topic to the current batch
+        """
+        with self._condition:
+            # Without a key, every event is unique
+            key = self._key(kwargs) if self._key else self._event_count
+            self._event_count += 1
+            self._pending.pop(key, None)
+            self._pending[key] = kwargs
+
+            if self._deadline is None:
+                self._deadline = monotonic() + self._window
+            if self._delivery_thread is None:
+                self._delivery_thread = Thread(target=self._run_delivery, daemon=True)
+                self._delivery_thread.start()
+            self._condition.notify()
+
+    def on_batch(self, events):
+        """
+        Callback on delivery of a batch of events related to the subscribed topic
+
+        :param events: Named arguments of the events, in the order they were received
+        :type events: list[dict]
+        """
+        if self._callback:
+            self._callback(events)
+
+    def flush(self):
+        """
+        Deliver the events received so far immediately, from the calling thread, in batches of at most max_count
+        """
+        while self._deliver_batch():
+            pass
+
+    def _deliver_batch(self):
+        """
+        :return: True if a batch was delivered, False if there were no events to deliver
+        :rtype: bool
+        """
+        with self._delivery_lock:
+            with self._condition:
+                count = min(len(self._pending), self._max_count or len(self._pending))
+                events = [self._pending.popitem(last=False)[1] for _ in range(count)]
+                if not self._pending:
+                    self._deadline = None
+
+            if events:
+                self.on_batch(events)
+            return bool(events)
+
+    def unsubscribe(self):
+        """
+        Unsubscribe, then deliver the events already received.
+
+        :return: True if the EventHandler was unsubscribed successfully, False otherwise.
+        :rtype: bool
+        """
+        success = super(BatchEventHandler, self).unsubscribe()
+        self.flush()
+        return success
+
+    def _batch_is_due(self):
+        return monotonic() >= self._deadline or (self._max_count and len(self._pending) >= self._max_count)
+
+    def _run_delivery(self):
+        while True:
+            with self._condition:
+                while not (self._pending and self._batch_is_due()):
+                    if self._pending:
+                        self._condition.wait(max(0, self._deadline - monotonic()))
+                    elif not self._condition.wait(self.IDLE_TIMEOUT) and not self._pending:
+                        self._delivery_thread = None
+                        return
+
+            try:
+                self._deliver_batch()
+            except Exception:
+                self.logger.exception("Exception in batch callback %r", self._callback)
@@ -0,0 +1,235 @@
+import http.client
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from urllib.parse import urlsplit
+
+from autobahn.wamp import ApplicationError
+
+from waapi.client.client import _completed, _merge_args_to_kwargs
+from waapi.wamp.interface import WaapiRequestFailed, READ_ONLY_URIS
+from waapi.wamp.serializer import JSON_STDLIB, json_backend
+
+
+class WaapiHttpClient:
+    """
+    Wwise Authoring API client doing Remote Procedure Calls over HTTP, for scripts that only need to call.
+
+    Unlike WaapiClient, there is no WebSocket handshake, WAMP session or event loop thread to start: the first call
+    opens a connection and connections are kept alive to be reused by the next calls. Up to max_connections calls are
+    done concurrently, each on a connection of its own. Subscriptions are not supported over HTTP.
+
+    Calls accept arguments and options in the same forms as WaapiClient.call:
+      with WaapiHttpClient() as client:
+          info = client.call("ak.wwise.core.getInfo")
+
+    Import as:
+      from waapi import WaapiHttpClient
+    """
+    DEFAULT_URL = "http://127.0.0.1:8090/waapi"
+    DEFAULT_MAX_CONNECTIONS = 8
+    HTTP_ERROR = u"ak.wwise.http_error"
+
+    def __init__(self, url=None, allow_exception=False, max_connections=DEFAULT_MAX_CONNECTIONS, timeout=None,
+                 serializer=None):
+        """
+        :param url: URL of the Wwise Authoring API HTTP server, defaults to http://127.0.0.1:8090/waapi
+        :type url: str
+        :param allow_exception: True to raise WaapiRequestFailed when a call fails, False to return None.
+        :type allow_exception: bool
+        :param max_connections: Maximum number of connections kept to the server, which bounds the number of calls done
+                                concurrently
+        :type max_connections: int
+        :param timeout: Timeout in seconds of the socket operations, None to wait indefinitely
+        :type timeout: float | None
+        :param serializer: JSON library used to encode and decode calls, see WaapiClient. Defaults to the standard
+                           library.
+        :type serializer: str | None
+        :raises: ValueError if the URL scheme is not supported, or the serializer is unknown or not installed
+        """
+        parts = urlsplit(url or self.DEFAULT_URL)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError("Unsupported URL scheme for WaapiHttpClient: " + parts.scheme)
+
+        self._connection_type = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path or "/waapi"
+        self._timeout = timeout
+        self._allow_exception = allow_exception
+        _, self._dumps, self._loads = json_backend(serializer or JSON_STDLIB)
+
+        max_connections = max(1, max_connections)
+        self._connection_slots = BoundedSemaphore(max_connections)
+        self._idle_connections = []
+        """:type: list[http.client.HTTPConnection]"""
+        self._lock = Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="WaapiHttpClient")
+
+        self.logger = logging.getLogger("WaapiHttpClient")
+
+    def _acquire_connection(self):
+        """
+        :return: An idle connection to reuse, or a new connection, and whether it is reused
+        :rtype: (http.client.HTTPConnection, bool)
+        """
+        with self._lock:
+            if self._idle_connections:
+                return self._idle_connections.pop(), True
+        return self._connection_type(self._host, self._port, timeout=self._timeout), False
+
+    def _release_connection(self, connection):
+        """
+        Keep a connection alive to be reused, unless the client was disconnected.
+
+        :type connection: http.client.HTTPConnection
+        """
+        with self._lock:
+            if not self._closed:
+                self._idle_connections.append(connection)
+                return
+        connection.close()
+
+    def _post(self, body, retry):
+        """
+        Post a request on a connection of the pool. A request that fails on a reused connection, e.g. one the server
+        closed while idle, is sent again on another connection if retry is True. The server may have processed the
+        request before the connection was lost, so only read-only requests may be sent again.
+
+        :type body: bytes
+        :param retry: True to send the request again if a reused connection fails
+        :type retry: bool
+        :return: Status and body of the response
+        :rtype: (int, bytes)
+        """
+        headers = {"Content-Type": "application/json"}
+        while True:
+            connection, reused = self._acquire_connection()
+            try:
+                connection.request("POST", self._path, body, headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if reused and retry:
+                    continue
+                raise
+            except Exception:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release_connection(connection)
+            return response.status, data
+
+    def _do_call(self, _uri, kwargs):
+        """
+        :return: Result from the remote procedure call, None if failed.
+        :rtype: dict | None
+        :raises: WaapiRequestFailed
+        """
+        options = kwargs.pop("options", None) or {}
+        body = self._dumps({"uri": _uri, "args": kwargs, "options": options})
+
+        with self._connection_slots:
+            try:
+                status, data = self._post(body, _uri in READ_ONLY_URIS)
+            except (OSError, http.client.HTTPException) as e:
+                # The connection was closed, e.g. lost or sent an invalid response
+                return self._fail(ApplicationError(self.HTTP_ERROR, message=repr(e)))
+
+        try:
+            result = self._loads(data) if data else {}
+        except ValueError:
+            result = {"message": data.decode("utf-8", "replace")}
+
+        if status == 200:
+            return result
+
+        if not isinstance(result, dict):
+            result = {"message": result}
+        return self._fail(ApplicationError(result.pop("uri", self.HTTP_ERROR), **result))
+
+    def _fail(self, error):
+        """
+        Log a failed call
+
+        :type error: ApplicationError
+        :return: None
+        :raises: WaapiRequestFailed if exceptions are allowed
+        """
+        self.logger.error("WaapiHttpClient (ERROR): " + str(error))
+        if self._allow_exception:
+            raise WaapiRequestFailed(error)
+        return None
+
+    def call(self, _uri, *args, **kwargs):
+        """
+        Do a Remote Procedure Call (RPC) to the Waapi server over HTTP.
+        Arguments and options are accepted in the same forms as WaapiClient.call.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Result from the remote procedure call, None if failed.
+        :rtype: dict | None
+        :raises: WaapiRequestFailed
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        if self.is_closed():
+            return None
+        return self._do_call(_uri, kwargs)
+
+    def call_async(self, _uri, *args, **kwargs):
+        """
+        Non-blocking version of call: the request is done on a thread of the client and a future is returned
+        immediately.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Future completed with the result from the remote procedure call, None if failed.
+                 When exceptions are allowed, the future is completed with WaapiRequestFailed on failure.
+        :rtype: concurrent.futures.Future
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+        try:
+            return self._executor.submit(self._do_call, _uri, kwargs)
+        except RuntimeError:
+            # Disconnected
+            return _completed(None)
+
+    def is_closed(self):
+        """
+        :rtype: bool
+        """
+        with self._lock:
+            return self._closed
+
+    def disconnect(self):
+        """
+        Wait for the calls in progress and close the connections to the server.
+
+        :return: True if the client was disconnected, False if it was already disconnected.
+        :rtype: bool
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            self._closed = True
+
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for connection in connections:
+            connection.close()
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
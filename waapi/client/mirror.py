@@ -0,0 +1,610 @@
+from copy import copy
+from functools import partial
+from threading import Lock
+
+from waapi.client.client import _completed, _then
+from waapi.client.event import EventHandler
+from waapi.client.snapshot import MirrorSnapshot
+from waapi.wamp.dispatch import DispatchMode
+from waapi.wamp.interface import CannotConnectToWaapiException
+
+
+class ProjectMirror:
+    """
+    In-memory copy of the hierarchy of a Wwise project, answering lookups by id, path, type and name without a round
+    trip to Wwise, e.g.:
+      with WaapiClient() as client, ProjectMirror(client) as mirror:
+          sounds = mirror.get_by_type("Sound")
+          children = mirror.get_children(mirror.get_by_path("\\\\Actor-Mixer Hierarchy")["id"])
+
+    The hierarchy under the roots is loaded once with ak.wwise.core.object.get, then kept current from the events
+    notifying objects created, deleted, renamed and moved. Objects are returned in the form of the results of
+    ak.wwise.core.object.get with the fields id, name, type, path and parent. Returned objects are copies.
+
+    Events are missed while the client is disconnected: with reconnect=True, call reload from on_reconnect.
+
+    With a snapshot, the mirror starts from the hierarchy saved when it was last closed, and only loads the work units
+    that changed since. See MirrorSnapshot.
+
+    Import as:
+      from waapi import ProjectMirror
+    """
+    DEFAULT_ROOTS = (u"\\",)
+
+    FIELDS = (u"id", u"name", u"type", u"path", u"parent")
+    """Fields of the mirrored objects"""
+
+    TOPICS = (
+        u"ak.wwise.core.object.created",
+        u"ak.wwise.core.object.preDeleted",
+        u"ak.wwise.core.object.nameChanged",
+        u"ak.wwise.core.object.childAdded",
+        u"ak.wwise.core.object.childRemoved",
+    )
+    """Topics notifying changes to the hierarchy"""
+
+    WORK_UNIT_FIELDS = FIELDS + (u"filePath", u"workunit:isDirty")
+    """Fields of the work units, to make their change tokens"""
+
+    def __init__(self, client, roots=DEFAULT_ROOTS, snapshot=None):
+        """
+        :param client: Client connected to the server
+        :type client: WaapiClient
+        :param roots: Paths of the objects mirrored with their descendants, the whole project by default
+        :type roots: collections.abc.Iterable[str]
+        :param snapshot: Snapshot to start from, saved when the mirror is closed. True for a MirrorSnapshot in the
+                         default directory.
+        :type snapshot: MirrorSnapshot | bool | None
+        :raises: CannotConnectToWaapiException if the subscriptions or the loading of the hierarchy failed
+        """
+        self._client = client
+        self.roots = tuple(roots)
+        self._snapshot = MirrorSnapshot() if snapshot is True else snapshot or None
+        self._project_path = None
+        self.load_report = None
+        """
+        Report of the last load: whether it started from a "snapshot", the number of work units "fetched" from Wwise
+        out of the "work_units", and the number of "objects" mirrored.
+        :type: dict | None
+        """
+
+        self._lock = Lock()
+        self._clear()
+        self._pending_events = None
+        """:type: list[(str, dict)] | None"""
+        self.event_count = 0
+
+        self._handlers = []
+        """:type: list[EventHandler]"""
+        for topic in self.TOPICS:
+            handler = client.subscribe(topic, _MirrorEventHandler(callback=partial(self._on_event, topic)),
+                                       {"return": list(self.FIELDS)})
+            if handler is None:
+                self.close()
+                raise CannotConnectToWaapiException("Could not subscribe to " + topic)
+            self._handlers.append(handler)
+
+        if not (self._snapshot is not None and self._load(self._fetch_from_snapshot)) and not self.reload():
+            self.close()
+            raise CannotConnectToWaapiException("Could not load the hierarchy of the project")
+
+    def reload(self):
+        """
+        Load the hierarchy again, e.g. after events were missed while disconnected.
+
+        :return: True if the hierarchy was loaded
+        :rtype: bool
+        """
+        return self._load(self._fetch_all)
+
+    def _clear(self):
+        """
+        Start from an empty hierarchy
+        """
+        self._objects = {}
+        """:type: dict[str, dict]"""
+        self._by_path = {}
+        """:type: dict[str, str]"""
+        self._by_type = {}
+        """:type: dict[str, dict[str, None]]"""
+        self._by_name = {}
+        """:type: dict[str, dict[str, None]]"""
+        self._children = {}
+        """:type: dict[str, dict[str, None]]"""
+
+    def _load(self, fetch):
+        """
+        Replace the hierarchy with the objects fetched
+
+        :param fetch: Function returning the objects and the report of the load, None if it failed
+        :type fetch: () -> (list[dict], dict) | None
+        :return: True if the hierarchy was loaded
+        :rtype: bool
+        """
+        with self._lock:
+            # Events received while loading are applied once loaded: they may or may not be part of the results,
+            # and applying an event twice has no effect
+            self._pending_events = []
+
+        try:
+            fetched = fetch()
+        except Exception:
+            fetched = None
+
+        loaded = None
+        if fetched is not None:
+            # Built without the lock, which events take on the thread of the connection, shared with other clients
+            loaded = copy(self)
+            loaded._clear()
+            loaded._add_all(fetched[0])
+
+        with self._lock:
+            pending_events, self._pending_events = self._pending_events, None
+            if loaded is None:
+                return False
+
+            report = fetched[1]
+            self._objects, self._by_path, self._by_type, self._by_name, self._children = (
+                loaded._objects, loaded._by_path, loaded._by_type, loaded._by_name, loaded._children)
+            for topic, kwargs in pending_events:
+                self._apply_event(topic, kwargs)
+            self.load_report = dict(report, objects=len(self._objects))
+            return True
+
+    def _get_objects(self, args, fields=FIELDS):
+        """
+        :return: Future completed with the objects returned by ak.wwise.core.object.get, None if failed
+        :rtype: concurrent.futures.Future
+        """
+        return _then(
+            self._client.call_async("ak.wwise.core.object.get", args, options={"return": list(fields)}),
+            lambda result: result["return"] if result is not None else None
+        )
+
+    def _fetch_all(self):
+        """
+        :return: Objects under the roots, None if failed
+        :rtype: (list[dict], dict) | None
+        """
+        roots_future = self._get_objects({"from": {"path": list(self.roots)}})
+        descendants_future = self._get_objects(
+            {"from": {"path": list(self.roots)}, "transform": [{"select": ["descendants"]}]})
+        roots, descendants = roots_future.result(), descendants_future.result()
+        if roots is None or descendants is None:
+            return None
+
+        work_unit_count = sum(1 for obj in descendants if obj.get("type") == u"WorkUnit")
+        return roots + descendants, {"snapshot": False, "fetched": work_unit_count, "work_units": work_unit_count}
+
+    @staticmethod
+    def _is_under(path, ancestor_path):
+        """
+        :return: True if the path is the ancestor path or below it
+        :rtype: bool
+        """
+        return path == ancestor_path or path.startswith(ancestor_path.rstrip("\\") + "\\")
+
+    def _is_under_roots(self, path):
+        """
+        :type path: str
+        :rtype: bool
+        """
+        return any(self._is_under(path, root) for root in self.roots)
+
+    def _encloses_root(self, path):
+        """
+        :type path: str
+        :return: True if a root is below the object at this path
+        :rtype: bool
+        """
+        return any(root != path and self._is_under(root, path) for root in self.roots)
+
+    def _get_project_path(self):
+        """
+        :return: Path of the project file, None if failed
+        :rtype: str | None
+        """
+        if self._project_path is None:
+            project = self._get_objects({"from": {"path": [u"\\"]}}, fields=(u"filePath",)).result()
+            if project:
+                self._project_path = project[0].get("filePath")
+        return self._project_path
+
+    def _get_work_units(self):
+        """
+        :return: Work units under the roots or containing a root, with the fields of WORK_UNIT_FIELDS, None if failed
+        :rtype: list[dict] | None
+        """
+        work_units = self._get_objects({"from": {"ofType": [u"WorkUnit"]}}, fields=self.WORK_UNIT_FIELDS).result()
+        if work_units is None:
+            return None
+        return [
+            work_unit for work_unit in work_units
+            if self._is_under_roots(work_unit.get("path", "")) or self._encloses_root(work_unit.get("path", ""))
+        ]
+
+    def _fetch_from_snapshot(self):
+        """
+        :return: Objects of the snapshot, with the objects of the work units changed since replaced by the objects
+                 fetched from Wwise, None if there is no snapshot or if failed
+        :rtype: (list[dict], dict) | None
+        """
+        project_path = self._get_project_path()
+        snapshot = self._snapshot.read(project_path, self.roots) if project_path else None
+        if snapshot is None:
+            return None
+        objects, tokens = snapshot
+
+        roots_future = self._get_objects({"from": {"path": list(self.roots)}})
+        work_units = self._get_work_units()
+        roots = roots_future.result()
+        if roots is None or work_units is None:
+            return None
+
+        changed = [
+            work_unit for work_unit in work_units
+            if tokens.get(work_unit["id"]) is None or tokens[work_unit["id"]] != MirrorSnapshot.make_token(work_unit)
+        ]
+        changed_ids = [work_unit["id"] for work_unit in changed]
+        current_ids = {work_unit["id"] for work_unit in work_units}
+        # Objects of the changed or deleted work units are replaced by the objects fetched
+        outdated_ids = set(changed_ids) | (set(tokens) - current_ids)
+
+        # Objects outside work units, e.g. physical folders, are the ancestors of the work units
+        ancestors_future = _completed([])
+        if current_ids:
+            ancestors_future = self._get_objects(
+                {"from": {"id": list(current_ids)}, "transform": [{"select": ["ancestors"]}]})
+        # Work units containing a root are only fetched below the roots
+        changed_roots = [
+            root for root in self.roots
+            if any(root != work_unit["path"] and self._is_under(root, work_unit["path"]) for work_unit in changed)
+        ]
+        changed_ids = [work_unit["id"] for work_unit in changed if self._is_under_roots(work_unit["path"])]
+        fetched_futures = []
+        if changed_ids:
+            fetched_futures.append(self._get_objects(
+                {"from": {"id": changed_ids}, "transform": [{"select": ["descendants"]}]}))
+        if changed_roots:
+            fetched_futures.append(self._get_objects(
+                {"from": {"path": changed_roots}, "transform": [{"select": ["descendants"]}]}))
+        fetched = [future.result() for future in fetched_futures]
+        ancestors = ancestors_future.result()
+        if None in fetched or ancestors is None:
+            return None
+        fetched = [obj for objects_fetched in fetched for obj in objects_fetched]
+
+        kept = [
+            obj for obj in objects
+            if obj["workunit"] is not None and obj["workunit"]["id"] not in outdated_ids
+        ]
+        report = {"snapshot": True, "fetched": len(changed), "work_units": len(work_units)}
+        return kept + roots + ancestors + work_units + fetched, report
+
+    def save_snapshot(self):
+        """
+        Save the hierarchy with the change tokens of its work units, to start from it next time.
+        Called when the mirror is closed.
+
+        :return: True if the snapshot was saved
+        :rtype: bool
+        """
+        if self._snapshot is None or not self._get_project_path():
+            return False
+
+        for _ in range(3):
+            with self._lock:
+                event_count = self.event_count
+            work_units = self._get_work_units()
+            if work_units is None:
+                return False
+            with self._lock:
+                if self.event_count != event_count:
+                    # The tokens may not match the hierarchy
+                    continue
+                objects = self._ordered_objects(work_units)
+            break
+        else:
+            return False
+
+        tokens = {}
+        for work_unit in work_units:
+            token = MirrorSnapshot.make_token(work_unit)
+            if token is not None:
+                tokens[work_unit["id"]] = token
+        try:
+            self._snapshot.write(self._project_path, self.roots, objects, tokens)
+        except OSError:
+            return False
+        return True
+
+    def _ordered_objects(self, work_units):
+        """
+        :param work_units: Work units under the roots or containing a root
+        :type work_units: list[dict]
+        :return: Objects with their work unit, parents before their children. Paths are only set on the roots.
+        :rtype: list[dict]
+        """
+        objects = []
+        stack = [
+            (record, self._work_unit_containing(record["path"], work_units))
+            for record in self._objects.values() if record["parent"] not in self._objects
+        ]
+        while stack:
+            record, work_unit_id = stack.pop()
+            if record["type"] == u"WorkUnit":
+                work_unit_id = record["id"]
+            objects.append({
+                "id": record["id"],
+                "name": record["name"],
+                "type": record["type"],
+                "path": record["path"] if record["parent"] not in self._objects else None,
+                "parent": record["parent"],
+                "workunit": work_unit_id,
+            })
+            stack.extend((self._objects[child_id], work_unit_id) for child_id in self._children.get(record["id"], ()))
+        return objects
+
+    def _work_unit_containing(self, path, work_units):
+        """
+        :param path: Path of a root
+        :type path: str
+        :type work_units: list[dict]
+        :return: Id of the innermost work unit containing the root, None if it is in no work unit
+        :rtype: str | None
+        """
+        containing = None
+        for work_unit in work_units:
+            if path != work_unit["path"] and self._is_under(path, work_unit["path"]):
+                if containing is None or len(work_unit["path"]) > len(containing["path"]):
+                    containing = work_unit
+        return containing["id"] if containing is not None else None
+
+    def _add_all(self, objects):
+        """
+        Add objects, parents before their children
+        """
+        ids = set()
+        children = {}
+        for obj in objects:
+            ids.add(obj["id"])
+            children.setdefault((obj.get("parent") or {}).get("id"), []).append(obj)
+
+        stack = [obj for parent_id, siblings in children.items() if parent_id not in ids for obj in siblings]
+        while stack:
+            obj = stack.pop()
+            self._add(obj)
+            stack.extend(children.pop(obj["id"], ()))
+
+    def _on_event(self, topic, *args, **kwargs):
+        with self._lock:
+            self.event_count += 1
+            if self._pending_events is not None:
+                self._pending_events.append((topic, kwargs))
+            else:
+                self._apply_event(topic, kwargs)
+
+    def _apply_event(self, topic, kwargs):
+        if topic == u"ak.wwise.core.object.created":
+            self._add(kwargs["object"])
+        elif topic == u"ak.wwise.core.object.preDeleted":
+            self._remove(kwargs["object"]["id"])
+        elif topic == u"ak.wwise.core.object.nameChanged":
+            self._rename(kwargs["object"]["id"], kwargs["newName"])
+        elif topic == u"ak.wwise.core.object.childAdded":
+            self._move(kwargs["child"], kwargs["parent"]["id"])
+        elif topic == u"ak.wwise.core.object.childRemoved":
+            self._detach(kwargs["child"]["id"], kwargs["parent"]["id"])
+
+    @staticmethod
+    def _index(index, key, object_id):
+        index.setdefault(key, {})[object_id] = None
+
+    @staticmethod
+    def _unindex(index, key, object_id):
+        ids = index.get(key)
+        if ids is not None:
+            ids.pop(object_id, None)
+            if not ids:
+                del index[key]
+
+    def _add(self, obj):
+        """
+        Add or update an object, unless it is outside the roots
+
+        :param obj: Object with the fields of FIELDS, as returned by ak.wwise.core.object.get
+        :type obj: dict
+        """
+        object_id = obj["id"]
+        parent_id = (obj.get("parent") or {}).get("id")
+        if object_id in self._objects:
+            self._move(obj, parent_id)
+            self._rename(object_id, obj.get("name", self._objects[object_id]["name"]))
+            return
+
+        parent = self._objects.get(parent_id)
+        path = obj.get("path")
+        if parent is not None:
+            path = parent["path"].rstrip("\\") + "\\" + obj["name"]
+        elif path not in self.roots:
+            return
+
+        record = {"id": object_id, "name": obj["name"], "type": obj.get("type"), "path": path, "parent": parent_id}
+        self._objects[object_id] = record
+        self._by_path[path] = object_id
+        self._index(self._by_type, record["type"], object_id)
+        self._index(self._by_name, record["name"], object_id)
+        if parent_id is not None:
+            self._index(self._children, parent_id, object_id)
+
+    def _remove(self, object_id):
+        """
+        Remove an object and its descendants
+        """
+        if object_id not in self._objects:
+            return
+        self._detach(object_id, self._objects[object_id]["parent"])
+
+        stack = [object_id]
+        while stack:
+            record = self._objects.pop(stack.pop())
+            if self._by_path.get(record["path"]) == record["id"]:
+                del self._by_path[record["path"]]
+            self._unindex(self._by_type, record["type"], record["id"])
+            self._unindex(self._by_name, record["name"], record["id"])
+            stack.extend(self._children.pop(record["id"], ()))
+
+    def _rename(self, object_id, name):
+        record = self._objects.get(object_id)
+        if record is None or record["name"] == name:
+            return
+        self._unindex(self._by_name, record["name"], object_id)
+        record["name"] = name
+        self._index(self._by_name, name, object_id)
+        self._update_paths(object_id)
+
+    def _move(self, obj, parent_id):
+        """
+        Add an object to a parent, removing it from the mirror if the parent is outside the roots
+        """
+        record = self._objects.get(obj["id"])
+        if record is None:
+            self._add(dict(obj, parent={"id": parent_id}))
+            return
+        if record["parent"] == parent_id or parent_id is None:
+            return
+
+        if parent_id not in self._objects:
+            self._remove(record["id"])
+            return
+        self._detach(record["id"], record["parent"])
+        record["parent"] = parent_id
+        self._index(self._children, parent_id, record["id"])
+        self._update_paths(record["id"])
+
+    def _detach(self, object_id, parent_id):
+        record = self._objects.get(object_id)
+        if record is not None and record["parent"] == parent_id:
+            self._unindex(self._children, parent_id, object_id)
+
+    def _update_paths(self, object_id):
+        """
+        Update the paths of an object and its descendants after it was renamed or moved
+        """
+        stack = [object_id]
+        while stack:
+            record = self._objects[stack.pop()]
+            parent = self._objects.get(record["parent"])
+            if parent is None:
+                # A root
+                path = record["path"].rsplit("\\", 1)[0] + "\\" + record["name"]
+            else:
+                path = parent["path"].rstrip("\\") + "\\" + record["name"]
+            if self._by_path.get(record["path"]) == record["id"]:
+                del self._by_path[record["path"]]
+            record["path"] = path
+            self._by_path[path] = record["id"]
+            stack.extend(self._children.get(record["id"], ()))
+
+    @staticmethod
+    def _export(record):
+        """
+        :return: Copy of a record in the form of a result of ak.wwise.core.object.get
+        :rtype: dict
+        """
+        obj = dict(record)
+        obj["parent"] = {"id": record["parent"]} if record["parent"] is not None else None
+        return obj
+
+    def get(self, object_id):
+        """
+        :type object_id: str
+        :return: Object with this id, None if it is not mirrored
+        :rtype: dict | None
+        """
+        with self._lock:
+            record = self._objects.get(object_id)
+            return self._export(record) if record is not None else None
+
+    def get_by_path(self, path):
+        """
+        :type path: str
+        :return: Object at this path, None if it is not mirrored
+        :rtype: dict | None
+        """
+        with self._lock:
+            object_id = self._by_path.get(path)
+            return self._export(self._objects[object_id]) if object_id is not None else None
+
+    def get_by_type(self, object_type):
+        """
+        :type object_type: str
+        :return: Objects of this type
+        :rtype: list[dict]
+        """
+        with self._lock:
+            return [self._export(self._objects[object_id]) for object_id in self._by_type.get(object_type, ())]
+
+    def get_by_name(self, name):
+        """
+        :type name: str
+        :return: Objects with this name
+        :rtype: list[dict]
+        """
+        with self._lock:
+            return [self._export(self._objects[object_id]) for object_id in self._by_name.get(name, ())]
+
+    def get_children(self, object_id):
+        """
+        :type object_id: str
+        :return: Children of the object
+        :rtype: list[dict]
+        """
+        with self._lock:
+            return [self._export(self._objects[child_id]) for child_id in self._children.get(object_id, ())]
+
+    def get_descendants(self, object_id):
+        """
+        :type object_id: str
+        :return: Descendants of the object, depth first
+        :rtype: list[dict]
+        """
+        with self._lock:
+            descendants = []
+            stack = list(reversed(self._children.get(object_id, ())))
+            while stack:
+                record = self._objects[stack.pop()]
+                descendants.append(self._export(record))
+                stack.extend(reversed(self._children.get(record["id"], ())))
+            return descendants
+
+    def __len__(self):
+        with self._lock:
+            return len(self._objects)
+
+    def __contains__(self, object_id):
+        with self._lock:
+            return object_id in self._objects
+
+    def close(self):
+        """
+        Save the snapshot, if any, and unsubscribe from the events: the mirror is no longer updated
+        """
+        if self._handlers and self.load_report is not None:
+            self.save_snapshot()
+        handlers, self._handlers = self._handlers, []
+        for handler in handlers:
+            handler.unsubscribe()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class _MirrorEventHandler(EventHandler):
+    """
+    Apply events to a mirror as soon as they are received, before the responses received after them are processed
+    """
+    dispatch_mode = DispatchMode.INLINE
@@ -0,0 +1,188 @@
+from threading import Lock
+
+from waapi.client.client import WaapiClient, _merge_args_to_kwargs
+from waapi.client.runtime import WaapiRuntime
+from waapi.client.stream import EventStream
+from waapi.wamp.interface import CannotConnectToWaapiException
+
+
+class WaapiClientPool:
+    """
+    Pool of sessions to the same Wwise Authoring API server, for applications doing many concurrent calls.
+
+    The server processes the requests of a session one after the other: a large result being serialized delays the
+    other calls of the session. Each call of the pool is routed to the session with the fewest outstanding calls, so
+    that concurrent callers do not wait behind each other. Subscriptions are all made on the first session of the pool,
+    so that their events are received in order. The sessions of the pool share a single WaapiRuntime.
+
+    Offers the same methods as WaapiClient to call and subscribe:
+      with WaapiClientPool(size=4) as pool:
+          results = [pool.call_async("ak.wwise.core.object.get", query) for query in queries]
+
+    Import as:
+      from waapi import WaapiClientPool
+    """
+    DEFAULT_SIZE = 4
+
+    def __init__(self, url=None, size=DEFAULT_SIZE, runtime=None, **client_options):
+        """
+        :param url: URL of the Wwise Authoring API WAMP server, defaults to ws://127.0.0.1:8080/waapi
+        :type url: str
+        :param size: Number of sessions of the pool
+        :type size: int
+        :param runtime: Runtime hosting the sessions, by default the pool starts a runtime of its own and closes it when
+                        disconnecting
+        :type runtime: WaapiRuntime | None
+        :param client_options: Options passed to each WaapiClient, e.g. allow_exception or max_in_flight
+        :raises: CannotConnectToWaapiException
+        """
+        self._runtime = runtime or WaapiRuntime()
+        self._owns_runtime = runtime is None
+
+        self._clients = []
+        """:type: list[WaapiClient]"""
+        try:
+            for _ in range(max(1, size)):
+                self._clients.append(WaapiClient(url, runtime=self._runtime, **client_options))
+        except CannotConnectToWaapiException:
+            self.disconnect()
+            raise
+
+        self._outstanding = [0] * len(self._clients)
+        self._lock = Lock()
+
+    def size(self):
+        """
+        :return: Number of sessions of the pool
+        :rtype: int
+        """
+        return len(self._clients)
+
+    def outstanding(self):
+        """
+        :return: Number of calls waiting on a response, for each session of the pool
+        :rtype: list[int]
+        """
+        with self._lock:
+            return list(self._outstanding)
+
+    def _acquire_client(self):
+        """
+        Select the session with the fewest outstanding calls, the first one on ties.
+        The call must be released with _release_client once completed.
+
+        :return: Index of the session
+        :rtype: int
+        """
+        with self._lock:
+            index = min(range(len(self._outstanding)), key=self._outstanding.__getitem__)
+            self._outstanding[index] += 1
+            return index
+
+    def _release_client(self, index):
+        with self._lock:
+            self._outstanding[index] -= 1
+
+    def is_connected(self):
+        """
+        :return: True if all the sessions of the pool are connected, False otherwise.
+        :rtype: bool
+        """
+        return all(client.is_connected() for client in self._clients)
+
+    def disconnect(self):
+        """
+        Gracefully disconnect all the sessions of the pool.
+
+        :return: True if all the sessions were disconnected successfully, False otherwise.
+        :rtype: bool
+        """
+        success = all([client.disconnect() for client in self._clients])
+        if self._owns_runtime:
+            self._runtime.close()
+        return success
+
+    def call(self, _uri, *args, **kwargs):
+        """
+        Do a Remote Procedure Call (RPC) on the least loaded session.
+        Arguments and options are accepted in the same forms as WaapiClient.call.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Result from the remote procedure call, None if failed.
+        :rtype: dict | None
+        :raises: WaapiRequestFailed
+        """
+        return self.call_async(_uri, *args, **kwargs).result()
+
+    def call_async(self, _uri, *args, **kwargs):
+        """
+        Non-blocking version of call: the request is sent on the least loaded session and a future is returned
+        immediately.
+
+        :param _uri: URI of the remote procedure to be called
+        :type _uri: str
+        :param kwargs: Keyword arguments to be passed, options may be passed using the key "options"
+        :return: Future completed with the result from the remote procedure call, None if failed.
+        :rtype: concurrent.futures.Future
+        """
+        kwargs = _merge_args_to_kwargs(args, kwargs)
+
+        index = self._acquire_client()
+        try:
+            future = self._clients[index].call_async(_uri, **kwargs)
+        except Exception:
+            self._release_client(index)
+            raise
+        future.add_done_callback(lambda _: self._release_client(index))
+        return future
+
+    def subscribe(self, _uri, callback_or_handler=None, *args, **kwargs):
+        """
+        Subscribe to a topic on the first session of the pool, see WaapiClient.subscribe.
+
+        :rtype: EventHandler | None
+        :raises: WaapiRequestFailed
+        """
+        return self._clients[0].subscribe(_uri, callback_or_handler, *args, **kwargs)
+
+    def subscribe_async(self, _uri, callback_or_handler=None, *args, **kwargs):
+        """
+        Subscribe to a topic on the first session of the pool, see WaapiClient.subscribe_async.
+
+        :rtype: concurrent.futures.Future
+        """
+        return self._clients[0].subscribe_async(_uri, callback_or_handler, *args, **kwargs)
+
+    def subscribe_stream(self, _uri, *args, maxsize=EventStream.DEFAULT_MAXSIZE, overflow=EventStream.BLOCK,
+                         timeout=None, **kwargs):
+        """
+        Subscribe to a topic on the first session of the pool, see WaapiClient.subscribe_stream.
+
+        :rtype: EventStream | None
+        :raises: WaapiRequestFailed
+        """
+        return self._clients[0].subscribe_stream(
+            _uri, *args, maxsize=maxsize, overflow=overflow, timeout=timeout, **kwargs)
+
+    def unsubscribe(self, event_handler):
+        """
+        :type event_handler: EventHandler
+        :return: True if successfully unsubscribed, False otherwise.
+        :rtype: bool
+        """
+        return self._clients[0].unsubscribe(event_handler)
+
+    def subscriptions(self):
+        """
+        :return: A copy of the set of subscriptions belonging to the pool.
+        :rtype: set[EventHandler]
+        """
+        return self._clients[0].subscriptions()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
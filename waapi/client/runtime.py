@@ -0,0 +1,98 @@
+from sys import platform
+from threading import Lock, Thread
+
+from waapi.wamp.async_compatibility import asyncio, asyncio_current_task, asyncio_all_tasks
+
+
+class WaapiRuntime:
+    """
+    Thread running the asyncio event loop on which the connections of WaapiClient instances live.
+
+    By default, each WaapiClient starts a runtime of its own. A runtime can be shared by many clients, e.g. to talk to
+    many instances of Wwise, with a single thread and event loop:
+      with WaapiRuntime() as runtime:
+          clients = [WaapiClient(url, runtime=runtime) for url in urls]
+
+    The event loop of the runtime is private to its thread: the event loop of the caller is never used nor replaced.
+    Closing the runtime disconnects the clients still attached to it.
+
+    Import as:
+      from waapi import WaapiRuntime
+    """
+    def __init__(self):
+        if platform == 'win32':
+            #  Prefer the ProactorEventLoop event loop on Windows
+            self._loop = asyncio.ProactorEventLoop()
+        else:
+            self._loop = asyncio.new_event_loop()
+
+        self._lock = Lock()
+        self._closed = False
+        self._thread = Thread(target=self._run, name="WaapiRuntime")
+        self._thread.start()
+
+    @property
+    def loop(self):
+        """
+        :rtype: asyncio.AbstractEventLoop
+        """
+        return self._loop
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+
+        # Run the loop ourselves to skip the sigterm signal handler since
+        # it is not supported from a different thread
+        self._loop.run_forever()
+        self._loop.close()
+
+    def is_closed(self):
+        """
+        :rtype: bool
+        """
+        with self._lock:
+            return self._closed
+
+    def run_coroutine(self, coroutine):
+        """
+        Schedule a coroutine on the event loop of the runtime. Thread-safe.
+
+        :return: Future completed with the result of the coroutine
+        :rtype: concurrent.futures.Future
+        :raises: RuntimeError if the runtime is closed
+        """
+        with self._lock:
+            if self._closed:
+                coroutine.close()
+                raise RuntimeError("The WaapiRuntime is closed")
+            return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    async def _cancel_tasks(self):
+        current_task = asyncio_current_task()
+        tasks = [task for task in asyncio_all_tasks(self._loop) if task is not current_task]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def close(self):
+        """
+        Stop the event loop and its thread, after cancelling the connections of the clients still attached.
+        Clients should be disconnected beforehand to leave their sessions gracefully.
+        Cannot be called from the thread of the runtime.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            cancelled = asyncio.run_coroutine_threadsafe(self._cancel_tasks(), self._loop)
+            self._closed = True
+
+        cancelled.result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from threading import Lock
+
+from waapi.wamp.interface import CannotConnectToWaapiException
+
+
+def _default_directory(name):
+    """
+    :param name: Name of the subdirectory, e.g. "schemas"
+    :type name: str
+    :return: Directory of the user for cached data
+    :rtype: str
+    """
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        return os.path.join(os.environ["LOCALAPPDATA"], "waapi-client", name)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "waapi-client", name)
+
+
+class SchemaCache:
+    """
+    Persistent cache of the results of ak.wwise.waapi.getSchema, getFunctions and getTopics, which only change with the
+    version of Wwise, e.g.:
+      with WaapiClient() as client, SchemaCache(client) as schemas:
+          args_schema = schemas.get_schema("ak.wwise.core.object.get")["argsSchema"]
+
+    The cache is versioned with the Wwise build returned by ak.wwise.core.getInfo: each build has files of its own, and
+    results are only requested from the server the first time they are needed with a build. Results are appended to a
+    data file, memory-mapped and read lazily through an index file, so that only the schemas used are decoded.
+
+    Many processes may share the cache directory. Concurrent writes may lose entries of the index, in which case the
+    results are requested again.
+
+    Import as:
+      from waapi import SchemaCache
+    """
+    def __init__(self, client, directory=None):
+        """
+        :param client: Client connected to the server, e.g. WaapiClient or WaapiHttpClient
+        :param directory: Directory of the cache files, by default in the cache directory of the user
+        :type directory: str | None
+        :raises: CannotConnectToWaapiException if the version of Wwise cannot be queried
+        """
+        self._client = client
+        self._directory = directory or _default_directory("schemas")
+
+        info = client.call("ak.wwise.core.getInfo")
+        if not info:
+            raise CannotConnectToWaapiException("Could not query the version of Wwise")
+        self.build_key = self.make_build_key(info)
+
+        self._data_path = os.path.join(self._directory, self.build_key + ".data")
+        self._index_path = os.path.join(self._directory, self.build_key + ".index")
+
+        self._lock = Lock()
+        self._index = self._read_index()
+        """:type: dict[str, list[int]]"""
+        self._data_file = None
+        self._data_map = None
+        """:type: mmap.mmap | None"""
+        self.fetch_count = 0
+
+    @staticmethod
+    def make_build_key(info):
+        """
+        :param info: Result of ak.wwise.core.getInfo
+        :type info: dict
+        :return: Name identifying the build of Wwise and the version of the API, usable as a file name
+        :rtype: str
+        """
+        version = info.get("version", {})
+        identity = json.dumps({"apiVersion": info.get("apiVersion"), "version": version}, sort_keys=True)
+        return "{}.{}.{}-{}".format(
+            version.get("major", 0),
+            version.get("minor", 0),
+            version.get("build", 0),
+            hashlib.sha1(identity.encode("utf-8")).hexdigest()[:12]
+        )
+
+    def _read_index(self):
+        """
+        :return: Offset and length in the data file of each cached result
+        :rtype: dict[str, list[int]]
+        """
+        try:
+            with open(self._index_path, "rb") as index_file:
+                return json.loads(index_file.read().decode("utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, key, entry):
+        """
+        Add an entry to the index file, merged with the entries added by other processes
+        """
+        index = self._read_index()
+        index[key] = entry
+        descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as index_file:
+                index_file.write(json.dumps(index, separators=(",", ":")).encode("utf-8"))
+            os.replace(temporary_path, self._index_path)
+        except OSError:
+            os.remove(temporary_path)
+            raise
+        self._index = index
+
+    def _read_data(self, offset, length):
+        """
+        :return: Bytes of a result in the data file, None if the data file is shorter than expected
+        :rtype: bytes | None
+        """
+        if self._data_map is None or offset + length > len(self._data_map):
+            # The data file grew since it was mapped
+            self._close_data()
+            try:
+                self._data_file = open(self._data_path, "rb")
+                size = os.fstat(self._data_file.fileno()).st_size
+                if size == 0:
+                    return None
+                self._data_map = mmap.mmap(self._data_file.fileno(), size, access=mmap.ACCESS_READ)
+            except OSError:
+                self._close_data()
+                return None
+
+        if offset + length > len(self._data_map):
+            return None
+        return self._data_map[offset:offset + length]
+
+    def _append_data(self, data):
+        """
+        :type data: bytes
+        :return: Offset of the data in the data file
+        :rtype: int
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        with open(self._data_path, "ab") as data_file:
+            # Appended in a single write, after the data appended by other processes
+            data_file.write(data)
+            data_file.flush()
+            return data_file.tell() - len(data)
+
+    def _close_data(self):
+        if self._data_map is not None:
+            self._data_map.close()
+            self._data_map = None
+        if self._data_file is not None:
+            self._data_file.close()
+            self._data_file = None
+
+    def _get(self, key, _uri, *args):
+        """
+        :param key: Key of the result in the cache
+        :type key: str
+        :return: Result from the cache, or from the server and then cached, None if the call failed.
+        :rtype: dict | None
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                # Another process may have cached it
+                self._index = self._read_index()
+                entry = self._index.get(key)
+            if entry is not None:
+                data = self._read_data(*entry)
+                if data is not None:
+                    try:
+                        return json.loads(data.decode("utf-8"))
+                    except ValueError:
+                        pass
+
+        result = self._client.call(_uri, *args)
+        if result is None:
+            return None
+
+        data = json.dumps(result, separators=(",", ":")).encode("utf-8")
+        with self._lock:
+            self.fetch_count += 1
+            try:
+                self._write_index(key, [self._append_data(data), len(data)])
+            except OSError:
+                # The cache is best effort
+                pass
+        return result
+
+    def get_schema(self, uri):
+        """
+        :param uri: URI of a function or topic
+        :type uri: str
+        :return: Result of ak.wwise.waapi.getSchema for the URI, None if the call failed.
+        :rtype: dict | None
+        """
+        return self._get("ak.wwise.waapi.getSchema:" + uri, "ak.wwise.waapi.getSchema", {"uri": uri})
+
+    def get_functions(self):
+        """
+        :return: Result of ak.wwise.waapi.getFunctions, None if the call failed.
+        :rtype: dict | None
+        """
+        return self._get("ak.wwise.waapi.getFunctions", "ak.wwise.waapi.getFunctions")
+
+    def get_topics(self):
+        """
+        :return: Result of ak.wwise.waapi.getTopics, None if the call failed.
+        :rtype: dict | None
+        """
+        return self._get("ak.wwise.waapi.getTopics", "ak.wwise.waapi.getTopics")
+
+    def close(self):
+        """
+        Release the memory map of the data file
+        """
+        with self._lock:
+            self._close_data()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
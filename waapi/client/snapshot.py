@@ -0,0 +1,179 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from waapi.client.schema import _default_directory
+
+
+class MirrorSnapshot:
+    """
+    Snapshots of ProjectMirror on disk, so that a mirror starts from the hierarchy it had when it was last closed and
+    only loads the work units changed since, e.g.:
+      with WaapiClient() as client, ProjectMirror(client, snapshot=MirrorSnapshot()) as mirror:
+          print(mirror.load_report)
+
+    There is a snapshot per project and set of roots. Each work unit is saved with a change token made of the
+    modification time and size of its file, which is only valid if the work unit had no unsaved changes. Work units
+    whose token differs, or cannot be made, e.g. when Wwise runs on another computer, are loaded from Wwise.
+
+    Snapshots are compact binary files: a header, the metadata as JSON, the strings of the objects, each stored once,
+    and a table of records made of the indexes of their strings. Files are memory-mapped to be read.
+
+    Import as:
+      from waapi import MirrorSnapshot
+    """
+    MAGIC = b"WAAPIMIR"
+    VERSION = 1
+
+    _HEADER = struct.Struct("<8sIIII")  # Magic, version, metadata size, strings size, record count
+    _RECORD_FIELDS = ("id", "name", "type", "path", "parent", "workunit")
+    _NONE = -1
+
+    def __init__(self, directory=None):
+        """
+        :param directory: Directory of the snapshot files, by default in the cache directory of the user
+        :type directory: str | None
+        """
+        self.directory = directory or _default_directory("mirrors")
+
+    def path_of(self, project_path, roots):
+        """
+        :param project_path: Path of the project file
+        :type project_path: str
+        :param roots: Paths of the mirrored objects
+        :type roots: collections.abc.Iterable[str]
+        :return: Path of the snapshot file
+        :rtype: str
+        """
+        identity = json.dumps({"project": project_path, "roots": list(roots)})
+        return os.path.join(self.directory, hashlib.sha1(identity.encode("utf-8")).hexdigest()[:16] + ".mirror")
+
+    @staticmethod
+    def make_token(work_unit):
+        """
+        :param work_unit: Work unit with the fields filePath and workunit:isDirty
+        :type work_unit: dict
+        :return: Change token of the work unit, None if its file may not match the project
+        :rtype: list | None
+        """
+        if work_unit.get("workunit:isDirty") is not False or not work_unit.get("filePath"):
+            return None
+        try:
+            stat = os.stat(work_unit["filePath"])
+        except OSError:
+            return None
+        return [work_unit["filePath"], stat.st_mtime_ns, stat.st_size]
+
+    def write(self, project_path, roots, objects, tokens):
+        """
+        :param project_path: Path of the project file
+        :type project_path: str
+        :param roots: Paths of the mirrored objects
+        :type roots: collections.abc.Iterable[str]
+        :param objects: Objects with the fields id, name, type, path, parent and workunit, parents before children. The
+                        path is only needed for objects whose parent is not in the snapshot.
+        :type objects: collections.abc.Iterable[dict]
+        :param tokens: Change token of each work unit by id
+        :type tokens: dict[str, list]
+        :raises: OSError
+        """
+        strings = {}
+        records = array("i")
+        for obj in objects:
+            for field in self._RECORD_FIELDS:
+                value = obj.get(field)
+                if isinstance(value, dict):
+                    value = value.get("id")
+                if value is None:
+                    records.append(self._NONE)
+                else:
+                    records.append(strings.setdefault(value, len(strings)))
+        if sys.byteorder == "big":
+            records.byteswap()
+
+        roots = list(roots)
+        metadata = json.dumps({"project": project_path, "roots": roots, "tokens": tokens}).encode("utf-8")
+        # Names cannot contain NUL characters, the strings are decoded at once and split
+        strings_data = u"\0".join(strings).encode("utf-8")
+        record_count = len(records) // len(self._RECORD_FIELDS)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_of(project_path, roots)
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as snapshot_file:
+                snapshot_file.write(self._HEADER.pack(
+                    self.MAGIC, self.VERSION, len(metadata), len(strings_data), record_count))
+                snapshot_file.write(metadata)
+                snapshot_file.write(strings_data)
+                snapshot_file.write(records.tobytes())
+            os.replace(temporary_path, path)
+        except OSError:
+            os.remove(temporary_path)
+            raise
+
+    def read(self, project_path, roots):
+        """
+        :param project_path: Path of the project file
+        :type project_path: str
+        :param roots: Paths of the mirrored objects
+        :type roots: collections.abc.Iterable[str]
+        :return: Objects in the order they were written, and the change token of each work unit by id. None if there is
+                 no valid snapshot of the project and roots.
+        :rtype: (list[dict], dict[str, list]) | None
+        """
+        roots = list(roots)
+        try:
+            with open(self.path_of(project_path, roots), "rb") as snapshot_file:
+                if os.fstat(snapshot_file.fileno()).st_size < self._HEADER.size:
+                    return None
+                with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._decode(data, project_path, roots)
+        except (OSError, ValueError, IndexError, struct.error):
+            return None
+
+    def _decode(self, data, project_path, roots):
+        """
+        :type data: mmap.mmap
+        :rtype: (list[dict], dict[str, list]) | None
+        :raises: ValueError, IndexError, struct.error if the file is truncated or corrupted
+        """
+        magic, version, metadata_size, strings_size, record_count = self._HEADER.unpack_from(data, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            return None
+
+        offset = self._HEADER.size
+        metadata = json.loads(data[offset:offset + metadata_size].decode("utf-8"))
+        if metadata.get("project") != project_path or metadata.get("roots") != roots:
+            return None
+        offset += metadata_size
+
+        strings = data[offset:offset + strings_size].decode("utf-8").split(u"\0")
+        offset += strings_size
+
+        records = array("i")
+        records_size = record_count * len(self._RECORD_FIELDS) * records.itemsize
+        if offset + records_size != len(data):
+            raise ValueError("Truncated snapshot")
+        records.frombytes(data[offset:offset + records_size])
+        if sys.byteorder == "big":
+            records.byteswap()
+
+        none = self._NONE
+        objects = []
+        fields = iter(records.tolist())
+        for object_id, name, object_type, path, parent, work_unit in zip(*[fields] * len(self._RECORD_FIELDS)):
+            objects.append({
+                "id": strings[object_id],
+                "name": strings[name],
+                "type": strings[object_type] if object_type != none else None,
+                "path": strings[path] if path != none else None,
+                "parent": {"id": strings[parent]} if parent != none else None,
+                "workunit": {"id": strings[work_unit]} if work_unit != none else None,
+            })
+        return objects, metadata["tokens"]
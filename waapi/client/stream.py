@@ -0,0 +1,280 @@
+import inspect
+from collections import deque
+from threading import Condition
+from time import monotonic
+
+from waapi.client.event import EventHandler
+from waapi.wamp.async_compatibility import asyncio
+from waapi.wamp.dispatch import DispatchMode
+
+
+class EventStream(EventHandler):
+    """
+    Subscription consumed by iterating over its events, in the order they were received:
+      for event in client.subscribe_stream("ak.wwise.core.object.created", maxsize=10000):
+          print(event["object"])
+
+    Each event is the dictionary of keyword arguments that a callback would have received. Iteration ends once the
+    stream is closed, which happens when it is unsubscribed or the client disconnects, and all the buffered events
+    were consumed. The stream can also be used in a with statement to unsubscribe when leaving the block.
+
+    The overflow policy decides what happens to an event received while the buffer already holds maxsize events:
+      - BLOCK: wait for room, no event is dropped. The connection keeps being serviced, so waiting events are held in
+               memory by the client in the meantime.
+      - DROP_OLDEST: drop the oldest buffered event to make room for the new one.
+      - DROP_NEWEST: drop the new event.
+    With a drop policy the events are buffered directly from the connection thread, without going through the
+    event workers of the client. The number of events dropped so far is available as the dropped attribute.
+    """
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+    OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST)
+
+    DEFAULT_MAXSIZE = 10000
+
+    def __init__(self, unsubscribe_handler=None, maxsize=DEFAULT_MAXSIZE, overflow=BLOCK, timeout=None):
+        """
+        :param unsubscribe_handler: Handler used to unsubscribe, typically the client instance
+        :type unsubscribe_handler: UnsubscribeHandler
+        :param maxsize: Maximum number of buffered events, 0 or less for no limit
+        :type maxsize: int
+        :param overflow: What to do with an event when the buffer is full: BLOCK, DROP_OLDEST or DROP_NEWEST
+        :type overflow: str
+        :param timeout: Default number of seconds to wait for an event when iterating, None to wait indefinitely
+        :type timeout: float | None
+        """
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy: " + repr(overflow))
+
+        super(EventStream, self).__init__(unsubscribe_handler)
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.timeout = timeout
+        self.dropped = 0
+        self.dispatch_mode = DispatchMode.ORDERED if overflow == self.BLOCK else DispatchMode.INLINE
+
+        self._events = deque()
+        """:type: deque[dict]"""
+        self._condition = Condition()
+        self._closed = False
+
+    def _is_full(self):
+        return 0 < self.maxsize <= len(self._events)
+
+    def on_event(self, *args, **kwargs):
+        with self._condition:
+            if self._closed:
+                return
+
+            if self._is_full():
+                if self.overflow == self.DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                elif self.overflow == self.DROP_OLDEST:
+                    self._events.popleft()
+                    self.dropped += 1
+                else:
+                    while self._is_full() and not self._closed:
+                        self._condition.wait()
+                    if self._closed:
+                        return
+
+            self._events.append(kwargs)
+            self._condition.notify_all()
+
+    def get(self, timeout=None):
+        """
+        Remove and return the next event, waiting until one is received.
+
+        :param timeout: Number of seconds to wait, None to wait indefinitely
+        :type timeout: float | None
+        :return: The keyword arguments of the next event, None if the stream is closed and no event is left.
+        :rtype: dict | None
+        :raises: TimeoutError
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            while not self._events:
+                if self._closed:
+                    return None
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No event received within " + str(timeout) + " seconds")
+                self._condition.wait(remaining)
+
+            event = self._events.popleft()
+            self._condition.notify_all()
+            return event
+
+    def qsize(self):
+        """
+        :return: Number of events buffered and not consumed yet
+        :rtype: int
+        """
+        with self._condition:
+            return len(self._events)
+
+    def is_closed(self):
+        """
+        :rtype: bool
+        """
+        with self._condition:
+            return self._closed
+
+    def close(self):
+        """
+        Stop buffering events: iteration ends once the events already buffered are consumed.
+        Does not unsubscribe, see unsubscribe.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def unsubscribe(self):
+        success = super(EventStream, self).unsubscribe()
+        self.close()
+        return success
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        event = self.get(self.timeout)
+        if event is None:
+            raise StopIteration
+        return event
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.unsubscribe()
+
+
+class AsyncEventStream(EventHandler):
+    """
+    Subscription of an AsyncWaapiClient consumed with an async for statement:
+      stream = await client.subscribe_stream("ak.wwise.core.object.created", maxsize=10000)
+      async for event in stream:
+          print(event["object"])
+
+    Behaves like EventStream, on the event loop: events are buffered as they are received, and the BLOCK policy holds
+    the events that do not fit in the buffer until the consumer makes room for them.
+    The stream can also be used in an async with statement to unsubscribe when leaving the block.
+    """
+    BLOCK = EventStream.BLOCK
+    DROP_OLDEST = EventStream.DROP_OLDEST
+    DROP_NEWEST = EventStream.DROP_NEWEST
+
+    DEFAULT_MAXSIZE = EventStream.DEFAULT_MAXSIZE
+
+    def __init__(self, unsubscribe_handler=None, maxsize=DEFAULT_MAXSIZE, overflow=BLOCK, timeout=None):
+        """
+        :param unsubscribe_handler: Handler used to unsubscribe, typically the client instance
+        :type unsubscribe_handler: UnsubscribeHandler
+        :param maxsize: Maximum number of buffered events, 0 or less for no limit
+        :type maxsize: int
+        :param overflow: What to do with an event when the buffer is full: BLOCK, DROP_OLDEST or DROP_NEWEST
+        :type overflow: str
+        :param timeout: Default number of seconds to wait for an event when iterating, None to wait indefinitely
+        :type timeout: float | None
+        """
+        if overflow not in EventStream.OVERFLOW_POLICIES:
+            raise ValueError("Unknown overflow policy: " + repr(overflow))
+
+        super(AsyncEventStream, self).__init__(unsubscribe_handler)
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.timeout = timeout
+        self.dropped = 0
+
+        self._events = deque()
+        """:type: deque[dict]"""
+        self._waiting = deque()  # Events held by the BLOCK policy, in order
+        """:type: deque[dict]"""
+        self._available = asyncio.Event()
+        self._closed = False
+
+    def on_event(self, *args, **kwargs):
+        if self._closed:
+            return
+
+        if self._waiting or 0 < self.maxsize <= len(self._events):
+            if self.overflow == self.DROP_NEWEST:
+                self.dropped += 1
+                return
+            elif self.overflow == self.DROP_OLDEST:
+                self._events.popleft()
+                self.dropped += 1
+            else:
+                self._waiting.append(kwargs)
+                return
+
+        self._events.append(kwargs)
+        self._available.set()
+
+    async def get(self, timeout=None):
+        """
+        Remove and return the next event, waiting until one is received.
+
+        :param timeout: Number of seconds to wait, None to wait indefinitely
+        :type timeout: float | None
+        :return: The keyword arguments of the next event, None if the stream is closed and no event is left.
+        :rtype: dict | None
+        :raises: asyncio.TimeoutError
+        """
+        while not self._events:
+            if self._closed:
+                return None
+            self._available.clear()
+            await asyncio.wait_for(self._available.wait(), timeout)
+
+        event = self._events.popleft()
+        if self._waiting:
+            self._events.append(self._waiting.popleft())
+        return event
+
+    def qsize(self):
+        """
+        :return: Number of events buffered and not consumed yet, including the events held by the BLOCK policy
+        :rtype: int
+        """
+        return len(self._events) + len(self._waiting)
+
+    def is_closed(self):
+        """
+        :rtype: bool
+        """
+        return self._closed
+
+    def close(self):
+        """
+        Stop buffering events: iteration ends once the events already buffered are consumed.
+        Does not unsubscribe, see unsubscribe.
+        """
+        self._closed = True
+        self._available.set()
+
+    async def unsubscribe(self):
+        success = super(AsyncEventStream, self).unsubscribe()
+        if inspect.isawaitable(success):
+            success = await success
+        self.close()
+        return success
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        event = await self.get(self.timeout)
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.unsubscribe()
@@ -0,0 +1,460 @@
+import concurrent.futures
+import re
+from threading import Lock
+
+from autobahn.wamp import ApplicationError
+
+from waapi.wamp.interface import WaapiRequestFailed
+
+
+def _accept(value, path):
+    return None
+
+
+def _is_integer(value):
+    return (isinstance(value, int) and not isinstance(value, bool)) or (isinstance(value, float) and value.is_integer())
+
+
+_TYPE_CHECKS = {
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_integer,
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "null": lambda value: value is None,
+}
+
+
+def _json_equal(value, other):
+    """
+    :return: True if two JSON values are equal: booleans are not numbers, and integers equal floats of the same value
+    :rtype: bool
+    """
+    if _TYPE_CHECKS["number"](value) and _TYPE_CHECKS["number"](other):
+        return value == other
+    if isinstance(value, (list, tuple)) and isinstance(other, (list, tuple)):
+        return len(value) == len(other) and all(map(_json_equal, value, other))
+    if isinstance(value, dict) and isinstance(other, dict):
+        return value.keys() == other.keys() and all(_json_equal(item, other[key]) for key, item in value.items())
+    return type(value) is type(other) and value == other
+
+
+class _SchemaCompiler:
+    """
+    Compile a JSON schema into nested closures, each checking a keyword.
+    Keywords that are not supported are ignored: a payload is only rejected if it is certainly invalid.
+    """
+    def __init__(self, root):
+        self._root = root
+        self._references = {}
+        """:type: dict[str, list]"""
+
+    def compile(self, schema):
+        """
+        :type schema: dict | bool
+        :return: Function returning a description of the first error of a value at a path, None if it is valid
+        :rtype: (Any, str) -> str | None
+        """
+        if schema is False:
+            return lambda value, path: path + ": no value is allowed"
+        if not isinstance(schema, dict):
+            return _accept
+
+        checks = []
+        if "$ref" in schema:
+            checks.append(self._compile_reference(schema["$ref"]))
+        if "type" in schema:
+            checks.append(self._compile_type(schema["type"]))
+        if "enum" in schema:
+            checks.append(self._compile_enum(schema["enum"]))
+        if "const" in schema:
+            checks.append(self._compile_enum([schema["const"]]))
+
+        checks += self._compile_object(schema)
+        checks += self._compile_array(schema)
+        checks += self._compile_number(schema)
+        checks += self._compile_string(schema)
+        checks += self._compile_combinations(schema)
+
+        if not checks:
+            return _accept
+        if len(checks) == 1:
+            return checks[0]
+
+        def check_all(value, path):
+            for check in checks:
+                error = check(value, path)
+                if error is not None:
+                    return error
+        return check_all
+
+    def _compile_reference(self, reference):
+        if not reference.startswith("#"):
+            # Remote references are not supported
+            return _accept
+
+        compiled = self._references.get(reference)
+        if compiled is None:
+            # Placeholder filled once compiled, for recursive references
+            compiled = self._references[reference] = [_accept]
+            target = self._root
+            for token in reference[1:].split("/")[1:]:
+                token = token.replace("~1", "/").replace("~0", "~")
+                target = target.get(token) if isinstance(target, dict) else None
+            compiled[0] = self.compile(target)
+
+        return lambda value, path: compiled[0](value, path)
+
+    @staticmethod
+    def _compile_type(types):
+        types = [types] if isinstance(types, str) else list(types)
+        type_checks = [_TYPE_CHECKS[name] for name in types if name in _TYPE_CHECKS]
+        if len(type_checks) != len(types):
+            return _accept
+        description = " or ".join(types)
+
+        def check_type(value, path):
+            for type_check in type_checks:
+                if type_check(value):
+                    return None
+            return "{}: expected {}".format(path, description)
+        return check_type
+
+    @staticmethod
+    def _compile_enum(values):
+        def check_enum(value, path):
+            for allowed in values:
+                if _json_equal(value, allowed):
+                    return None
+            return "{}: expected one of {}".format(path, values)
+        return check_enum
+
+    def _compile_object(self, schema):
+        checks = []
+        properties = {name: self.compile(subschema) for name, subschema in schema.get("properties", {}).items()}
+        patterns = [(re.compile(pattern), self.compile(subschema))
+                    for pattern, subschema in schema.get("patternProperties", {}).items()]
+        additional = schema.get("additionalProperties", True)
+        additional_check = None if additional is True else self.compile(additional)
+        required = schema.get("required", [])
+
+        if required and isinstance(required, list):
+            def check_required(value, path):
+                if isinstance(value, dict):
+                    for name in required:
+                        if name not in value:
+                            return "{}: missing required property {}".format(path, name)
+            checks.append(check_required)
+
+        if properties or patterns or additional_check is not None:
+            def check_properties(value, path):
+                if not isinstance(value, dict):
+                    return None
+                for name, item in value.items():
+                    item_path = path + "." + str(name)
+                    matched = False
+                    check = properties.get(name)
+                    if check is not None:
+                        matched = True
+                        error = check(item, item_path)
+                        if error is not None:
+                            return error
+                    for pattern, pattern_check in patterns:
+                        if pattern.search(name):
+                            matched = True
+                            error = pattern_check(item, item_path)
+                            if error is not None:
+                                return error
+                    if not matched and additional_check is not None:
+                        if additional is False:
+                            return "{}: unexpected property {}".format(path, name)
+                        error = additional_check(item, item_path)
+                        if error is not None:
+                            return error
+            checks.append(check_properties)
+
+        minimum, maximum = schema.get("minProperties"), schema.get("maxProperties")
+        if minimum is not None or maximum is not None:
+            checks.append(self._compile_size(dict, minimum, maximum, "properties"))
+        return checks
+
+    def _compile_array(self, schema):
+        checks = []
+        items = schema.get("items")
+        if isinstance(items, dict) or items is False:
+            item_check = self.compile(items)
+
+            def check_items(value, path):
+                if isinstance(value, (list, tuple)):
+                    for index, item in enumerate(value):
+                        error = item_check(item, "{}[{}]".format(path, index))
+                        if error is not None:
+                            return error
+            checks.append(check_items)
+        elif isinstance(items, list):
+            item_checks = [self.compile(item) for item in items]
+
+            def check_tuple(value, path):
+                if isinstance(value, (list, tuple)):
+                    for index, (item, item_check) in enumerate(zip(value, item_checks)):
+                        error = item_check(item, "{}[{}]".format(path, index))
+                        if error is not None:
+                            return error
+            checks.append(check_tuple)
+
+        minimum, maximum = schema.get("minItems"), schema.get("maxItems")
+        if minimum is not None or maximum is not None:
+            checks.append(self._compile_size((list, tuple), minimum, maximum, "items"))
+
+        if schema.get("uniqueItems") is True:
+            def check_unique(value, path):
+                if isinstance(value, (list, tuple)):
+                    for index, item in enumerate(value):
+                        if any(_json_equal(item, previous) for previous in value[:index]):
+                            return "{}: duplicate item {}".format(path, item)
+            checks.append(check_unique)
+        return checks
+
+    def _compile_number(self, schema):
+        checks = []
+        is_number = _TYPE_CHECKS["number"]
+        bounds = []
+        for keyword, exclusive_keyword, compare, description in (
+                ("minimum", "exclusiveMinimum", lambda value, bound, exclusive: value > bound if exclusive else value >= bound, ">"),
+                ("maximum", "exclusiveMaximum", lambda value, bound, exclusive: value < bound if exclusive else value <= bound, "<")):
+            bound = schema.get(keyword)
+            exclusive = schema.get(exclusive_keyword)
+            if is_number(exclusive):
+                # Draft 6 and later: the exclusive bound is a number
+                bounds.append((exclusive, True, compare, description))
+            if is_number(bound):
+                bounds.append((bound, exclusive is True, compare, description + ("" if exclusive is True else "=")))
+
+        for bound, exclusive, compare, description in bounds:
+            def check_bound(value, path, bound=bound, exclusive=exclusive, compare=compare, description=description):
+                if is_number(value) and not compare(value, bound, exclusive):
+                    return "{}: expected a number {} {}".format(path, description, bound)
+            checks.append(check_bound)
+
+        multiple = schema.get("multipleOf")
+        if is_number(multiple) and multiple > 0:
+            def check_multiple(value, path):
+                if is_number(value) and not _is_integer(value / multiple):
+                    return "{}: expected a multiple of {}".format(path, multiple)
+            checks.append(check_multiple)
+        return checks
+
+    def _compile_string(self, schema):
+        checks = []
+        minimum, maximum = schema.get("minLength"), schema.get("maxLength")
+        if minimum is not None or maximum is not None:
+            checks.append(self._compile_size(str, minimum, maximum, "characters"))
+
+        pattern = schema.get("pattern")
+        if isinstance(pattern, str):
+            try:
+                expression = re.compile(pattern)
+            except re.error:
+                # Syntax of ECMA 262 not supported by Python
+                return checks
+
+            def check_pattern(value, path):
+                if isinstance(value, str) and not expression.search(value):
+                    return "{}: expected a string matching {}".format(path, pattern)
+            checks.append(check_pattern)
+        return checks
+
+    @staticmethod
+    def _compile_size(value_types, minimum, maximum, unit):
+        minimum = minimum or 0
+        maximum = float("inf") if maximum is None else maximum
+
+        def check_size(value, path):
+            if isinstance(value, value_types) and not minimum <= len(value) <= maximum:
+                return "{}: expected between {} and {} {}".format(path, minimum, maximum, unit)
+        return check_size
+
+    def _compile_combinations(self, schema):
+        checks = []
+        if isinstance(schema.get("allOf"), list):
+            checks += [self.compile(subschema) for subschema in schema["allOf"]]
+
+        if isinstance(schema.get("anyOf"), list):
+            any_checks = [self.compile(subschema) for subschema in schema["anyOf"]]
+
+            def check_any(value, path):
+                errors = [check(value, path) for check in any_checks]
+                if None not in errors:
+                    return "{}: no alternative matches ({})".format(path, "; ".join(errors))
+            checks.append(check_any)
+
+        if isinstance(schema.get("oneOf"), list):
+            one_checks = [self.compile(subschema) for subschema in schema["oneOf"]]
+
+            def check_one(value, path):
+                errors = [check(value, path) for check in one_checks]
+                matches = errors.count(None)
+                if matches == 0:
+                    return "{}: no alternative matches ({})".format(path, "; ".join(errors))
+                if matches > 1:
+                    return "{}: {} alternatives match, expected exactly one".format(path, matches)
+            checks.append(check_one)
+
+        if "not" in schema:
+            not_check = self.compile(schema["not"])
+
+            def check_not(value, path):
+                if not_check(value, path) is None:
+                    return "{}: matches a forbidden schema".format(path)
+            checks.append(check_not)
+        return checks
+
+
+def compile_schema(schema):
+    """
+    Compile a JSON schema into a fast validation function. Supports the keywords used by the schemas of WAAPI: types,
+    enumerations, properties, items, sizes, bounds, patterns, combinations and local references. Other keywords are
+    ignored.
+
+    :param schema: JSON schema
+    :type schema: dict | bool | None
+    :return: Function returning a description of the first error of a value at a path (e.g. "$"), None if it is valid
+    :rtype: (Any, str) -> str | None
+    """
+    return _SchemaCompiler(schema).compile(schema)
+
+
+class ArgumentValidator:
+    """
+    Validation of the arguments and options of calls against the schemas of their remote procedures, to reject invalid
+    calls without a round trip to Wwise, e.g.:
+      with WaapiClient(validate=True) as client:
+          client.call("ak.wwise.core.object.get", {"form": {"path": [path]}})  # Rejected locally
+
+    The schemas are requested from the server, or from a SchemaCache, the first time a remote procedure is called, and
+    compiled once. Calls are not validated while the schema of their remote procedure cannot be got, e.g. while
+    disconnected: it is requested again by the next call.
+
+    Import as:
+      from waapi import ArgumentValidator
+    """
+    SCHEMA_VALIDATION_FAILED = u"ak.wwise.schema_validation_failed"
+
+    def __init__(self, get_schema):
+        """
+        :param get_schema: Function returning the result of ak.wwise.waapi.getSchema for a URI, None if it failed, or a
+                           future completed with it, e.g. the get_schema method of a SchemaCache
+        :type get_schema: (str) -> dict | None | concurrent.futures.Future
+        """
+        self._get_schema = get_schema
+        self._lock = Lock()
+        self._validators = {}
+        """:type: dict[str, ((Any, str) -> str | None, (Any, str) -> str | None)]"""
+        self._pending = {}
+        """:type: dict[str, concurrent.futures.Future]"""
+
+    def _validators_of(self, uri):
+        """
+        :return: Future completed with the validation functions of the arguments and of the options, None if the schema
+                 of the remote procedure could not be got. Calls waiting on the same schema share a single request.
+        :rtype: concurrent.futures.Future
+        """
+        with self._lock:
+            validators_future = self._pending.get(uri)
+            if validators_future is not None:
+                return validators_future
+            validators_future = concurrent.futures.Future()
+            if uri in self._validators:
+                validators_future.set_result(self._validators[uri])
+                return validators_future
+            self._pending[uri] = validators_future
+
+        try:
+            schema = self._get_schema(uri)
+        except Exception:
+            self._on_schema(uri, None)
+            raise
+
+        if isinstance(schema, concurrent.futures.Future):
+            def on_done(done_future):
+                failed = done_future.cancelled() or done_future.exception() is not None
+                self._on_schema(uri, None if failed else done_future.result())
+            schema.add_done_callback(on_done)
+        else:
+            self._on_schema(uri, schema)
+        return validators_future
+
+    def _on_schema(self, uri, schema):
+        """
+        Compile a schema, and complete the future of the calls waiting on it
+        """
+        validators = None
+        if schema:
+            validators = (compile_schema(schema.get("argsSchema")), compile_schema(schema.get("optionsSchema")))
+
+        with self._lock:
+            validators_future = self._pending.pop(uri)
+            if validators is not None:
+                # A failed lookup, e.g. while disconnected, is not cached to be tried again by the next call
+                self._validators[uri] = validators
+        validators_future.set_result(validators)
+
+    def validate(self, uri, kwargs):
+        """
+        :param uri: URI of the remote procedure
+        :type uri: str
+        :param kwargs: Arguments of the call, with its options in the "options" key
+        :type kwargs: dict
+        :return: Error describing why the call is invalid, None if it is valid
+        :rtype: WaapiRequestFailed | None
+        """
+        return self.validate_async(uri, kwargs).result()
+
+    def validate_async(self, uri, kwargs):
+        """
+        Non-blocking version of validate: the schema of the remote procedure is requested if needed, and a future is
+        returned immediately.
+
+        :param uri: URI of the remote procedure
+        :type uri: str
+        :param kwargs: Arguments of the call, with its options in the "options" key
+        :type kwargs: dict
+        :return: Future completed with the error describing why the call is invalid, None if it is valid
+        :rtype: concurrent.futures.Future
+        """
+        error_future = concurrent.futures.Future()
+        if uri.startswith("ak.wwise.waapi."):
+            # Calls done to get schemas
+            error_future.set_result(None)
+            return error_future
+
+        def on_validators(validators_future):
+            try:
+                error_future.set_result(self._check(uri, kwargs, validators_future.result()))
+            except Exception as e:
+                error_future.set_exception(e)
+
+        self._validators_of(uri).add_done_callback(on_validators)
+        return error_future
+
+    def _check(self, uri, kwargs, validators):
+        """
+        :param validators: Validation functions of the arguments and of the options, None to accept any call
+        :return: Error describing why the call is invalid, None if it is valid
+        :rtype: WaapiRequestFailed | None
+        """
+        if validators is None:
+            return None
+
+        args_validator, options_validator = validators
+        args = {key: value for key, value in kwargs.items() if key != "options"}
+        error = args_validator(args, "$") or options_validator(kwargs.get("options") or {}, "$.options")
+        if error is None:
+            return None
+
+        return WaapiRequestFailed(ApplicationError(
+            self.SCHEMA_VALIDATION_FAILED,
+            message="Schema validation failed: " + error,
+            details={"procedureUri": uri, "typeUri": self.SCHEMA_VALIDATION_FAILED}
+        ))
@@ -1,6 +1,6 @@
 import unittest
 
-from waapi import WaapiClient, WaapiRequestFailed
+from waapi import WaapiClient, WaapiRequestFailed, wait_all
 
 
 class AllowedException(unittest.TestCase):
@@ -23,3 +23,14 @@ class AllowedException(unittest.TestCase):
                 return
 
             self.fail("Should have thrown an exception")
+
+    def test_exception_on_call_async(self):
+        with WaapiClient(allow_exception=True) as client:
+            futures = [client.call_async("i.dont.exist"), client.call_async("ak.wwise.core.getInfo")]
+
+            results = wait_all(futures, return_exceptions=True)
+            self.assertIsInstance(results[0], WaapiRequestFailed)
+            self.assertIsInstance(results[1], dict)
+
+            with self.assertRaises(WaapiRequestFailed):
+                wait_all(futures)
@@ -0,0 +1,111 @@
+import unittest
+
+from waapi import AsyncWaapiClient, CannotConnectToWaapiException, WaapiRequestFailed
+from waapi.wamp.async_compatibility import asyncio
+
+
+class AsyncClient(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_connect_and_call(self):
+        async def run():
+            async with AsyncWaapiClient() as client:
+                self.assertTrue(client.is_connected())
+                result = await client.call("ak.wwise.core.getInfo")
+                self.assertIsInstance(result, dict)
+                self.assertIn("version", result)
+            self.assertFalse(client.is_connected())
+
+        asyncio.run(run())
+
+    def test_cannot_connect(self):
+        async def run():
+            with self.assertRaises(CannotConnectToWaapiException):
+                async with AsyncWaapiClient("ws://bad_address/waapi"):
+                    self.fail("Should not reach this part of the code")
+
+        asyncio.run(run())
+
+    def test_concurrent_calls(self):
+        async def run():
+            async with AsyncWaapiClient() as client:
+                results = await asyncio.gather(*(client.call("ak.wwise.core.getInfo") for _ in range(32)))
+                for result in results:
+                    self.assertIsInstance(result, dict)
+
+        asyncio.run(run())
+
+    def test_invalid(self):
+        async def run():
+            async with AsyncWaapiClient() as client:
+                self.assertIsNone(await client.call("ak.wwise.idontexist"))
+
+            async with AsyncWaapiClient(allow_exception=True) as client:
+                with self.assertRaises(WaapiRequestFailed):
+                    await client.call("ak.wwise.idontexist")
+
+        asyncio.run(run())
+
+    def test_subscribe_with_coroutine_callback(self):
+        async def run():
+            async with AsyncWaapiClient() as client:
+                path = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Some Name"
+                await client.call("ak.wwise.core.object.delete", object=path)
+
+                event = asyncio.Event()
+
+                async def on_object_created(object):
+                    self.assertIn("id", object)
+                    # Nested request from the callback
+                    res = await client.call("ak.wwise.core.object.delete", object=object.get("id"))
+                    self.assertIsInstance(res, dict)
+                    event.set()
+
+                handler = await client.subscribe("ak.wwise.core.object.created", on_object_created, **{"return": ["id"]})
+                self.assertIsNotNone(handler)
+                self.assertEqual(len(client.subscriptions()), 1)
+
+                await client.call(
+                    "ak.wwise.core.object.create",
+                    parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                    type="Sound",
+                    name="Some Name"
+                )
+                await asyncio.wait_for(event.wait(), self.TIMEOUT_VALUE)
+
+                self.assertTrue(await handler.unsubscribe())
+                self.assertFalse(await handler.unsubscribe())
+                self.assertEqual(len(client.subscriptions()), 0)
+
+        asyncio.run(run())
+
+    def test_coroutine_callback_exception(self):
+        async def run():
+            async with AsyncWaapiClient() as client:
+                # Event callbacks are called on the event loop, without worker threads
+                self.assertIsNone(client._session._dispatcher)
+
+                path = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Some Name"
+                await client.call("ak.wwise.core.object.delete", object=path)
+                called = asyncio.Event()
+
+                async def on_object_created(object):
+                    called.set()
+                    raise RuntimeError("Callback failure")
+
+                handler = await client.subscribe("ak.wwise.core.object.created", on_object_created)
+                with self.assertLogs("WampClientAutobahn", "ERROR") as logs:
+                    await client.call(
+                        "ak.wwise.core.object.create",
+                        parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                        type="Sound",
+                        name="Some Name"
+                    )
+                    await asyncio.wait_for(called.wait(), self.TIMEOUT_VALUE)
+                    await asyncio.sleep(0)
+                self.assertIn("Callback failure", "\n".join(logs.output))
+
+                await handler.unsubscribe()
+                await client.call("ak.wwise.core.object.delete", object=path)
+
+        asyncio.run(run())
@@ -0,0 +1,99 @@
+import unittest
+from queue import Queue
+from threading import Event
+
+from waapi import BatchEventHandler
+from waapi.test.fixture import CleanConnectedClientTestCase
+
+
+class BatchEventHandlerStandalone(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_window(self):
+        batches = Queue()
+        handler = BatchEventHandler(callback=batches.put, window=0.1)
+
+        for index in range(100):
+            handler(object={"id": index})
+
+        batch = batches.get(timeout=self.TIMEOUT_VALUE)
+        self.assertEqual([event["object"]["id"] for event in batch], list(range(100)))
+        self.assertTrue(batches.empty())
+
+    def test_max_count(self):
+        batches = Queue()
+        handler = BatchEventHandler(callback=batches.put, window=60, max_count=10)
+
+        for index in range(25):
+            handler(object={"id": index})
+
+        self.assertEqual(len(batches.get(timeout=self.TIMEOUT_VALUE)), 10)
+        self.assertEqual(len(batches.get(timeout=self.TIMEOUT_VALUE)), 10)
+
+        # The remainder is only delivered at the end of the window, or when flushed
+        handler.flush()
+        self.assertEqual(len(batches.get(timeout=self.TIMEOUT_VALUE)), 5)
+
+    def test_keep_latest_per_key(self):
+        batches = Queue()
+        handler = BatchEventHandler(callback=batches.put, window=0.1, key=BatchEventHandler.by_object_id)
+
+        for value in range(10):
+            for object_id in ("a", "b", "c"):
+                handler(object={"id": object_id}, property="Volume", newValue=value)
+        handler(object={"id": "a"}, property="Volume", newValue=42)
+
+        batch = batches.get(timeout=self.TIMEOUT_VALUE)
+        self.assertEqual([event["object"]["id"] for event in batch], ["b", "c", "a"])
+        self.assertEqual([event["newValue"] for event in batch], [9, 9, 42])
+
+    def test_unsubscribe_from_callback(self):
+        batches = Queue()
+
+        def on_batch(events):
+            # Flushes the events received since, from the delivery thread
+            handler.unsubscribe()
+            batches.put(events)
+
+        handler = BatchEventHandler(callback=on_batch, window=0.1)
+        for index in range(5):
+            handler(object={"id": index})
+
+        batch = batches.get(timeout=self.TIMEOUT_VALUE)
+        self.assertEqual([event["object"]["id"] for event in batch], list(range(5)))
+
+    def test_lonely_batch_event_handler(self):
+        handler = BatchEventHandler(window=0)
+        self.assertFalse(handler.unsubscribe())
+
+        # Should do nothing, noexcept.
+        handler.on_event()
+        handler()
+        handler.flush()
+
+
+class BatchEventHandlerSubscribed(CleanConnectedClientTestCase):
+    def test_subscribe_batch(self):
+        self._delete_object()
+
+        event = Event()
+        batches = []
+
+        def on_objects_created(events):
+            batches.append(events)
+            event.set()
+
+        handler = self.client.subscribe(
+            "ak.wwise.core.object.created",
+            BatchEventHandler(callback=on_objects_created, window=0.05),
+            **{"return": ["id", "name"]}
+        )
+        self.assertIsInstance(handler, BatchEventHandler)
+
+        self.assertIsNotNone(self._create_object())
+        self.assertTrue(event.wait(self.TIMEOUT_VALUE))
+        self.assertTrue(handler.unsubscribe())
+        self._delete_object()
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0][0]["object"]["name"], "Some Name")
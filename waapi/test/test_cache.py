@@ -0,0 +1,89 @@
+import time
+import unittest
+
+from waapi import WaapiClient, ResultCache
+
+
+class Cache(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+    PARENT = "\\Actor-Mixer Hierarchy\\Default Work Unit"
+    QUERY = {"from": {"path": [PARENT]}, "transform": [{"select": ["children"]}]}
+
+    def setUp(self):
+        self.client = WaapiClient(cache=True)
+        self.other_client = WaapiClient()
+        for name in ("Cached 1", "Cached 2"):
+            self.client.call("ak.wwise.core.object.delete", object=self.PARENT + "\\" + name)
+        self.client.cache.clear()
+
+    def tearDown(self):
+        for name in ("Cached 1", "Cached 2"):
+            self.client.call("ak.wwise.core.object.delete", object=self.PARENT + "\\" + name)
+        self.client.disconnect()
+        self.other_client.disconnect()
+
+    def create(self, client, name):
+        return client.call("ak.wwise.core.object.create", parent=self.PARENT, type="Sound", name=name)
+
+    def children_names(self):
+        result = self.client.call("ak.wwise.core.object.get", self.QUERY, options={"return": ["name"]})
+        return {child["name"] for child in result["return"]}
+
+    def test_hits(self):
+        first = self.client.call("ak.wwise.core.object.get", self.QUERY)
+        first["return"].append("modified by the caller")
+        second = self.client.call("ak.wwise.core.object.get", self.QUERY)
+        third = self.client.call_async("ak.wwise.core.object.get", self.QUERY).result()
+
+        self.assertNotIn("modified by the caller", second["return"])
+        self.assertEqual(second, third)
+        self.assertIsNot(second, third)
+        stats = self.client.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 1, 1))
+
+        # Options are part of the key, not their order
+        self.client.call("ak.wwise.core.object.get", self.QUERY, options={"return": ["id", "name"]})
+        self.client.call("ak.wwise.core.object.get", self.QUERY, options={"return": ["id", "name"]})
+        self.assertEqual(self.client.cache.stats()["misses"], 2)
+
+    def test_invalidated_by_event(self):
+        self.assertNotIn("Cached 1", self.children_names())
+
+        # Changes made by other clients are notified by events
+        self.assertIsNotNone(self.create(self.other_client, "Cached 1"))
+        deadline = time.time() + self.TIMEOUT_VALUE
+        while "Cached 1" not in self.children_names() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertIn("Cached 1", self.children_names())
+        self.assertGreaterEqual(self.client.cache.stats()["invalidations"], 1)
+
+    def test_invalidated_by_call(self):
+        self.client.call("ak.wwise.core.getInfo")
+        self.assertNotIn("Cached 2", self.children_names())
+
+        # Calls that are not read-only invalidate the cache once completed
+        self.assertIsNotNone(self.create(self.client, "Cached 2"))
+        self.assertIn("Cached 2", self.children_names())
+
+        # Results not depending on the project are kept
+        misses = self.client.cache.stats()["misses"]
+        self.client.call("ak.wwise.core.getInfo")
+        self.assertEqual(self.client.cache.stats()["misses"], misses)
+
+    def test_eviction(self):
+        cache = ResultCache(maxsize=2)
+        for index in range(3):
+            key = cache.make_key("ak.wwise.core.object.get", {"index": index})
+            self.assertTrue(cache.put(key, "ak.wwise.core.object.get", {"return": [index]}, cache.generation()))
+
+        self.assertFalse(cache.get(cache.make_key("ak.wwise.core.object.get", {"index": 0}))[0])
+        self.assertEqual(cache.get(cache.make_key("ak.wwise.core.object.get", {"index": 2})), (True, {"return": [2]}))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_invalidated_while_in_flight(self):
+        cache = ResultCache()
+        key = cache.make_key("ak.wwise.core.object.get", {})
+        generation = cache.generation()
+        cache.invalidate()
+        self.assertFalse(cache.put(key, "ak.wwise.core.object.get", {"return": []}, generation))
+        self.assertEqual(cache.stats()["size"], 0)
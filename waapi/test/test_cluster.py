@@ -0,0 +1,63 @@
+import threading
+import unittest
+
+from waapi import WaapiCluster, CannotConnectToWaapiException, WaapiRequestFailed
+
+
+class Cluster(unittest.TestCase):
+    # Different URLs of the same server stand for many instances of Wwise
+    URLS = ["ws://127.0.0.1:8080/waapi", "ws://localhost:8080/waapi"]
+    BAD_URL = "ws://bad_address/waapi"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cluster = WaapiCluster(cls.URLS + [cls.BAD_URL])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.cluster.disconnect()
+
+    def test_connection(self):
+        self.assertEqual(self.cluster.urls(), self.URLS + [self.BAD_URL])
+        self.assertEqual(list(self.cluster.unreachable_urls.keys()), [self.BAD_URL])
+        for url in self.URLS:
+            self.assertTrue(self.cluster.client(url).is_connected())
+        self.assertIsNone(self.cluster.client(self.BAD_URL))
+
+    def test_failed_creation(self):
+        def runtime_count():
+            return sum(thread.name == "WaapiRuntime" for thread in threading.enumerate())
+
+        count = runtime_count()
+        with self.assertRaises(TypeError):
+            WaapiCluster(self.URLS, invalid_option=True)
+        self.assertEqual(runtime_count(), count)
+
+    def test_broadcast(self):
+        results = self.cluster.call("ak.wwise.core.getInfo")
+        self.assertEqual(list(results.keys()), self.URLS + [self.BAD_URL])
+        for url in self.URLS:
+            self.assertIn("version", results[url])
+        self.assertIsInstance(results[self.BAD_URL], CannotConnectToWaapiException)
+
+    def test_subset(self):
+        results = self.cluster.call("ak.wwise.core.getInfo", _urls=self.URLS[:1])
+        self.assertEqual(list(results.keys()), self.URLS[:1])
+        self.assertIn("version", results[self.URLS[0]])
+
+        results = self.cluster.call("ak.wwise.core.getInfo", _urls=["ws://unknown/waapi"])
+        self.assertIsInstance(results["ws://unknown/waapi"], CannotConnectToWaapiException)
+
+    def test_errors_per_instance(self):
+        results = self.cluster.call(
+            "ak.wwise.core.object.get",
+            {"from": {"path": ["\\Actor-Mixer Hierarchy"]}},
+            options={"return": ["id"]},
+            _urls=self.URLS
+        )
+        for url in self.URLS:
+            self.assertIn("return", results[url])
+
+        results = self.cluster.call("ak.wwise.idontexist", _urls=self.URLS)
+        for url in self.URLS:
+            self.assertIsInstance(results[url], WaapiRequestFailed)
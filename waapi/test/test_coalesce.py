@@ -0,0 +1,64 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from waapi import WaapiClient, ArgumentValidator, wait_all
+
+
+class Coalesce(unittest.TestCase):
+
+    def test_identical_calls_share_a_request(self):
+        with WaapiClient(coalesce_calls=True) as client:
+            messages_sent = client.traffic_stats()["messages_sent"]
+            futures = [client.call_async("ak.wwise.core.getInfo") for _ in range(30)]
+            results = wait_all(futures)
+
+            self.assertLess(client.traffic_stats()["messages_sent"] - messages_sent, 30)
+            for result in results:
+                self.assertEqual(result, results[0])
+
+            # Each caller has a copy of the result
+            self.assertEqual(len({id(result) for result in results}), 30)
+            results[0]["modified by the caller"] = True
+            self.assertNotIn("modified by the caller", futures[1].result())
+
+    def test_from_threads(self):
+        with WaapiClient(coalesce_calls=True) as client:
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                results = list(executor.map(lambda _: client.call("ak.wwise.core.getInfo"), range(100)))
+            for result in results:
+                self.assertEqual(result, results[0])
+
+    def test_different_calls(self):
+        with WaapiClient(coalesce_calls=True) as client:
+            messages_sent = client.traffic_stats()["messages_sent"]
+            futures = [
+                client.call_async("ak.wwise.core.getInfo"),
+                client.call_async("ak.wwise.core.getInfo", {"invalid": True}),
+                client.call_async("ak.wwise.core.object.get", {"from": {"path": ["\\Actor-Mixer Hierarchy"]}}),
+                client.call_async("ak.wwise.core.object.get", {"from": {"path": ["\\Actor-Mixer Hierarchy"]}},
+                                  options={"return": ["name"]}),
+            ]
+            results = wait_all(futures)
+            self.assertEqual(client.traffic_stats()["messages_sent"] - messages_sent, 4)
+            self.assertIsNotNone(results[0])
+            self.assertIsNone(results[1])
+
+    def test_disabled_by_default(self):
+        with WaapiClient() as client:
+            messages_sent = client.traffic_stats()["messages_sent"]
+            wait_all([client.call_async("ak.wwise.core.getInfo") for _ in range(10)])
+            self.assertEqual(client.traffic_stats()["messages_sent"] - messages_sent, 10)
+
+    def test_failed_send(self):
+        failures = [RuntimeError("Schema lookup failure")]
+
+        def get_schema(uri):
+            if failures:
+                raise failures.pop()
+
+        with WaapiClient(coalesce_calls=True, validate=ArgumentValidator(get_schema)) as client:
+            with self.assertRaises(RuntimeError):
+                client.call_async("ak.wwise.core.getInfo")
+
+            # The next calls do not join the call that failed to be sent
+            self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
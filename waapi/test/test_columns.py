@@ -0,0 +1,89 @@
+import math
+import unittest
+from array import array
+
+from waapi import WaapiClient, to_columns, to_record_batch, COLUMNS_ARRAY, COLUMNS_NUMPY, available_columns_backends
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class Columns(unittest.TestCase):
+    OBJECTS = [
+        {"id": "{1}", "name": "Footstep", "type": "Sound", "Volume": -6, "Pitch": 0, "IsStreamingEnabled": False,
+         "parent": {"id": "{0}", "name": "Footsteps"}},
+        {"id": "{2}", "name": "Explosion", "type": "Sound", "Volume": -1.5, "Pitch": 100, "IsStreamingEnabled": True,
+         "parent": {"id": "{0}", "name": "Footsteps"}},
+        {"id": "{3}", "name": "Music", "type": "MusicTrack", "Pitch": 0, "IsStreamingEnabled": True},
+    ]
+
+    def test_array(self):
+        columns = to_columns({"return": self.OBJECTS}, backend=COLUMNS_ARRAY)
+        self.assertEqual(list(columns), ["id", "name", "type", "Volume", "Pitch", "IsStreamingEnabled", "parent.id",
+                                         "parent.name"])
+        self.assertEqual(columns["id"], ["{1}", "{2}", "{3}"])
+        self.assertEqual(columns["parent.id"], ["{0}", "{0}", None])
+
+        # Missing numbers are NaN, integers stay integers if none is missing
+        self.assertEqual(columns["Volume"].typecode, "d")
+        self.assertEqual(list(columns["Volume"][:2]), [-6.0, -1.5])
+        self.assertTrue(math.isnan(columns["Volume"][2]))
+        self.assertEqual(columns["Pitch"], array("q", [0, 100, 0]))
+        self.assertEqual(columns["IsStreamingEnabled"], array("b", [0, 1, 1]))
+
+        # Repeated strings are stored once
+        original_types = [obj["type"] for obj in self.OBJECTS + [{"type": "".join(["Sou", "nd"])}]]
+        self.assertIsNot(original_types[0], original_types[3])
+        types = to_columns([{"type": value} for value in original_types], backend=COLUMNS_ARRAY)["type"]
+        self.assertIs(types[0], types[3])
+
+    def test_fields(self):
+        columns = to_columns(iter(self.OBJECTS), fields=["id", "Volume", "Missing"], backend=COLUMNS_ARRAY)
+        self.assertEqual(list(columns), ["id", "Volume", "Missing"])
+        self.assertEqual(columns["Missing"], [None, None, None])
+        self.assertEqual(to_columns([], fields=["id"], backend=COLUMNS_ARRAY), {"id": []})
+
+        # Nested objects are flattened, they have no column of their own
+        with self.assertRaises(ValueError) as context:
+            to_columns(self.OBJECTS, fields=["id", "parent"], backend=COLUMNS_ARRAY)
+        self.assertIn("parent.id, parent.name", str(context.exception))
+
+    def test_backends(self):
+        self.assertIn(COLUMNS_ARRAY, available_columns_backends())
+        with self.assertRaises(ValueError):
+            to_columns(self.OBJECTS, backend="pandas")
+        if numpy is None:
+            with self.assertRaises(ValueError):
+                to_columns(self.OBJECTS, backend=COLUMNS_NUMPY)
+        if pyarrow is None:
+            with self.assertRaises(ValueError):
+                to_record_batch(self.OBJECTS)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        columns = to_columns(self.OBJECTS, backend=COLUMNS_NUMPY)
+        self.assertEqual(columns["Volume"].dtype, numpy.float64)
+        self.assertEqual(columns["Pitch"].dtype, numpy.int64)
+        self.assertEqual(columns["IsStreamingEnabled"].dtype, numpy.bool_)
+        self.assertEqual(list(columns["id"][columns["Volume"] < -3]), ["{1}"])
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_record_batch(self):
+        batch = to_record_batch(self.OBJECTS, fields=["id", "type", "Volume"])
+        self.assertEqual(batch.num_rows, 3)
+        self.assertEqual(batch.schema.names, ["id", "type", "Volume"])
+        self.assertEqual(batch.column(2).to_pylist(), [-6.0, -1.5, None])
+
+    def test_query(self):
+        with WaapiClient() as client:
+            objects = client.iter_objects({"waql": "$ from type WorkUnit"}, options={"return": ["id", "name", "type"]})
+            columns = to_columns(objects, backend=COLUMNS_ARRAY)
+        self.assertGreaterEqual(len(columns["id"]), 1)
+        self.assertEqual(set(columns["type"]), {"WorkUnit"})
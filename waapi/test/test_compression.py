@@ -0,0 +1,45 @@
+import unittest
+
+from waapi import WaapiClient, WebSocketCompression
+
+
+class Compression(unittest.TestCase):
+    # Calls with an invalid argument big enough to be compressed, the response is an error
+    LARGE_ARGUMENT = "Actor-Mixer Hierarchy " * 20000
+
+    def test_compressed(self):
+        with WaapiClient(compression=True) as client:
+            self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+            client.call("ak.wwise.core.getInfo", invalid=self.LARGE_ARGUMENT)
+
+            stats = client.traffic_stats()
+            self.assertEqual(stats["compression"], "permessage-deflate")
+            self.assertEqual(stats["compressed_messages"], 1)
+            self.assertGreater(stats["payload_bytes_sent"], len(self.LARGE_ARGUMENT))
+            self.assertLess(stats["bytes_sent"], len(self.LARGE_ARGUMENT) / 10)
+            self.assertGreaterEqual(stats["compress_time"], 0)
+            self.assertGreaterEqual(stats["messages_received"], 3)
+
+    def test_threshold(self):
+        with WaapiClient(compression=WebSocketCompression(window_bits=9, threshold=10 ** 9)) as client:
+            client.call("ak.wwise.core.getInfo", invalid=self.LARGE_ARGUMENT)
+
+            stats = client.traffic_stats()
+            self.assertEqual(stats["compression"], "permessage-deflate")
+            self.assertEqual(stats["compressed_messages"], 0)
+            self.assertGreater(stats["bytes_sent"], len(self.LARGE_ARGUMENT))
+
+    def test_disabled_by_default(self):
+        with WaapiClient() as client:
+            client.call("ak.wwise.core.getInfo", invalid=self.LARGE_ARGUMENT)
+
+            stats = client.traffic_stats()
+            self.assertIsNone(stats["compression"])
+            self.assertEqual(stats["compressed_messages"], 0)
+            self.assertGreater(stats["bytes_sent"], len(self.LARGE_ARGUMENT))
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            WebSocketCompression(window_bits=16)
+        with self.assertRaises(ValueError):
+            WebSocketCompression(mem_level=0)
@@ -0,0 +1,147 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Barrier
+
+from waapi import WaapiClient, EventHandler, wait_all, as_completed
+from waapi.test.fixture import ConnectedClientTestCase
+
+
+class Concurrency(ConnectedClientTestCase):
+    THREAD_COUNT = 16
+
+    @staticmethod
+    def _call_get_info(client):
+        return client.call("ak.wwise.core.getInfo")
+
+    def test_concurrent_calls(self):
+        with ThreadPoolExecutor(self.THREAD_COUNT) as executor:
+            results = list(executor.map(lambda i: self._call_get_info(self.client), range(self.THREAD_COUNT * 4)))
+
+        self.assertEqual(len(results), self.THREAD_COUNT * 4)
+        for result in results:
+            self.assertIsInstance(result, dict)
+            self.assertIn("version", result)
+
+    def test_concurrent_errors_do_not_block(self):
+        with ThreadPoolExecutor(self.THREAD_COUNT) as executor:
+            results = list(executor.map(
+                lambda i: self.client.call("ak.wwise.core.getInfo" if i % 2 else "ak.wwise.idontexist"),
+                range(self.THREAD_COUNT * 2)
+            ))
+
+        for i, result in enumerate(results):
+            if i % 2:
+                self.assertIsInstance(result, dict)
+            else:
+                self.assertIsNone(result)
+
+    def test_call_async(self):
+        futures = [self.client.call_async("ak.wwise.core.getInfo") for _ in range(100)]
+        results = wait_all(futures, self.TIMEOUT_VALUE)
+
+        self.assertEqual(len(results), len(futures))
+        for result in results:
+            self.assertIsInstance(result, dict)
+            self.assertIn("version", result)
+
+    def test_call_async_ordered_results(self):
+        names = ["Project", "WorkUnit", "Folder"]
+        futures = [
+            self.client.call_async("ak.wwise.core.object.get", {"from": {"ofType": [name]}}, options={"return": ["type"]})
+            for name in names
+        ]
+        for name, result in zip(names, wait_all(futures, self.TIMEOUT_VALUE)):
+            for obj in result.get("return"):
+                self.assertEqual(obj.get("type"), name)
+
+    def test_as_completed(self):
+        futures = [self.client.call_async("ak.wwise.core.getInfo") for _ in range(10)]
+        completed = list(as_completed(futures, self.TIMEOUT_VALUE))
+
+        self.assertEqual(set(completed), set(futures))
+        for future in completed:
+            self.assertIsInstance(future.result(), dict)
+
+    def test_call_async_invalid(self):
+        future = self.client.call_async("ak.wwise.idontexist")
+        self.assertIsNone(future.result(self.TIMEOUT_VALUE))
+
+    def test_subscribe_async(self):
+        futures = [self.client.subscribe_async("ak.wwise.core.object.nameChanged") for _ in range(4)]
+        handlers = wait_all(futures, self.TIMEOUT_VALUE)
+
+        for handler in handlers:
+            self.assertIsInstance(handler, EventHandler)
+            self.assertIn(handler, self.client.subscriptions())
+            self.assertTrue(handler.unsubscribe())
+
+
+class SingleInFlight(unittest.TestCase):
+    def test_concurrent_calls_single_in_flight(self):
+        with WaapiClient(max_in_flight=1) as client:
+            with ThreadPoolExecutor(Concurrency.THREAD_COUNT) as executor:
+                results = list(executor.map(
+                    lambda i: client.call("ak.wwise.core.getInfo"),
+                    range(Concurrency.THREAD_COUNT)
+                ))
+
+        self.assertEqual(len(results), Concurrency.THREAD_COUNT)
+        for result in results:
+            self.assertIsInstance(result, dict)
+
+
+class MultiCaller(unittest.TestCase):
+    THREAD_COUNT = 64
+    CALLS_PER_THREAD = 20
+    TIMEOUT_VALUE = 30  # seconds
+
+    def test_stress_shared_client(self):
+        with WaapiClient() as client:
+            barrier = Barrier(self.THREAD_COUNT)
+
+            def worker(index):
+                barrier.wait()
+                results = []
+                for i in range(self.CALLS_PER_THREAD):
+                    # Mix in failing requests, which complete their caller with None
+                    uri = "ak.wwise.idontexist" if (index + i) % 5 == 0 else "ak.wwise.core.getInfo"
+                    results.append((uri, client.call(uri)))
+                return results
+
+            with ThreadPoolExecutor(self.THREAD_COUNT) as executor:
+                futures = [executor.submit(worker, index) for index in range(self.THREAD_COUNT)]
+                done, not_done = wait(futures, self.TIMEOUT_VALUE)
+
+            self.assertEqual(len(not_done), 0)
+            for future in done:
+                for uri, result in future.result():
+                    if uri == "ak.wwise.core.getInfo":
+                        self.assertIsInstance(result, dict)
+                    else:
+                        self.assertIsNone(result)
+
+    def test_disconnect_unblocks_callers(self):
+        client = WaapiClient()
+        barrier = Barrier(self.THREAD_COUNT + 1)
+
+        def worker():
+            barrier.wait()
+            results = []
+            while client.is_connected():
+                results.append(client.call("ak.wwise.core.getInfo"))
+            # Requests after the disconnection never block
+            results.append(client.call("ak.wwise.core.getInfo"))
+            return results
+
+        with ThreadPoolExecutor(self.THREAD_COUNT) as executor:
+            futures = [executor.submit(worker) for _ in range(self.THREAD_COUNT)]
+            barrier.wait()
+            self.assertTrue(client.disconnect())
+            done, not_done = wait(futures, self.TIMEOUT_VALUE)
+
+        self.assertEqual(len(not_done), 0)
+        for future in done:
+            results = future.result()
+            self.assertIsNone(results[-1])
+            for result in results:
+                self.assertTrue(result is None or isinstance(result, dict))
@@ -0,0 +1,108 @@
+from threading import Event, Lock, current_thread
+
+from waapi import WaapiClient
+from waapi.test.fixture import CleanConnectedClientTestCase
+
+
+class EventDispatch(CleanConnectedClientTestCase):
+    EVENT_WORKERS = 2
+    OBJECT_COUNT = 10
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = WaapiClient(event_workers=cls.EVENT_WORKERS)
+
+    def _object_path(self, index):
+        return "\\Actor-Mixer Hierarchy\\Default Work Unit\\Some Name " + str(index)
+
+    def _create_objects(self):
+        for index in range(self.OBJECT_COUNT):
+            self.client.call("ak.wwise.core.object.delete", object=self._object_path(index))
+        for index in range(self.OBJECT_COUNT):
+            self.client.call(
+                "ak.wwise.core.object.create",
+                parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                type="Sound",
+                name="Some Name " + str(index)
+            )
+
+    def _delete_objects(self):
+        for index in range(self.OBJECT_COUNT):
+            self.client.call("ak.wwise.core.object.delete", object=self._object_path(index))
+
+    def test_bounded_worker_threads(self):
+        lock = Lock()
+        all_received = Event()
+        thread_names = set()
+        received = []
+
+        def on_object_created(object):
+            # Nested request from the callback
+            self.assertIsNotNone(self.client.call("ak.wwise.core.getInfo"))
+            with lock:
+                thread_names.add(current_thread().name)
+                received.append(object.get("name"))
+                if len(received) == self.OBJECT_COUNT:
+                    all_received.set()
+
+        handler = self.client.subscribe("ak.wwise.core.object.created", on_object_created)
+        self._create_objects()
+
+        self.assertTrue(all_received.wait(self.TIMEOUT_VALUE))
+        self.assertTrue(handler.unsubscribe())
+        self._delete_objects()
+
+        self.assertEqual(sorted(received), sorted("Some Name " + str(index) for index in range(self.OBJECT_COUNT)))
+        self.assertLessEqual(len(thread_names), self.EVENT_WORKERS)
+
+    def test_callback_exception_does_not_stop_dispatch(self):
+        all_received = Event()
+        received = []
+
+        def on_object_created(object):
+            received.append(object)
+            if len(received) == self.OBJECT_COUNT:
+                all_received.set()
+            raise RuntimeError("Callback failure")
+
+        handler = self.client.subscribe("ak.wwise.core.object.created", on_object_created)
+        self._create_objects()
+
+        self.assertTrue(all_received.wait(self.TIMEOUT_VALUE))
+        self.assertTrue(handler.unsubscribe())
+        self._delete_objects()
+
+
+class OrderedEventDispatch(EventDispatch):
+    @classmethod
+    def setUpClass(cls):
+        cls.client = WaapiClient(event_workers=cls.EVENT_WORKERS, ordered_events=True)
+
+    def test_serial_in_order(self):
+        lock = Lock()
+        all_received = Event()
+        received = []
+        active = []
+        max_active = []
+
+        def on_object_created(object):
+            with lock:
+                active.append(object)
+                max_active.append(len(active))
+            # Give a chance to a concurrent callback to overlap
+            self.assertIsNotNone(self.client.call("ak.wwise.core.getInfo"))
+            with lock:
+                active.remove(object)
+                received.append(object.get("name"))
+                if len(received) == self.OBJECT_COUNT:
+                    all_received.set()
+
+        handler = self.client.subscribe("ak.wwise.core.object.created", on_object_created)
+        self._create_objects()
+
+        self.assertTrue(all_received.wait(self.TIMEOUT_VALUE))
+        self.assertTrue(handler.unsubscribe())
+        self._delete_objects()
+
+        self.assertEqual(received, ["Some Name " + str(index) for index in range(self.OBJECT_COUNT)])
+        self.assertEqual(max(max_active), 1)
@@ -0,0 +1,114 @@
+import unittest
+from threading import Thread
+
+from waapi import AsyncWaapiClient, EventStream
+from waapi.test.fixture import CleanConnectedClientTestCase
+from waapi.wamp.async_compatibility import asyncio
+
+
+class EventStreamStandalone(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_drop_oldest(self):
+        stream = EventStream(maxsize=3, overflow=EventStream.DROP_OLDEST)
+        for index in range(10):
+            stream(index=index)
+        stream.close()
+
+        self.assertEqual([event["index"] for event in stream], [7, 8, 9])
+        self.assertEqual(stream.dropped, 7)
+
+    def test_drop_newest(self):
+        stream = EventStream(maxsize=3, overflow=EventStream.DROP_NEWEST)
+        for index in range(10):
+            stream(index=index)
+        stream.close()
+
+        self.assertEqual([event["index"] for event in stream], [0, 1, 2])
+        self.assertEqual(stream.dropped, 7)
+
+    def test_block(self):
+        stream = EventStream(maxsize=2, timeout=self.TIMEOUT_VALUE)
+
+        def produce():
+            for index in range(100):
+                stream(index=index)
+            stream.close()
+
+        producer = Thread(target=produce)
+        producer.start()
+        self.assertEqual([event["index"] for event in stream], list(range(100)))
+        producer.join(self.TIMEOUT_VALUE)
+        self.assertEqual(stream.dropped, 0)
+
+    def test_timeout(self):
+        stream = EventStream(timeout=0.05)
+        with self.assertRaises(TimeoutError):
+            next(stream)
+
+    def test_invalid_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            EventStream(overflow="explode")
+
+    def test_lonely_event_stream(self):
+        stream = EventStream()
+        self.assertFalse(stream.unsubscribe())
+        self.assertTrue(stream.is_closed())
+        self.assertEqual(list(stream), [])
+
+
+class EventStreamSubscribed(CleanConnectedClientTestCase):
+    def test_iterate_events(self):
+        self._delete_object()
+
+        for overflow in EventStream.OVERFLOW_POLICIES:
+            with self.client.subscribe_stream(
+                "ak.wwise.core.object.created",
+                maxsize=10,
+                overflow=overflow,
+                timeout=self.TIMEOUT_VALUE,
+                **{"return": ["id", "name"]}
+            ) as stream:
+                self.assertIsInstance(stream, EventStream)
+                self.assertIn(stream, self.client.subscriptions())
+
+                self.assertIsNotNone(self._create_object())
+                event = next(stream)
+                self.assertEqual(event["object"]["name"], "Some Name")
+                self._delete_object()
+
+            self.assertNotIn(stream, self.client.subscriptions())
+            self.assertTrue(stream.is_closed())
+
+
+class AsyncEventStreamSubscribed(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+
+    def test_async_iterate_events(self):
+        async def run():
+            async with AsyncWaapiClient() as client:
+                path = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Some Name"
+                await client.call("ak.wwise.core.object.delete", object=path)
+
+                stream = await client.subscribe_stream(
+                    "ak.wwise.core.object.created",
+                    maxsize=10,
+                    timeout=self.TIMEOUT_VALUE,
+                    **{"return": ["id", "name"]}
+                )
+                async with stream:
+                    await client.call(
+                        "ak.wwise.core.object.create",
+                        parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                        type="Sound",
+                        name="Some Name"
+                    )
+                    async for event in stream:
+                        self.assertEqual(event["object"]["name"], "Some Name")
+                        break
+
+                self.assertTrue(stream.is_closed())
+                self.assertEqual(client.subscriptions(), set())
+                await client.call("ak.wwise.core.object.delete", object=path)
+
+        asyncio.run(run())
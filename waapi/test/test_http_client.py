@@ -0,0 +1,149 @@
+import json
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+from waapi import WaapiHttpClient, WaapiRequestFailed, wait_all
+
+
+class _WaapiHttpHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super(_WaapiHttpHandler, self).setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.post_count += 1
+            drop = request["args"].get("drop") and self.server.drop_count > 0
+            if drop:
+                self.server.drop_count -= 1
+        if drop:
+            # Processed, but the connection is lost before the response
+            self.close_connection = True
+            return
+
+        if request["args"].get("truncate"):
+            # The connection is lost in the middle of the response
+            self.close_connection = True
+            self.send_response(200)
+            self.send_header("Content-Length", "100")
+            self.end_headers()
+            self.wfile.write(b"{}")
+            return
+        if request["args"].get("garbage"):
+            self.close_connection = True
+            self.wfile.write(b"not a status line\r\n\r\n")
+            return
+
+        if request["uri"] == "ak.wwise.core.getInfo":
+            status, response = 200, {"displayName": "Wwise", "received": request}
+        else:
+            status, response = 500, {"uri": "ak.wwise.invalid_procedure", "message": "Unknown procedure"}
+
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HttpClient(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _WaapiHttpHandler)
+        self.server.daemon_threads = True
+        self.server.lock = Lock()
+        self.server.connection_count = 0
+        self.server.post_count = 0
+        self.server.drop_count = 0
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:{}/waapi".format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_call(self):
+        with WaapiHttpClient(self.url) as client:
+            result = client.call("ak.wwise.core.getInfo", {"a": 1}, c=3, options={"d": 4})
+            self.assertEqual(result["displayName"], "Wwise")
+            self.assertEqual(result["received"], {
+                "uri": "ak.wwise.core.getInfo",
+                "args": {"a": 1, "c": 3},
+                "options": {"d": 4}
+            })
+            self.assertIsNone(client.call("ak.wwise.idontexist"))
+
+    def test_allow_exception(self):
+        with WaapiHttpClient(self.url, allow_exception=True) as client:
+            with self.assertRaises(WaapiRequestFailed) as context:
+                client.call("ak.wwise.idontexist")
+            self.assertEqual(context.exception.uri, "ak.wwise.invalid_procedure")
+            self.assertEqual(context.exception.kwargs["message"], "Unknown procedure")
+
+            with self.assertRaises(WaapiRequestFailed):
+                client.call_async("ak.wwise.idontexist").result()
+
+    def test_keep_alive(self):
+        with WaapiHttpClient(self.url) as client:
+            for _ in range(20):
+                self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+        self.assertEqual(self.server.connection_count, 1)
+
+    def test_connection_lost(self):
+        with WaapiHttpClient(self.url) as client:
+            self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+
+            # Read-only calls are sent again on a new connection
+            self.server.drop_count = 1
+            self.assertIsNotNone(client.call("ak.wwise.core.getInfo", drop=True))
+            self.assertEqual(self.server.post_count, 3)
+
+            # Other calls may have been processed, they are not sent again
+            self.server.drop_count = 1
+            self.assertIsNone(client.call("ak.wwise.core.object.create", drop=True))
+            self.assertEqual(self.server.post_count, 4)
+
+    def test_invalid_response(self):
+        with WaapiHttpClient(self.url) as client:
+            with self.assertLogs("WaapiHttpClient", "ERROR") as logs:
+                self.assertIsNone(client.call("ak.wwise.core.object.create", truncate=True))
+                self.assertIsNone(client.call("ak.wwise.core.object.create", garbage=True))
+            self.assertIn("IncompleteRead", logs.output[0])
+            self.assertIn("BadStatusLine", logs.output[1])
+
+            # The connections are not reused
+            self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+            self.assertEqual(self.server.connection_count, 3)
+
+        with WaapiHttpClient(self.url, allow_exception=True) as client:
+            with self.assertRaises(WaapiRequestFailed) as context:
+                client.call("ak.wwise.core.getInfo", truncate=True)
+            self.assertEqual(context.exception.uri, "ak.wwise.http_error")
+
+    def test_concurrent_calls(self):
+        with WaapiHttpClient(self.url, max_connections=4) as client:
+            futures = [client.call_async("ak.wwise.core.getInfo", {"index": index}) for index in range(50)]
+            results = wait_all(futures)
+        self.assertEqual([result["received"]["args"]["index"] for result in results], list(range(50)))
+        self.assertLessEqual(self.server.connection_count, 4)
+
+    def test_disconnect(self):
+        client = WaapiHttpClient(self.url)
+        self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+        self.assertTrue(client.disconnect())
+        self.assertFalse(client.disconnect())
+        self.assertIsNone(client.call("ak.wwise.core.getInfo"))
+        self.assertIsNone(client.call_async("ak.wwise.core.getInfo").result())
+
+    def test_cannot_connect(self):
+        with WaapiHttpClient("http://127.0.0.1:1/waapi") as client:
+            self.assertIsNone(client.call("ak.wwise.core.getInfo"))
@@ -0,0 +1,77 @@
+import time
+import unittest
+
+from waapi import WaapiClient, WaapiRequestFailed
+
+
+class IterObjects(unittest.TestCase):
+    PARENT = "\\Actor-Mixer Hierarchy\\Default Work Unit"
+    COUNT = 25
+    OPTIONS = {"return": ["id", "name", "path"]}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = WaapiClient()
+        cls.sounds = [
+            cls.client.call("ak.wwise.core.object.create", parent=cls.PARENT, type="Sound", name="Paged {:02}".format(index))
+            for index in range(cls.COUNT)
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        for sound in cls.sounds:
+            cls.client.call("ak.wwise.core.object.delete", object=sound["id"])
+        cls.client.disconnect()
+
+    def call(self, query):
+        return self.client.call("ak.wwise.core.object.get", query, options=self.OPTIONS)["return"]
+
+    def messages_sent(self):
+        return self.client.traffic_stats()["messages_sent"]
+
+    def test_waql(self):
+        query = {"waql": "$ from type Sound"}
+        expected = self.call(query)
+        self.assertGreaterEqual(len(expected), self.COUNT)
+
+        for page_size in (1, 4, len(expected), len(expected) + 10):
+            objects = list(self.client.iter_objects(query, options=self.OPTIONS, page_size=page_size))
+            self.assertEqual(objects, expected)
+
+    def test_ids(self):
+        ids = [sound["id"] for sound in self.sounds]
+        expected = self.call({"from": {"id": ids}})
+
+        messages_sent = self.messages_sent()
+        objects = list(self.client.iter_objects({"from": {"id": ids}, "options": self.OPTIONS}, page_size=10))
+        self.assertEqual(objects, expected)
+        self.assertEqual(self.messages_sent() - messages_sent, 3)
+
+    def test_paths_with_transform(self):
+        query = {"from": {"path": [self.PARENT, "\\Actor-Mixer Hierarchy"]}, "transform": [{"select": ["children"]}]}
+        expected = self.call(query)
+        self.assertEqual(list(self.client.iter_objects(query, options=self.OPTIONS, page_size=1)), expected)
+
+    def test_single_page(self):
+        query = {"from": {"ofType": ["Sound"]}}
+        self.assertEqual(list(self.client.iter_objects(query, options=self.OPTIONS, page_size=2)), self.call(query))
+
+    def test_pages_in_flight(self):
+        messages_sent = self.messages_sent()
+        objects = self.client.iter_objects({"waql": "$ from type Sound"}, options=self.OPTIONS, page_size=2,
+                                           pages_in_flight=3)
+        next(objects)
+        # The first page and the pages ahead of it, which may still be sent after the first page is received
+        deadline = time.time() + 5
+        while self.messages_sent() - messages_sent < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.messages_sent() - messages_sent, 3)
+        objects.close()
+
+    def test_failed_page(self):
+        with WaapiClient(allow_exception=True) as client:
+            with self.assertRaises(WaapiRequestFailed):
+                list(client.iter_objects({"from": {"invalid": []}}))
+        with self.assertLogs("WampClientAutobahn", "ERROR") as logs:
+            self.assertEqual(list(self.client.iter_objects({"from": {"invalid": []}})), [])
+        self.assertTrue(any("results are incomplete" in line for line in logs.output))
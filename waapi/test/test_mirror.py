@@ -0,0 +1,110 @@
+import time
+import unittest
+
+from waapi import WaapiClient, ProjectMirror
+
+
+class Mirror(unittest.TestCase):
+    TIMEOUT_VALUE = 5  # seconds
+    PARENT = "\\Actor-Mixer Hierarchy\\Default Work Unit"
+
+    def setUp(self):
+        self.client = WaapiClient()
+        self.created_ids = []
+        self.mirror = ProjectMirror(self.client)
+
+    def tearDown(self):
+        self.mirror.close()
+        for object_id in reversed(self.created_ids):
+            self.client.call("ak.wwise.core.object.delete", object=object_id)
+        self.client.disconnect()
+
+    def create(self, name, object_type="Sound", parent=PARENT):
+        result = self.client.call("ak.wwise.core.object.create", parent=parent, type=object_type, name=name)
+        self.created_ids.append(result["id"])
+        return result
+
+    def wait_until(self, condition):
+        deadline = time.time() + self.TIMEOUT_VALUE
+        while not condition() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(condition())
+
+    def test_loaded(self):
+        result = self.client.call(
+            "ak.wwise.core.object.get",
+            {"from": {"path": [self.PARENT]}},
+            options={"return": ["id", "name", "type", "path"]}
+        )
+        work_unit = result["return"][0]
+
+        mirrored = self.mirror.get_by_path(self.PARENT)
+        self.assertEqual({key: mirrored[key] for key in work_unit}, work_unit)
+        self.assertEqual(self.mirror.get(work_unit["id"]), mirrored)
+        self.assertIn(work_unit["id"], [obj["id"] for obj in self.mirror.get_by_type(work_unit["type"])])
+        self.assertIn(work_unit["id"], [obj["id"] for obj in self.mirror.get_by_name(work_unit["name"])])
+        self.assertIn(work_unit["id"], self.mirror)
+
+        # Objects are copies
+        mirrored["name"] = "Modified by the caller"
+        self.assertEqual(self.mirror.get(work_unit["id"])["name"], work_unit["name"])
+
+    def test_created(self):
+        mixer = self.create("Mirrored Mixer", "ActorMixer")
+        sound = self.create("Mirrored Sound", parent=mixer["id"])
+        self.wait_until(lambda: sound["id"] in self.mirror)
+
+        path = self.PARENT + "\\Mirrored Mixer\\Mirrored Sound"
+        self.assertEqual(self.mirror.get_by_path(path)["id"], sound["id"])
+        self.assertEqual(self.mirror.get(sound["id"])["parent"], {"id": mixer["id"]})
+        self.assertEqual([obj["id"] for obj in self.mirror.get_children(mixer["id"])], [sound["id"]])
+        self.assertEqual([obj["id"] for obj in self.mirror.get_by_name("Mirrored Sound")], [sound["id"]])
+        work_unit_id = self.mirror.get_by_path(self.PARENT)["id"]
+        descendants = [obj["id"] for obj in self.mirror.get_descendants(work_unit_id)]
+        self.assertLess(descendants.index(mixer["id"]), descendants.index(sound["id"]))
+
+    def test_renamed(self):
+        mixer = self.create("Mirrored Mixer", "ActorMixer")
+        sound = self.create("Mirrored Sound", parent=mixer["id"])
+        self.wait_until(lambda: sound["id"] in self.mirror)
+
+        self.client.call("ak.wwise.core.object.setName", object=mixer["id"], value="Mirrored Mixer Renamed")
+        self.wait_until(lambda: self.mirror.get(mixer["id"])["name"] == "Mirrored Mixer Renamed")
+
+        # Paths of the descendants are updated
+        self.assertEqual(self.mirror.get(sound["id"])["path"], self.PARENT + "\\Mirrored Mixer Renamed\\Mirrored Sound")
+        self.assertIsNone(self.mirror.get_by_path(self.PARENT + "\\Mirrored Mixer"))
+        self.assertEqual(self.mirror.get_by_name("Mirrored Mixer"), [])
+
+    def test_deleted(self):
+        mixer = self.create("Mirrored Mixer", "ActorMixer")
+        sound = self.create("Mirrored Sound", parent=mixer["id"])
+        self.wait_until(lambda: sound["id"] in self.mirror)
+        count = len(self.mirror)
+
+        self.client.call("ak.wwise.core.object.delete", object=mixer["id"])
+        self.wait_until(lambda: mixer["id"] not in self.mirror)
+
+        # Descendants are deleted with their ancestor
+        self.assertNotIn(sound["id"], self.mirror)
+        self.assertEqual(len(self.mirror), count - 2)
+        self.assertEqual(self.mirror.get_children(mixer["id"]), [])
+
+    def test_roots(self):
+        with ProjectMirror(self.client, roots=[self.PARENT]) as mirror:
+            self.assertEqual(mirror.get_by_path(self.PARENT)["path"], self.PARENT)
+            self.assertIsNone(mirror.get_by_path("\\Actor-Mixer Hierarchy"))
+
+            sound = self.create("Mirrored Sound")
+            self.wait_until(lambda: sound["id"] in mirror)
+        self.assertEqual(len(self.client.subscriptions()), len(ProjectMirror.TOPICS))
+
+    def test_closed(self):
+        self.mirror.close()
+        self.assertEqual(self.client.subscriptions(), set())
+        sound = self.create("Mirrored Sound")
+        self.assertIsNotNone(self.client.call("ak.wwise.core.object.get", {"from": {"id": [sound["id"]]}}))
+        self.assertNotIn(sound["id"], self.mirror)
+
+        self.assertTrue(self.mirror.reload())
+        self.assertIn(sound["id"], self.mirror)
@@ -0,0 +1,154 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from waapi import WaapiClient, ProjectMirror, MirrorSnapshot
+
+
+class MirrorSnapshotFile(unittest.TestCase):
+    PROJECT = "C:\\Projects\\Game\\Game.wproj"
+    ROOTS = ["\\Actor-Mixer Hierarchy"]
+    OBJECTS = [
+        {"id": "{A}", "name": "Actor-Mixer Hierarchy", "type": "Folder", "path": "\\Actor-Mixer Hierarchy",
+         "parent": {"id": "{P}"}, "workunit": None},
+        {"id": "{B}", "name": "Default Work Unit", "type": "WorkUnit", "path": None, "parent": {"id": "{A}"},
+         "workunit": {"id": "{B}"}},
+        {"id": "{C}", "name": u"Son français", "type": "Sound", "path": None, "parent": {"id": "{B}"},
+         "workunit": {"id": "{B}"}},
+    ]
+    TOKENS = {"{B}": ["C:\\Projects\\Game\\Actor-Mixer Hierarchy\\Default Work Unit.wwu", 1234, 56]}
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.snapshot = MirrorSnapshot(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        self.snapshot.write(self.PROJECT, self.ROOTS, self.OBJECTS, self.TOKENS)
+        self.assertEqual(self.snapshot.read(self.PROJECT, self.ROOTS), (self.OBJECTS, self.TOKENS))
+
+        # Snapshots are per project and roots
+        self.assertIsNone(self.snapshot.read("C:\\Projects\\Other\\Other.wproj", self.ROOTS))
+        self.assertIsNone(self.snapshot.read(self.PROJECT, ["\\Events"]))
+
+    def test_corrupted(self):
+        self.snapshot.write(self.PROJECT, self.ROOTS, self.OBJECTS, self.TOKENS)
+        path = self.snapshot.path_of(self.PROJECT, self.ROOTS)
+        with open(path, "r+b") as snapshot_file:
+            snapshot_file.truncate(os.path.getsize(path) - 4)
+        self.assertIsNone(self.snapshot.read(self.PROJECT, self.ROOTS))
+
+        with open(path, "wb") as snapshot_file:
+            snapshot_file.write(b"not a snapshot")
+        self.assertIsNone(self.snapshot.read(self.PROJECT, self.ROOTS))
+
+    def test_token(self):
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".wwu", delete=False) as work_unit_file:
+            work_unit_file.write(b"<WwiseDocument/>")
+        work_unit = {"id": "{B}", "filePath": work_unit_file.name, "workunit:isDirty": False}
+
+        token = MirrorSnapshot.make_token(work_unit)
+        self.assertEqual(token[2], 16)
+        self.assertIsNone(MirrorSnapshot.make_token(dict(work_unit, **{"workunit:isDirty": True})))
+        self.assertIsNone(MirrorSnapshot.make_token({"id": "{B}", "filePath": work_unit_file.name}))
+        self.assertIsNone(MirrorSnapshot.make_token(dict(work_unit, filePath=work_unit_file.name + ".missing")))
+
+        with open(work_unit_file.name, "ab") as work_unit_file:
+            work_unit_file.write(b"\n")
+        self.assertNotEqual(MirrorSnapshot.make_token(work_unit), token)
+
+
+class MirrorWarmStart(unittest.TestCase):
+    PARENT = "\\Actor-Mixer Hierarchy\\Default Work Unit"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.client = WaapiClient()
+        self.created_ids = []
+        self.client.call("ak.wwise.core.project.save")
+
+    def tearDown(self):
+        for object_id in reversed(self.created_ids):
+            self.client.call("ak.wwise.core.object.delete", object=object_id)
+        self.client.call("ak.wwise.core.project.save")
+        self.client.disconnect()
+        shutil.rmtree(self.directory)
+
+    def mirror(self, roots=ProjectMirror.DEFAULT_ROOTS):
+        return ProjectMirror(self.client, roots, snapshot=MirrorSnapshot(self.directory))
+
+    @staticmethod
+    def contents(mirror, root_path="\\"):
+        root = mirror.get_by_path(root_path)
+        return sorted([root] + mirror.get_descendants(root["id"]), key=lambda obj: obj["id"])
+
+    def test_unchanged(self):
+        with self.mirror() as mirror:
+            self.assertFalse(mirror.load_report["snapshot"])
+            contents = self.contents(mirror)
+
+        with self.mirror() as mirror:
+            report = mirror.load_report
+            self.assertTrue(report["snapshot"])
+            self.assertEqual(report["fetched"], 0)
+            self.assertGreaterEqual(report["work_units"], 1)
+            self.assertEqual(report["objects"], len(contents))
+            self.assertEqual(self.contents(mirror), contents)
+
+    def test_changed(self):
+        with self.mirror():
+            pass
+
+        sound = self.client.call("ak.wwise.core.object.create", parent=self.PARENT, type="Sound", name="Snapshot Sound")
+        self.created_ids.append(sound["id"])
+        self.client.call("ak.wwise.core.project.save")
+
+        with self.mirror() as mirror:
+            self.assertTrue(mirror.load_report["snapshot"])
+            self.assertGreaterEqual(mirror.load_report["fetched"], 1)
+            self.assertEqual(mirror.get(sound["id"])["path"], self.PARENT + "\\Snapshot Sound")
+            with ProjectMirror(self.client) as full_mirror:
+                self.assertEqual(self.contents(mirror), self.contents(full_mirror))
+
+    def test_unsaved_changes(self):
+        sound = self.client.call("ak.wwise.core.object.create", parent=self.PARENT, type="Sound", name="Snapshot Sound")
+        self.created_ids.append(sound["id"])
+
+        # Work units with unsaved changes are always fetched
+        with self.mirror():
+            pass
+        with self.mirror() as mirror:
+            self.assertGreaterEqual(mirror.load_report["fetched"], 1)
+            self.assertIn(sound["id"], mirror)
+
+    def test_root_in_work_unit(self):
+        folder = self.client.call("ak.wwise.core.object.create", parent=self.PARENT, type="Folder", name="Snapshot Folder")
+        self.created_ids.append(folder["id"])
+        sound = self.client.call("ak.wwise.core.object.create", parent=folder["id"], type="Sound", name="Snapshot Sound")
+        self.created_ids.append(sound["id"])
+        self.client.call("ak.wwise.core.project.save")
+        roots = (self.PARENT + "\\Snapshot Folder",)
+
+        with self.mirror(roots) as mirror:
+            contents = self.contents(mirror, roots[0])
+        self.assertEqual(len(contents), 2)
+
+        # Objects below a root are saved with the work unit containing the root
+        with self.mirror(roots) as mirror:
+            self.assertTrue(mirror.load_report["snapshot"])
+            self.assertEqual(mirror.load_report["fetched"], 0)
+            self.assertEqual(self.contents(mirror, roots[0]), contents)
+
+        other_sound = self.client.call(
+            "ak.wwise.core.object.create", parent=folder["id"], type="Sound", name="Other Snapshot Sound")
+        self.created_ids.append(other_sound["id"])
+        self.client.call("ak.wwise.core.project.save")
+
+        with self.mirror(roots) as mirror:
+            self.assertEqual(mirror.load_report["fetched"], 1)
+            self.assertEqual(len(mirror), 3)
+            self.assertIn(other_sound["id"], mirror)
+            self.assertIsNone(mirror.get_by_path(self.PARENT))
@@ -0,0 +1,68 @@
+import unittest
+from threading import Event
+
+from waapi import WaapiClientPool, WaapiRequestFailed, wait_all
+
+
+class Pool(unittest.TestCase):
+    TIMEOUT_VALUE = 10  # seconds
+
+    def setUp(self):
+        self.pool = WaapiClientPool(size=3)
+
+    def tearDown(self):
+        self.pool.disconnect()
+
+    def test_calls(self):
+        self.assertTrue(self.pool.is_connected())
+        self.assertEqual(self.pool.size(), 3)
+
+        futures = [self.pool.call_async("ak.wwise.core.getInfo") for _ in range(30)]
+        for result in wait_all(futures):
+            self.assertIsNotNone(result)
+        self.assertEqual(self.pool.outstanding(), [0, 0, 0])
+
+        self.assertIsNotNone(self.pool.call("ak.wwise.core.getInfo"))
+        self.assertIsNone(self.pool.call("ak.wwise.idontexist"))
+
+    def test_least_loaded_session(self):
+        # Sessions without outstanding calls are picked first
+        indexes = [self.pool._acquire_client() for _ in range(4)]
+        self.assertEqual(indexes, [0, 1, 2, 0])
+        self.pool._release_client(1)
+        self.assertEqual(self.pool._acquire_client(), 1)
+        for index in [0, 1, 2, 0]:
+            self.pool._release_client(index)
+        self.assertEqual(self.pool.outstanding(), [0, 0, 0])
+
+    def test_allow_exception(self):
+        with WaapiClientPool(size=2, allow_exception=True) as pool:
+            with self.assertRaises(WaapiRequestFailed):
+                pool.call("ak.wwise.idontexist")
+            self.assertEqual(pool.outstanding(), [0, 0])
+
+    def test_subscriptions_pinned(self):
+        path = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Some Name"
+        self.pool.call("ak.wwise.core.object.delete", object=path)
+
+        created = Event()
+        handler = self.pool.subscribe("ak.wwise.core.object.created", lambda object: created.set())
+        self.assertIsNotNone(handler)
+        self.assertEqual(self.pool.subscriptions(), {handler})
+
+        self.assertIsNotNone(self.pool.call(
+            "ak.wwise.core.object.create",
+            parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+            type="Sound",
+            name="Some Name"
+        ))
+        self.assertTrue(created.wait(self.TIMEOUT_VALUE))
+
+        self.assertTrue(handler.unsubscribe())
+        self.assertEqual(self.pool.subscriptions(), set())
+        self.pool.call("ak.wwise.core.object.delete", object=path)
+
+    def test_disconnect(self):
+        self.assertTrue(self.pool.disconnect())
+        self.assertFalse(self.pool.is_connected())
+        self.assertIsNone(self.pool.call("ak.wwise.core.getInfo"))
@@ -0,0 +1,131 @@
+import socket
+import time
+import unittest
+from queue import Queue
+from threading import Event, Lock, Thread
+
+from waapi import WaapiClient
+
+
+class _ConnectionCutter:
+    """
+    TCP proxy to the Waapi server that can cut the connections going through it, as if Wwise restarted
+    """
+    def __init__(self, host="127.0.0.1", port=8080):
+        self._upstream = (host, port)
+        self._sockets = []
+        self._lock = Lock()
+        self.refuse = False
+
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen(8)
+        self.url = "ws://127.0.0.1:{}/waapi".format(self._listener.getsockname()[1])
+        Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                return
+            if self.refuse:
+                client.close()
+                continue
+
+            server = socket.create_connection(self._upstream)
+            with self._lock:
+                self._sockets += [client, server]
+            Thread(target=self._forward, args=(client, server), daemon=True).start()
+            Thread(target=self._forward, args=(server, client), daemon=True).start()
+
+    @staticmethod
+    def _forward(source, destination):
+        try:
+            while True:
+                data = source.recv(65536)
+                if not data:
+                    break
+                destination.sendall(data)
+        except OSError:
+            pass
+        for sock in (source, destination):
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def cut(self):
+        with self._lock:
+            sockets, self._sockets = self._sockets, []
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    def close(self):
+        self._listener.close()
+        self.cut()
+
+
+class Reconnect(unittest.TestCase):
+    TIMEOUT_VALUE = 10  # seconds
+
+    def setUp(self):
+        self.cutter = _ConnectionCutter()
+
+    def tearDown(self):
+        self.cutter.close()
+
+    def test_resubscribe_after_reconnect(self):
+        reports = Queue()
+        client = WaapiClient(self.cutter.url, reconnect=True, on_reconnect=reports.put)
+        try:
+            path = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Some Name"
+            client.call("ak.wwise.core.object.delete", object=path)
+
+            created = Event()
+            handler = client.subscribe("ak.wwise.core.object.created", lambda object: created.set())
+            self.assertIsNotNone(handler)
+
+            self.cutter.cut()
+            report = reports.get(timeout=self.TIMEOUT_VALUE)
+            self.assertGreaterEqual(report["attempts"], 1)
+            self.assertGreaterEqual(report["downtime"], 0)
+            self.assertEqual(report["resubscribed"], 1)
+            self.assertEqual(report["failed_subscriptions"], [])
+
+            # The handler still receives events after reconnecting
+            self.assertIsNotNone(client.call(
+                "ak.wwise.core.object.create",
+                parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                type="Sound",
+                name="Some Name"
+            ))
+            self.assertTrue(created.wait(self.TIMEOUT_VALUE))
+            self.assertTrue(handler.unsubscribe())
+            client.call("ak.wwise.core.object.delete", object=path)
+        finally:
+            self.assertTrue(client.disconnect())
+
+    def test_disconnect_while_reconnecting(self):
+        client = WaapiClient(self.cutter.url, reconnect=True)
+        self.cutter.refuse = True
+        self.cutter.cut()
+
+        self.assertTrue(client.disconnect())
+        self.assertFalse(client.is_connected())
+        self.assertIsNone(client.call("ak.wwise.core.getInfo"))
+
+    def test_no_reconnect_by_default(self):
+        client = WaapiClient(self.cutter.url)
+        self.cutter.cut()
+
+        deadline = time.time() + self.TIMEOUT_VALUE
+        while client.is_connected() and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(client.is_connected())
+        self.assertIsNone(client.call("ak.wwise.core.getInfo"))
+        self.assertFalse(client.disconnect())
@@ -1,5 +1,6 @@
 from copy import copy
 
+from waapi import WaapiRequestFailed
 from waapi.test.fixture import ConnectedClientTestCase
 
 class RpcLowLevel(ConnectedClientTestCase):
@@ -97,3 +98,24 @@ class RpcLowLevel(ConnectedClientTestCase):
             self.assertIsInstance(result_return.get("name"), str)
             self.assertIn("workunit:isDirty", result_return)
             self.assertIsInstance(result_return.get("workunit:isDirty"), bool)
+
+    def test_call_many(self):
+        requests = [
+            ("ak.wwise.core.getInfo",),
+            ("ak.wwise.core.object.get", {"from": {"ofType": ["Project"]}}),
+            ("ak.wwise.idontexist", {}),
+            ("ak.wwise.core.object.get", {"from": {"ofType": ["Project"]}}, {"return": ["filePath"]}),
+            ("ak.wwise.core.getInfo", {"someArg": True}),
+        ]
+        results = self.client.call_many(iter(requests), max_in_flight=2)
+        self.assertEqual(len(results), len(requests))
+
+        self.assertIn("version", results[0])
+        self.assertIn("name", results[1].get("return")[0])
+        self.assertIsInstance(results[2], WaapiRequestFailed)
+        self.assertEqual(results[2].kwargs.get("message"), "The procedure URI is unknown.")
+        self.assertIn("filePath", results[3].get("return")[0])
+        self.assertIsInstance(results[4], WaapiRequestFailed)
+
+    def test_call_many_empty(self):
+        self.assertEqual(self.client.call_many([]), [])
@@ -0,0 +1,62 @@
+import threading
+import unittest
+
+from waapi import WaapiClient, WaapiRuntime
+from waapi.wamp.async_compatibility import asyncio
+
+
+class Runtime(unittest.TestCase):
+
+    def test_shared_runtime(self):
+        def runtime_thread_count():
+            return sum(1 for thread in threading.enumerate() if thread.name == "WaapiRuntime")
+
+        with WaapiRuntime() as runtime:
+            clients = [WaapiClient(runtime=runtime) for _ in range(4)]
+
+            # Connections share the thread of the runtime
+            self.assertEqual(runtime_thread_count(), 1)
+            for client in clients:
+                self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+
+            # Disconnecting a client leaves the others connected
+            self.assertTrue(clients[0].disconnect())
+            self.assertFalse(runtime.is_closed())
+            self.assertIsNone(clients[0].call("ak.wwise.core.getInfo"))
+            self.assertIsNotNone(clients[1].call("ak.wwise.core.getInfo"))
+
+            for client in clients[1:]:
+                self.assertTrue(client.disconnect())
+
+    def test_close_runtime_stops_clients(self):
+        runtime = WaapiRuntime()
+        client = WaapiClient(runtime=runtime)
+        self.assertTrue(client.is_connected())
+
+        runtime.close()
+        self.assertTrue(runtime.is_closed())
+        self.assertFalse(client.is_connected())
+        self.assertIsNone(client.call("ak.wwise.core.getInfo"))
+        self.assertFalse(client.disconnect())
+
+    def test_caller_event_loop_untouched(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            with WaapiClient() as client:
+                self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+            self.assertIs(asyncio.get_event_loop(), loop)
+            self.assertFalse(loop.is_closed())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    def test_client_from_running_event_loop(self):
+        async def run():
+            # Blocking calls from a coroutine are discouraged, but must not interfere with the running loop
+            with WaapiClient() as client:
+                self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+            with WaapiClient() as client:
+                self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+
+        asyncio.run(run())
@@ -0,0 +1,98 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from waapi import WaapiClient, SchemaCache
+
+
+class _CountingClient:
+    """
+    Client counting the calls forwarded to a WaapiClient, optionally reporting another version of Wwise or failing to
+    get schemas
+    """
+    def __init__(self, client, build=None, fail_schemas=False):
+        self._client = client
+        self._build = build
+        self._fail_schemas = fail_schemas
+        self.uris = []
+
+    def call(self, _uri, *args, **kwargs):
+        self.uris.append(_uri)
+        if self._fail_schemas and _uri == "ak.wwise.waapi.getSchema":
+            return None
+        result = self._client.call(_uri, *args, **kwargs)
+        if _uri == "ak.wwise.core.getInfo" and self._build is not None:
+            result["version"]["build"] = self._build
+        return result
+
+
+class SchemaCacheTest(unittest.TestCase):
+    URI = "ak.wwise.core.object.get"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = WaapiClient()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.disconnect()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_persistent(self):
+        counting_client = _CountingClient(self.client)
+        with SchemaCache(counting_client, self.directory) as cache:
+            schema = cache.get_schema(self.URI)
+            self.assertEqual(schema, self.client.call("ak.wwise.waapi.getSchema", {"uri": self.URI}))
+            self.assertEqual(cache.get_schema(self.URI), schema)
+            self.assertEqual(cache.fetch_count, 1)
+
+        # Another instance, e.g. the next start of a tool, reads the schema from the files
+        counting_client = _CountingClient(self.client)
+        with SchemaCache(counting_client, self.directory) as cache:
+            self.assertEqual(cache.get_schema(self.URI), schema)
+            self.assertEqual(cache.fetch_count, 0)
+            self.assertEqual(counting_client.uris, ["ak.wwise.core.getInfo"])
+
+    def test_refresh_on_new_version(self):
+        with SchemaCache(_CountingClient(self.client, build=1), self.directory) as cache:
+            cache.get_schema(self.URI)
+            self.assertEqual(cache.fetch_count, 1)
+            first_key = cache.build_key
+
+        with SchemaCache(_CountingClient(self.client, build=2), self.directory) as cache:
+            cache.get_schema(self.URI)
+            self.assertEqual(cache.fetch_count, 1)
+            self.assertNotEqual(cache.build_key, first_key)
+
+        self.assertEqual(len([name for name in os.listdir(self.directory) if name.endswith(".index")]), 2)
+
+    def test_shared_between_instances(self):
+        first = SchemaCache(self.client, self.directory)
+        second = SchemaCache(self.client, self.directory)
+        try:
+            schema = first.get_schema(self.URI)
+            self.assertEqual(second.get_schema(self.URI), schema)
+            self.assertEqual(second.fetch_count, 0)
+
+            # Entries appended after the data file was mapped
+            self.assertIsNotNone(second.get_schema("ak.wwise.core.getInfo"))
+            self.assertEqual(first.get_schema("ak.wwise.core.getInfo"), second.get_schema("ak.wwise.core.getInfo"))
+            self.assertEqual(first.fetch_count, 1)
+        finally:
+            first.close()
+            second.close()
+
+    def test_failure_not_cached(self):
+        with SchemaCache(_CountingClient(self.client, fail_schemas=True), self.directory) as cache:
+            self.assertIsNone(cache.get_schema(self.URI))
+            self.assertEqual(cache.fetch_count, 0)
+
+        with SchemaCache(self.client, self.directory) as cache:
+            self.assertIsNotNone(cache.get_schema(self.URI))
+            self.assertEqual(cache.fetch_count, 1)
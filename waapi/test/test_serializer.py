@@ -0,0 +1,57 @@
+import gc
+import sys
+import unittest
+from threading import Event
+
+from waapi import WaapiClient
+from waapi.wamp.serializer import JSON_AUTO, WaapiJsonObjectSerializer, available_json_backends, json_backend
+
+
+class Serializer(unittest.TestCase):
+
+    def test_backends(self):
+        self.assertIn("json", available_json_backends())
+        self.assertEqual(json_backend(JSON_AUTO)[0], available_json_backends()[0])
+        with self.assertRaises(ValueError):
+            json_backend("pickle")
+
+        message = [50, 1, {}, [], {"return": [{"name": u"Café / Bar", "volume": -6.5, "children": None}]}]
+        for backend in available_json_backends():
+            serializer = WaapiJsonObjectSerializer(backend)
+            data = serializer.serialize(message)
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(serializer.unserialize(data), [message])
+
+            batched = WaapiJsonObjectSerializer(backend, batched=True)
+            self.assertEqual(batched.unserialize(batched.serialize(message) * 2), [message, message])
+
+    def test_client(self):
+        unraisable = []
+        default_hook, sys.unraisablehook = sys.unraisablehook, unraisable.append
+        try:
+            with self.assertRaises(ValueError):
+                WaapiClient(serializer="pickle")
+            gc.collect()
+        finally:
+            sys.unraisablehook = default_hook
+        # The partially constructed client is collected without errors
+        self.assertEqual(unraisable, [])
+
+        for backend in available_json_backends():
+            with WaapiClient(serializer=backend) as client:
+                self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+
+                path = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Some Name"
+                client.call("ak.wwise.core.object.delete", object=path)
+
+                created = Event()
+                handler = client.subscribe("ak.wwise.core.object.created", lambda object: created.set())
+                self.assertIsNotNone(client.call(
+                    "ak.wwise.core.object.create",
+                    parent="\\Actor-Mixer Hierarchy\\Default Work Unit",
+                    type="Sound",
+                    name="Some Name"
+                ))
+                self.assertTrue(created.wait(5))
+                self.assertTrue(handler.unsubscribe())
+                client.call("ak.wwise.core.object.delete", object=path)
@@ -121,3 +121,45 @@ class SubscribeLowLevel(CleanConnectedClientTestCase):
         self._create_object()
         # No exception: the callback wrapper ignored the publish
         self._delete_object()
+
+    def test_shared_subscription(self):
+        self._delete_object()
+
+        first_event = Event()
+        second_event = Event()
+
+        first_handler = self.client.subscribe(
+            "ak.wwise.core.object.created",
+            lambda object: first_event.set(),
+            {"return": ["id", "name"]}
+        )
+        second_handler = self.client.subscribe(
+            "ak.wwise.core.object.created",
+            lambda object: second_event.set(),
+            {"return": ["id", "name"]}
+        )
+        other_options_handler = self.client.subscribe("ak.wwise.core.object.created", {"return": ["id"]})
+
+        # Same topic and options share the subscription on the server
+        self.assertIs(first_handler.subscription, second_handler.subscription)
+        self.assertIsNot(first_handler.subscription, other_options_handler.subscription)
+        self.assertEqual(len(self.client.subscriptions()), 3)
+
+        self._create_object()
+        self.assertTrue(first_event.wait(self.TIMEOUT_VALUE))
+        self.assertTrue(second_event.wait(self.TIMEOUT_VALUE))
+        self._delete_object()
+
+        # The remaining handler keeps receiving events after the other one unsubscribed
+        first_event.clear()
+        second_event.clear()
+        self.assertTrue(first_handler.unsubscribe())
+        self.assertFalse(first_handler.unsubscribe())
+
+        self._create_object()
+        self.assertTrue(second_event.wait(self.TIMEOUT_VALUE))
+        self.assertFalse(first_event.is_set())
+        self._delete_object()
+
+        self.assertTrue(second_handler.unsubscribe())
+        self.assertTrue(other_options_handler.unsubscribe())
@@ -0,0 +1,205 @@
+import concurrent.futures
+import unittest
+from queue import Queue
+
+from waapi import WaapiClient, WaapiRequestFailed, ArgumentValidator, EventHandler, compile_schema
+from waapi.wamp.dispatch import DispatchMode
+
+
+class CompileSchemaTest(unittest.TestCase):
+    SCHEMA = {
+        "type": "object",
+        "properties": {
+            "from": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "array", "items": {"$ref": "#/definitions/guid"}, "minItems": 1},
+                    "path": {"type": "array", "items": {"type": "string"}}
+                },
+                "additionalProperties": False,
+                "minProperties": 1
+            },
+            "volume": {"type": "number", "minimum": -200, "maximum": 200},
+            "mode": {"enum": ["replace", "append"]},
+            "value": {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+            "target": {"oneOf": [{"type": "string", "pattern": "^\\\\"}, {"type": "string", "pattern": "^{"}]}
+        },
+        "required": ["from"],
+        "additionalProperties": False,
+        "definitions": {
+            "guid": {"type": "string", "pattern": "^{[0-9A-Fa-f-]{36}}$"}
+        }
+    }
+    GUID = "{12345678-90AB-CDEF-1234-567890ABCDEF}"
+
+    def setUp(self):
+        self.validate = compile_schema(self.SCHEMA)
+
+    def test_valid(self):
+        self.assertIsNone(self.validate({"from": {"id": [self.GUID]}}, "$"))
+        self.assertIsNone(self.validate({"from": {"path": []}, "volume": -6.5, "mode": "append", "value": 4}, "$"))
+        self.assertIsNone(self.validate({"from": {"path": ["\\Actor-Mixer Hierarchy"]}, "target": "\\Events"}, "$"))
+
+    def test_invalid(self):
+        invalid_values = {
+            "$: missing required property from": {},
+            "$: unexpected property form": {"from": {"id": [self.GUID]}, "form": {}},
+            "$.from: unexpected property ids": {"from": {"ids": [self.GUID]}},
+            "$.from.id: expected between 1 and inf items": {"from": {"id": []}},
+            "$.from.id[1]: expected a string matching": {"from": {"id": [self.GUID, "Sound"]}},
+            "$.from.path: expected array": {"from": {"path": "\\Events"}},
+            "$.volume: expected a number <= 200": {"from": {"path": []}, "volume": 300},
+            "$.volume: expected number": {"from": {"path": []}, "volume": True},
+            "$.mode: expected one of": {"from": {"path": []}, "mode": "prepend"},
+            "$.value: no alternative matches": {"from": {"path": []}, "value": 1.5},
+            "$.target: no alternative matches": {"from": {"path": []}, "target": "Events"},
+        }
+        for message, value in invalid_values.items():
+            error = self.validate(value, "$")
+            self.assertIsNotNone(error, message)
+            self.assertTrue(error.startswith(message), error)
+
+    def test_false_subschemas(self):
+        self.assertIsNotNone(compile_schema(False)(1, "$"))
+        validate = compile_schema({"type": "array", "items": False})
+        self.assertIsNone(validate([], "$"))
+        self.assertEqual(validate([1], "$"), "$[0]: no value is allowed")
+
+        validate = compile_schema({"properties": {"a": False}, "patternProperties": {"^b": False}})
+        self.assertIsNone(validate({"c": 1}, "$"))
+        self.assertEqual(validate({"a": 1}, "$"), "$.a: no value is allowed")
+        self.assertEqual(validate({"bc": 1}, "$"), "$.bc: no value is allowed")
+
+        validate = compile_schema({"properties": {"a": True}, "additionalProperties": False})
+        self.assertIsNone(validate({"a": 1}, "$"))
+        self.assertEqual(validate({"b": 1}, "$"), "$: unexpected property b")
+
+    def test_unique_items(self):
+        validate = compile_schema({"type": "array", "uniqueItems": True})
+        self.assertIsNone(validate([1, True], "$"))
+        self.assertIsNone(validate([0, False, None, [0], [False], {"a": 0}, {"a": False}], "$"))
+        self.assertEqual(validate([1, 1.0], "$"), "$: duplicate item 1.0")
+        self.assertEqual(validate([[True], [True]], "$"), "$: duplicate item [True]")
+
+    def test_one_of_ambiguous(self):
+        validate = compile_schema({"oneOf": [{"type": "integer"}, {"type": "number"}]})
+        self.assertIsNone(validate(1.5, "$"))
+        self.assertIn("2 alternatives match", validate(1, "$"))
+
+    def test_recursive_reference(self):
+        validate = compile_schema({
+            "definitions": {"node": {"type": "object", "properties": {"children": {
+                "type": "array", "items": {"$ref": "#/definitions/node"}
+            }}}},
+            "$ref": "#/definitions/node"
+        })
+        self.assertIsNone(validate({"children": [{"children": []}]}, "$"))
+        self.assertEqual(validate({"children": [{"children": [1]}]}, "$"), "$.children[0].children[0]: expected object")
+
+    def test_unsupported_keywords_accepted(self):
+        validate = compile_schema({"type": "string", "format": "unknown", "pattern": "(?<!x", "$ref": "http://x/y"})
+        self.assertIsNone(validate("anything", "$"))
+        self.assertIsNotNone(validate(1, "$"))
+
+
+class ValidationTest(unittest.TestCase):
+    def test_valid_call(self):
+        with WaapiClient(validate=True) as client:
+            result = client.call("ak.wwise.core.object.get", {"from": {"path": ["\\Events"]}}, options={"return": ["id"]})
+            self.assertIsNotNone(result)
+
+    def test_invalid_call_rejected_locally(self):
+        with WaapiClient(validate=True, allow_exception=True) as client:
+            client.call("ak.wwise.core.getInfo")  # Fetches and compiles the schema
+            messages_sent = client.traffic_stats()["messages_sent"]
+
+            with self.assertRaises(WaapiRequestFailed) as context:
+                client.call("ak.wwise.core.getInfo", {"invalidArgument": 1})
+            self.assertEqual(context.exception.uri, "ak.wwise.schema_validation_failed")
+            self.assertIn("invalidArgument", context.exception.kwargs["message"])
+            self.assertEqual(context.exception.kwargs["details"]["procedureUri"], "ak.wwise.core.getInfo")
+
+            with self.assertRaises(WaapiRequestFailed):
+                client.call("ak.wwise.core.getInfo", options={"return": "id"})
+
+            future = client.call_async("ak.wwise.core.getInfo", invalidArgument=1)
+            self.assertIsInstance(future.exception(), WaapiRequestFailed)
+
+            results = client.call_many([("ak.wwise.core.getInfo", {"invalidArgument": 1})])
+            self.assertIsInstance(results[0], WaapiRequestFailed)
+
+            # Nothing was sent to the server
+            self.assertEqual(client.traffic_stats()["messages_sent"], messages_sent)
+
+    def test_invalid_call_without_exception(self):
+        with WaapiClient(validate=True) as client:
+            with self.assertLogs("WampClientAutobahn", "ERROR") as logs:
+                self.assertIsNone(client.call("ak.wwise.core.getInfo", {"invalidArgument": 1}))
+            self.assertIn("ak.wwise.schema_validation_failed", logs.output[0])
+
+    def test_schemas_fetched_once(self):
+        uris = []
+
+        with WaapiClient() as schema_client:
+            def get_schema(uri):
+                uris.append(uri)
+                return schema_client.call("ak.wwise.waapi.getSchema", {"uri": uri})
+
+            with WaapiClient(validate=ArgumentValidator(get_schema)) as client:
+                for _ in range(3):
+                    self.assertIsNotNone(client.call("ak.wwise.core.getInfo"))
+                    self.assertIsNone(client.call("ak.wwise.core.getInfo", {"invalidArgument": 1}))
+                self.assertEqual(uris, ["ak.wwise.core.getInfo"])
+
+    def test_with_coalesced_calls(self):
+        with WaapiClient(validate=True, coalesce_calls=True) as client:
+            futures = [client.call_async("ak.wwise.core.getInfo") for _ in range(3)]
+            for future in futures:
+                self.assertIsNotNone(future.result(timeout=5))
+            self.assertIsNone(client.call("ak.wwise.core.getInfo", {"invalidArgument": 1}))
+
+    def test_schema_requested_without_blocking(self):
+        schema_future = concurrent.futures.Future()
+        with WaapiClient(validate=ArgumentValidator(lambda uri: schema_future), allow_exception=True) as client:
+            valid = client.call_async("ak.wwise.core.getInfo")
+            invalid = client.call_async("ak.wwise.core.getInfo", invalidArgument=1)
+            self.assertFalse(valid.done())
+
+            # Calls are sent once validated
+            schema_future.set_result(client.call("ak.wwise.waapi.getSchema", uri="ak.wwise.core.getInfo"))
+            self.assertIsNotNone(valid.result(timeout=5))
+            self.assertIsInstance(invalid.exception(timeout=5), WaapiRequestFailed)
+
+    def test_call_from_inline_handler(self):
+        futures = Queue()
+        path = "\\Actor-Mixer Hierarchy\\Default Work Unit\\Validated Sound"
+
+        class InlineHandler(EventHandler):
+            dispatch_mode = DispatchMode.INLINE
+
+        with WaapiClient() as other_client, WaapiClient(validate=True) as client:
+            def on_created(*args, **kwargs):
+                # On the thread of the connection, the schema cannot be waited for
+                futures.put(client.call_async("ak.wwise.core.object.get", {"from": {"id": [kwargs["object"]["id"]]}}))
+
+            other_client.call("ak.wwise.core.object.delete", object=path)
+            client.subscribe("ak.wwise.core.object.created", InlineHandler(callback=on_created))
+            try:
+                other_client.call("ak.wwise.core.object.create", parent=path.rsplit("\\", 1)[0], type="Sound",
+                                  name="Validated Sound")
+                result = futures.get(timeout=5).result(timeout=5)
+                self.assertEqual(len(result["return"]), 1)
+            finally:
+                other_client.call("ak.wwise.core.object.delete", object=path)
+
+    def test_procedure_without_schema_not_validated(self):
+        validator = ArgumentValidator(lambda uri: None)
+        self.assertIsNone(validator.validate("ak.wwise.core.getInfo", {"invalidArgument": 1}))
+
+    def test_failed_schema_lookup_not_cached(self):
+        schemas = [None, {"argsSchema": {"type": "object", "additionalProperties": False}}]
+        validator = ArgumentValidator(lambda uri: schemas.pop(0))
+
+        # The lookup failed, e.g. while disconnected
+        self.assertIsNone(validator.validate("ak.wwise.core.getInfo", {"invalidArgument": 1}))
+        self.assertIsNotNone(validator.validate("ak.wwise.core.getInfo", {"invalidArgument": 1}))
@@ -1,10 +1,13 @@
 import six
 import inspect
-from threading import Thread, Event
+from collections import deque
+from threading import Event, Lock
+from time import monotonic, time
 from pprint import pprint
 
-from waapi.wamp.async_compatibility import asyncio
+from waapi.wamp.async_compatibility import asyncio, InvalidStateError
 from waapi.wamp.interface import WampRequestType
+from waapi.wamp.transport import WaapiApplicationRunner
 
 import txaio
 
@@ -12,7 +15,7 @@ from autobahn import util
 from autobahn.wamp import exception, types, uri
 from autobahn.wamp.message import Call, Subscribe
 from autobahn.wamp.protocol import CallRequest, is_method_or_function
-from autobahn.asyncio.wamp import ApplicationSession, ApplicationRunner
+from autobahn.asyncio.wamp import ApplicationSession
 from autobahn.wamp.request import Handler, SubscribeRequest
 
 
@@ -20,16 +23,38 @@ class AutobahnClientDecoupler:
     """
     Decoupler for an autobahn client that indicates when the connection has been made and
     manages a queue for requests (WampRequest)
+
+    When the client reconnects, the decoupler outlives the sessions: requests not processed by a lost session are put
+    back in front of the queue for the next one.
     """
-    def __init__(self, queue_size):
+    def __init__(self, queue_size, reconnect=False):
+        """
+        :param queue_size: Maximum number of requests waiting in the queue
+        :type queue_size: int
+        :param reconnect: True if requests interrupted by the loss of the connection should be kept for the next session
+        :type reconnect: bool
+        """
+        self.reconnect = reconnect
         self._request_queue = asyncio.Queue(queue_size)
-        self._future = None
+        self._replay_queue = deque()
+        """:type: deque[WampRequest]"""
         self._stopping = False
-        """:type: concurrent.futures.Future"""
+        self._stop_requested = asyncio.Event()
+
+        # Requests replayed and dropped since the connection was lost
+        self.replayed_count = 0
+        self.dropped_count = 0
+
+        # Futures of the callers waiting on a request, from any thread
+        self._caller_futures = set()
+        """:type: set[concurrent.futures.Future]"""
+        self._caller_futures_lock = Lock()
+        self._closed = False
 
         # Do not use the asyncio loop, otherwise failure to connect will stop
         # the loop and the caller will never be notified!
         self._joined_event = Event()
+        self._stopped = False
 
     def wait_for_joined(self):
         self._joined_event.wait()
@@ -40,6 +65,16 @@ class AutobahnClientDecoupler:
     def has_joined(self):
         return self._joined_event.is_set()
 
+    def set_stopped(self):
+        """
+        Indicate that the client stopped, which also wakes callers waiting for it to join
+        """
+        self._stopped = True
+        self._joined_event.set()
+
+    def is_stopped(self):
+        return self._stopped
+
     def put_request(self, request):
         """
         Put a WampRequest in the decoupled client processing queue as a coroutine
@@ -49,6 +84,7 @@ class AutobahnClientDecoupler:
         # On first reception of a STOP request, immediately complete other requests with None
         if request.request_type == WampRequestType.STOP and not self._stopping:
             self._stopping = True
+            self._stop_requested.set()
         elif self._stopping:
             async def stop_now():
                 return request.future.set_result(None)
@@ -56,105 +92,294 @@ class AutobahnClientDecoupler:
 
         return self._request_queue.put(request)
 
-    def get_request(self):
+    async def get_request(self):
         """
-        Get a WampRequest from the decoupled client processing queue as a coroutine
+        Get a WampRequest from the decoupled client processing queue as a coroutine, requests to replay first
         :return: Generator to a WampRequest when one is available
         """
-        return self._request_queue.get()
+        if self._replay_queue:
+            return self._replay_queue.popleft()
+        return await self._request_queue.get()
+
+    def requeue(self, request):
+        """
+        Put back a request that was taken from the queue but not sent, so that the next session processes it first
 
-    def set_caller_future(self, concurrent_future):
-        self._future = concurrent_future
+        :type request: WampRequest
+        """
+        self._replay_queue.append(request)
 
-    def unblock_caller(self):
-        if self._future:
-            self._future.set_result(None)
+    def replay(self, request):
+        """
+        Put back a request that was sent but interrupted by the loss of the connection, to send it again
 
+        :type request: WampRequest
+        """
+        self.replayed_count += 1
+        self._replay_queue.append(request)
+
+    def is_stopping(self):
+        return self._stopping
+
+    async def wait_for_stop(self, timeout):
+        """
+        :param timeout: Maximum number of seconds to wait for a STOP request
+        :type timeout: float
+        :return: True if a STOP request was received, False if the timeout elapsed
+        :rtype: bool
+        """
+        try:
+            await asyncio.wait_for(self._stop_requested.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def cancel_requests(self):
+        """
+        Complete all the requests waiting in the queue without processing them: STOP with True and the others with None
+        """
+        requests = list(self._replay_queue)
+        self._replay_queue.clear()
+        while not self._request_queue.empty():
+            requests.append(self._request_queue.get_nowait())
+
+        for request in requests:
+            if not request.future.done():
+                request.future.set_result(True if request.request_type == WampRequestType.STOP else None)
+
+    def track_caller_future(self, concurrent_future):
+        """
+        Keep track of the future of a caller waiting on a request until it completes, so that it can be unblocked if
+        the client dies. Thread-safe.
+
+        :type concurrent_future: concurrent.futures.Future
+        """
+        with self._caller_futures_lock:
+            closed = self._closed
+            if not closed:
+                self._caller_futures.add(concurrent_future)
+
+        if closed:
+            # The client is already gone, the request will never be processed
+            _set_result_if_pending(concurrent_future, None)
+        else:
+            # Called immediately if already done, hence outside of the lock
+            concurrent_future.add_done_callback(self._untrack_caller_future)
 
-def start_decoupled_autobahn_client(url, akcomponent_factory, queue_size, loop, allow_exception):
+    def _untrack_caller_future(self, concurrent_future):
+        with self._caller_futures_lock:
+            self._caller_futures.discard(concurrent_future)
+
+    def unblock_callers(self):
+        """
+        Complete the future of every caller still waiting on a request with None, and of any caller that comes after.
+        Thread-safe.
+        """
+        with self._caller_futures_lock:
+            self._closed = True
+            caller_futures = list(self._caller_futures)
+            self._caller_futures.clear()
+
+        for concurrent_future in caller_futures:
+            _set_result_if_pending(concurrent_future, None)
+
+
+def _set_result_if_pending(concurrent_future, result):
     """
-    Initialize a WAMP client runner in a separate thread with the provided asyncio loop
+    :type concurrent_future: concurrent.futures.Future
+    """
+    try:
+        if not concurrent_future.done():
+            concurrent_future.set_result(result)
+    except InvalidStateError:
+        # Completed concurrently by the event loop
+        pass
+
+
+def start_decoupled_autobahn_client(url, akcomponent_factory, queue_size, loop, allow_exception, max_in_flight,
+                                    dispatcher, reconnect=False, on_reconnect=None, serializers=None, compression=False,
+                                    stats=None):
+    """
+    Start a WAMP client on the provided asyncio loop, which must be running in another thread
 
     :type url: str
-    :type akcomponent_factory: (config, AutobahnClientDecoupler) -> AkComponent
+    :type akcomponent_factory: (config, AutobahnClientDecoupler, bool, int, EventDispatcher) -> AkComponent
     :type queue_size: int
     :type loop: asyncio.AbstractEventLoop
     :type allow_exception: bool
-    :rtype: (Thread, AutobahnClientDecoupler)
+    :param max_in_flight: Maximum number of requests processed concurrently by the client
+    :type max_in_flight: int
+    :param dispatcher: Worker threads on which event callbacks are called
+    :type dispatcher: EventDispatcher
+    :param reconnect: True to reconnect when the connection is lost, until a STOP request is received
+    :type reconnect: bool
+    :param on_reconnect: Called on a worker of the dispatcher with a report after each reconnection
+    :type on_reconnect: (dict) -> None | None
+    :param serializers: WAMP serializers offered to the server, None for the default serializers of autobahn
+    :type serializers: list[autobahn.wamp.interfaces.ISerializer] | None
+    :param compression: Compression of WebSocket messages, True for the default settings, False to disable it (default)
+    :type compression: WebSocketCompression | bool | None
+    :param stats: Statistics updated with the traffic of the connections
+    :type stats: TransportStats | None
+    :return: Future completed when the client stops, and the decoupler to send requests to the client
+    :rtype: (concurrent.futures.Future, AutobahnClientDecoupler)
     """
-    runner = ApplicationRunner(url=url, realm=u"realm1")
-    decoupler = AutobahnClientDecoupler(queue_size)
+    async def create_decoupler():
+        # The queue of the decoupler must belong to the loop of the client
+        return AutobahnClientDecoupler(queue_size, reconnect)
 
-    async_client_thread = _WampClientThread(
-        runner,
-        loop,
+    decoupler = asyncio.run_coroutine_threadsafe(create_decoupler(), loop).result()
+    client_runner = _WampClientRunner(
+        WaapiApplicationRunner(url, u"realm1", serializers, compression, stats),
         decoupler,
         akcomponent_factory,
-        allow_exception
+        allow_exception,
+        max_in_flight,
+        dispatcher,
+        on_reconnect
     )
-    async_client_thread.start()
 
-    return async_client_thread, decoupler
+    return asyncio.run_coroutine_threadsafe(client_runner.run(), loop), decoupler
 
 
-class _WampClientThread(Thread):
-    def __init__(self, runner, loop, decoupler, akcomponent_factory, allow_exception):
-        """
-        WAMP client thread that runs the asyncio main event loop
-        Do NOT terminate this thread to stop the client: use the decoupler to send a STOP request.
+class _WampClientRunner:
+    """
+    WAMP client running its sessions on an asyncio loop, which may be shared with other clients
+    Do NOT cancel the client to stop it: use the decoupler to send a STOP request.
 
-        :type runner: ApplicationRunner
-        :type loop: asyncio.AbstractEventLoop
+    When the decoupler allows reconnecting, a lost connection is retried with an exponential backoff. The new session
+    restores the subscriptions of the previous one before processing the requests it left behind.
+    """
+    RECONNECT_INITIAL_DELAY = 0.5  # seconds
+    RECONNECT_MAX_DELAY = 30  # seconds
+
+    def __init__(self, runner, decoupler, akcomponent_factory, allow_exception, max_in_flight, dispatcher,
+                 on_reconnect=None):
+        """
+        :type runner: WaapiApplicationRunner
         :type decoupler: AutobahnClientDecoupler
-        :type akcomponent_factory: (config, AutobahnClientDecoupler, bool) -> AkComponent
+        :type akcomponent_factory: (config, AutobahnClientDecoupler, bool, int, EventDispatcher) -> AkComponent
         :type allow_exception: False
+        :type max_in_flight: int
+        :type dispatcher: EventDispatcher
+        :type on_reconnect: (dict) -> None | None
         """
-        super(_WampClientThread, self).__init__()
         self._runner = runner
-        self._loop = loop
         self._decoupler = decoupler
         self._akcomponent_factory = akcomponent_factory
         self._allow_exception = allow_exception
+        self._max_in_flight = max_in_flight
+        self._dispatcher = dispatcher
+        self._on_reconnect = on_reconnect
+        self._session = None
+        """:type: WampClientAutobahn | None"""
 
-    def run(self):
+    async def run(self):
         try:
-            asyncio.set_event_loop(self._loop)
+            await self._run_sessions()
+        except Exception as e:
+            pprint(e)
+        finally:
+            # The loop may be shutting down with the client still connected
+            if self._session is not None:
+                self._session.disconnect()
 
-            # Start the loop ourselves to skip the sigterm signal handler since
-            # it is not supported from a different thread
-            coro = self._runner.run(
-                lambda config: self._akcomponent_factory(config, self._decoupler, self._allow_exception),
-                start_loop=False
-            )
+            # Wake the caller if the session never joined, the error is detected by checking if the client stopped
+            self._decoupler.set_stopped()
+            self._decoupler.unblock_callers()
 
-            transport, protocol = self._loop.run_until_complete(coro)
+    async def _connect(self, previous_session=None):
+        """
+        :param previous_session: Session whose subscriptions are restored by the new session once joined
+        :type previous_session: WampClientAutobahn | None
+        :return: The new session, once connected but not necessarily joined
+        :rtype: WampClientAutobahn
+        """
+        created = asyncio.get_event_loop().create_future()
+
+        def make(config):
+            session = self._akcomponent_factory(
+                config,
+                self._decoupler,
+                self._allow_exception,
+                self._max_in_flight,
+                self._dispatcher
+            )
+            if previous_session is not None:
+                session.resume(previous_session)
+            created.set_result(session)
+            return session
+
+        transport, protocol = await self._runner.run(make, start_loop=False)
+
+        # The session is created once the WebSocket handshake completes
+        await asyncio.wait([created, protocol.is_closed], return_when=asyncio.FIRST_COMPLETED)
+        if not created.done():
+            raise ConnectionError("The connection closed before the session could start")
+        return created.result()
+
+    async def _run_sessions(self):
+        session = self._session = await self._connect()
+
+        # Info is too verbose, use error by default
+        # TODO: Make logging level for autobahn configurable
+        txaio.start_logging(level='error')
+
+        while session is not None:
+            await session.wait_for_disconnect()
+            if not self._decoupler.reconnect or self._decoupler.is_stopping():
+                break
+            session = await self._reconnect(session)
+            if session is not None:
+                self._session = session
+
+        # No session will process the requests left in the queue
+        self._decoupler.cancel_requests()
+
+        # Let the callers receive the results before the loop closes: resuming the coroutine of a caller and
+        # completing its concurrent future take one iteration of the loop each
+        for _ in range(2):
+            await asyncio.sleep(0)
+
+    async def _reconnect(self, previous_session):
+        """
+        Connect a new session with an exponential backoff until it joins, or a STOP request is received.
 
-            # Info is too verbose, use error by default
-            # TODO: Make logging level for autobahn configurable
-            txaio.start_logging(level='error')
+        :type previous_session: WampClientAutobahn
+        :return: The joined session, None if stopped
+        :rtype: WampClientAutobahn | None
+        """
+        disconnected_at = time()
+        start = monotonic()
+        delay = self.RECONNECT_INITIAL_DELAY
+        attempts = 0
 
+        while not await self._decoupler.wait_for_stop(delay):
+            attempts += 1
             try:
-                self._loop.run_forever()
-            except KeyboardInterrupt:
-                # wait until we send Goodbye if user hit ctrl-c
-                # (done outside this except so SIGTERM gets the same handling)
-                pass
-
-            # give Goodbye message a chance to go through, if we still
-            # have an active session
-            if protocol._session:
-                self._loop.run_until_complete(protocol._session.leave())
-
-            self._loop.close()
-
-        except Exception as e:
-            pprint(e)
-
-            # Wake the caller, this thread will terminate right after so the
-            # error can be detected by checking if the thread is alive
-            self._decoupler.set_joined()
-
-        self._decoupler.unblock_caller()
+                session = await self._connect(previous_session)
+            except Exception as e:
+                session = None
+                previous_session._log("Reconnection failed: " + repr(e))
+
+            if session is not None and await session.wait_for_ready():
+                resubscribed, failed_subscriptions = session.resubscription_result()
+                report = {
+                    "attempts": attempts,
+                    "disconnected_at": disconnected_at,
+                    "downtime": monotonic() - start,
+                    "resubscribed": resubscribed,
+                    "failed_subscriptions": failed_subscriptions,
+                    "replayed": self._decoupler.replayed_count,
+                    "dropped": self._decoupler.dropped_count
+                }
+                self._decoupler.replayed_count = 0
+                self._decoupler.dropped_count = 0
+                if self._on_reconnect is not None:
+                    self._dispatcher.dispatch(self._on_reconnect, report)
+                return session
+
+            delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
 
 
 class AkCall(Call):
@@ -10,3 +10,17 @@ asyncio = _asyncio
 
 import txaio
 txaio.use_asyncio()
+
+try:
+    from concurrent.futures import InvalidStateError
+except ImportError:
+    # Before Python 3.8, completing a done concurrent future does not raise
+    from asyncio import InvalidStateError
+
+try:
+    asyncio_current_task = asyncio.current_task
+    asyncio_all_tasks = asyncio.all_tasks
+except AttributeError:
+    # Before Python 3.7
+    asyncio_current_task = asyncio.Task.current_task
+    asyncio_all_tasks = asyncio.Task.all_tasks
@@ -1,30 +1,87 @@
+import json
 import logging
 from pprint import pformat
-from threading import Thread
+from weakref import WeakValueDictionary
 
 from autobahn.wamp import ApplicationError
 
-from waapi.wamp.interface import WampRequestType, WampRequest, WaapiRequestFailed
+from waapi.wamp.interface import WampRequestType, WampRequest, WaapiRequestFailed, READ_ONLY_URIS
 from waapi.wamp.ak_autobahn import AkComponent
-from waapi.wamp.async_compatibility import asyncio
+from waapi.wamp.dispatch import DispatchMode
+from waapi.wamp.async_compatibility import asyncio, asyncio_current_task
 
 
 class WampClientAutobahn(AkComponent):
     """
     Implementation class of a Waapi client using the autobahn library
+
+    Requests taken from the decoupler are processed concurrently, up to a maximum number of requests in flight, so that
+    many callers can share the same WebSocket connection.
     """
     logger = logging.getLogger("WampClientAutobahn")
 
-    def __init__(self, config, decoupler, allow_exception):
+    DEFAULT_MAX_IN_FLIGHT = 32
+
+    def __init__(self, config, decoupler, allow_exception, max_in_flight=DEFAULT_MAX_IN_FLIGHT, dispatcher=None):
         """
         :param config: Autobahn configuration
         :type decoupler: AutobahnClientDecoupler
         :param allow_exception: True to allow exception, False to ignore them.
                                 In any case they are logged to stderr.
+        :param max_in_flight: Maximum number of requests processed concurrently, 1 processes them one at a time.
+        :type max_in_flight: int
+        :param dispatcher: Worker threads on which event callbacks are called, owned by the caller, None to call them on
+                           the event loop
+        :type dispatcher: EventDispatcher | None
         """
         super(WampClientAutobahn, self).__init__(config)
         self._decoupler = decoupler
         self._allow_exception = allow_exception
+        self._max_in_flight = max(1, max_in_flight)
+        self._dispatcher = dispatcher
+
+        self._shared_subscriptions = {}
+        """:type: dict[str, _SharedSubscription]"""
+        self._subscription_locks = WeakValueDictionary()
+        """:type: WeakValueDictionary[str, asyncio.Lock]"""
+
+        # Subscriptions of a previous session to restore once joined, see resume
+        self._subscriptions_to_restore = []
+        """:type: list[_SharedSubscription]"""
+        self._resubscription_result = (0, [])
+
+        loop = asyncio.get_event_loop()
+        self._ready = loop.create_future()
+        self._disconnected = loop.create_future()
+        self._consumer = None
+        """:type: asyncio.Task | None"""
+
+    def resume(self, previous_session):
+        """
+        Take over the subscriptions of a session that lost its connection: they are subscribed again once this session
+        joins, before any request is processed, and their handlers keep receiving events.
+
+        :type previous_session: WampClientAutobahn
+        """
+        self._subscriptions_to_restore = list(previous_session._shared_subscriptions.values())
+
+    async def wait_for_ready(self):
+        """
+        :return: True once the session joined and restored its subscriptions, False if it disconnected before
+        :rtype: bool
+        """
+        await asyncio.wait([self._ready, self._disconnected], return_when=asyncio.FIRST_COMPLETED)
+        return self._ready.done() and not self._disconnected.done()
+
+    async def wait_for_disconnect(self):
+        await asyncio.shield(self._disconnected)
+
+    def resubscription_result(self):
+        """
+        :return: Number of subscriptions restored and the topics of the subscriptions that could not be restored
+        :rtype: (int, list[str])
+        """
+        return self._resubscription_result
 
     @classmethod
     def enable_debug_log(cls):
@@ -34,6 +91,25 @@ class WampClientAutobahn(AkComponent):
     def _log(cls, msg):
         cls.logger.debug("WampClientAutobahn: %s", msg)
 
+    def wrap_callback(self, callback):
+        """
+        Wrap a user callback so that it can be called with the keyword arguments of a WAMP event.
+        A callback may choose how it is called with a dispatch_mode attribute, otherwise the dispatcher decides.
+
+        :type callback: (*Any) -> None
+        :rtype: callable
+        """
+        dispatch_mode = getattr(callback, "dispatch_mode", None)
+        if dispatch_mode is None and self._dispatcher is not None:
+            dispatch_mode = DispatchMode.ORDERED if self._dispatcher.ordered else DispatchMode.PARALLEL
+
+        if dispatch_mode == DispatchMode.INLINE or self._dispatcher is None:
+            return _WampCallbackHandler(callback, None)
+        if dispatch_mode == DispatchMode.ORDERED:
+            # Each subscription gets its own lane so that its events are processed in order
+            return _WampCallbackHandler(callback, self._dispatcher.create_lane())
+        return _WampCallbackHandler(callback, self._dispatcher)
+
     async def stop_handler(self, request):
         """
         :param request: WampRequest
@@ -53,42 +129,221 @@ class WampClientAutobahn(AkComponent):
         result = res.kwresults if res else {}
         if request.callback:
             self._log("Callback specified, calling it")
-            callback = _WampCallbackHandler(request.callback)
+            callback = self.wrap_callback(request.callback)
             callback(result)
         request.future.set_result(result)
 
+    def _subscription_lock(self, key):
+        """
+        :return: Lock serializing the subscriptions and unsubscriptions of a shared subscription key
+        :rtype: asyncio.Lock
+        """
+        lock = self._subscription_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._subscription_locks[key] = lock
+        return lock
+
+    def _find_shared_subscription(self, subscription):
+        """
+        :type subscription: Subscription | None
+        :rtype: _SharedSubscription | None
+        """
+        for shared_subscription in self._shared_subscriptions.values():
+            if subscription is not None and shared_subscription.is_identified_by(subscription):
+                return shared_subscription
+
     async def subscribe_handler(self, request):
         """
+        Handlers subscribing to the same topic with the same options share a single subscription on the server.
+
         :param request: WampRequest
         """
-        self._log("Received SUBSCRIBE, subscribing to " + request.uri)
-        callback = _WampCallbackHandler(request.callback)
-        subscription = await (self.subscribe(
-            callback,
-            topic=request.uri,
-            options=request.kwargs)
-        )
-        request.future.set_result(subscription)
+        key = _SharedSubscription.make_key(request.uri, request.kwargs)
+        async with self._subscription_lock(key):
+            shared_subscription = self._shared_subscriptions.get(key)
+            if shared_subscription is None:
+                self._log("Received SUBSCRIBE, subscribing to " + request.uri)
+                shared_subscription = _SharedSubscription(key, request.uri, request.kwargs)
+                shared_subscription.subscription = await (self.subscribe(
+                    shared_subscription,
+                    topic=request.uri,
+                    options=request.kwargs)
+                )
+                self._shared_subscriptions[key] = shared_subscription
+            else:
+                self._log("Received SUBSCRIBE, sharing the subscription to " + request.uri)
+
+            shared_subscription.attach(request.callback, self.wrap_callback(request.callback))
+        request.future.set_result(shared_subscription.subscription)
 
     async def unsubscribe_handler(self, request):
         """
+        The subscription on the server is only removed when its last handler unsubscribes.
+
         :param request: WampRequest
         """
         self._log("Received UNSUBSCRIBE, unsubscribing from " + str(request.subscription))
-        try:
-            # Successful unsubscribe returns nothing
-            await request.subscription.unsubscribe()
-            request.future.set_result(True)
-        except ApplicationError:
+        shared_subscription = self._find_shared_subscription(request.subscription)
+        if shared_subscription is None:
             request.future.set_result(False)
+            return
+
+        async with self._subscription_lock(shared_subscription.key):
+            if not shared_subscription.detach(request.callback):
+                request.future.set_result(False)
+                return
+            if shared_subscription.has_handlers():
+                request.future.set_result(True)
+                return
+
+            del self._shared_subscriptions[shared_subscription.key]
+            try:
+                # Successful unsubscribe returns nothing
+                await shared_subscription.subscription.unsubscribe()
+                request.future.set_result(True)
+            except ApplicationError:
+                # The subscription does not outlive a lost connection
+                request.future.set_result(self._disconnected.done())
+            except Exception as e:
+                self._log(str(e))
+                request.future.set_result(self._disconnected.done())
+
+    async def handle_request(self, request):
+        """
+        Process a single request, completing its future with the result or the error.
+
+        :param request: WampRequest
+        """
+        handler = {
+            WampRequestType.STOP: self.stop_handler,
+            WampRequestType.CALL: self.call_handler,
+            WampRequestType.SUBSCRIBE: self.subscribe_handler,
+            WampRequestType.UNSUBSCRIBE: self.unsubscribe_handler
+        }.get(request.request_type)
+
+        if not handler:
+            self._log("Undefined WampRequestType")
+            return
+
+        try:
+            await handler(request)
         except Exception as e:
-            self._log(str(e))
-            request.future.set_result(False)
+            if self._disconnected.done() and self._keep_for_next_session(request):
+                self._log("Connection lost, the request will be sent again by the next session")
+                return
+            self._handle_request_error(request, e)
+
+        self._log("Done treating request")
+
+    def _keep_for_next_session(self, request):
+        """
+        :param request: WampRequest interrupted by the loss of the connection
+        :return: True if the request will be sent again after reconnecting, False if it must fail
+        :rtype: bool
+        """
+        if not self._decoupler or not self._decoupler.reconnect or self._decoupler.is_stopping():
+            return False
+
+        # Only requests that are safe to repeat are replayed: the server may have processed the lost request
+        if request.request_type == WampRequestType.SUBSCRIBE or (
+                request.request_type == WampRequestType.CALL and request.uri in READ_ONLY_URIS):
+            self._decoupler.replay(request)
+            return True
+
+        self._decoupler.dropped_count += 1
+        return False
+
+    def _handle_request_error(self, request, e):
+        """
+        Complete the future of a failed request according to the allow_exception setting
+
+        :param request: WampRequest
+        :type e: Exception
+        """
+        if isinstance(e, ApplicationError):
+            self.logger.error("WampClientAutobahn (ERROR): " + pformat(str(e)))
+
+            allow_exception = self._allow_exception if request.allow_exception is None else request.allow_exception
+            if allow_exception:
+                request.future.set_exception(WaapiRequestFailed(e))
+            else:
+                request.future.set_result(None)
+        else:
+            # Never leave the caller waiting on a request that cannot complete (e.g. transport lost)
+            self.logger.error("WampClientAutobahn (ERROR): " + pformat(repr(e)))
+            if not request.future.done():
+                request.future.set_result(None)
+
+    async def _handle_request_after(self, previous_task, request):
+        """
+        Process a request once the previous request with the same ordering key has completed.
+
+        :type previous_task: asyncio.Task | None
+        :param request: WampRequest
+        """
+        if previous_task is not None:
+            await asyncio.wait([previous_task])
+        await self.handle_request(request)
+
+    @staticmethod
+    def _ordering_key(request):
+        """
+        Requests sharing an ordering key are processed in the order they were received.
+        A subscription and its unsubscription are identified by the callback of the handler.
+
+        :param request: WampRequest
+        :return: Ordering key, None if the request can be processed in any order.
+        """
+        if request.request_type in (WampRequestType.SUBSCRIBE, WampRequestType.UNSUBSCRIBE):
+            return request.callback
+
+    async def _restore_subscriptions(self):
+        """
+        Subscribe again to the subscriptions taken over from a previous session, see resume
+        """
+        resubscribed = 0
+        failed_subscriptions = []
+        for shared_subscription in self._subscriptions_to_restore:
+            try:
+                shared_subscription.subscription = await self.subscribe(
+                    shared_subscription,
+                    topic=shared_subscription.uri,
+                    options=shared_subscription.options
+                )
+                self._shared_subscriptions[shared_subscription.key] = shared_subscription
+                resubscribed += 1
+            except ApplicationError as e:
+                self.logger.error("WampClientAutobahn (ERROR): " + pformat(str(e)))
+                failed_subscriptions.append(shared_subscription.uri)
+
+        self._subscriptions_to_restore = []
+        self._resubscription_result = (resubscribed, failed_subscriptions)
 
     async def onJoin(self, details):
         self._log("Joined!")
+        self._consumer = asyncio_current_task()
+
+        try:
+            await self._restore_subscriptions()
+        except asyncio.CancelledError:
+            # Lost the connection while restoring the subscriptions
+            return
+        self._ready.set_result(True)
         self._decoupler.set_joined()
 
+        in_flight_limit = asyncio.Semaphore(self._max_in_flight)
+        in_flight = set()
+        """:type: set[asyncio.Task]"""
+        ordering_tails = {}
+        """:type: dict[Any, asyncio.Task]"""
+
+        def on_task_done(task, key):
+            in_flight.discard(task)
+            in_flight_limit.release()
+            if key is not None and ordering_tails.get(key) is task:
+                del ordering_tails[key]
+
         try:
             while True:
                 self._log("About to wait on the queue")
@@ -97,30 +352,32 @@ class WampClientAutobahn(AkComponent):
                 self._log("Received something!")
 
                 try:
-                    handler = {
-                        WampRequestType.STOP: self.stop_handler,
-                        WampRequestType.CALL: self.call_handler,
-                        WampRequestType.SUBSCRIBE: self.subscribe_handler,
-                        WampRequestType.UNSUBSCRIBE: self.unsubscribe_handler
-                    }.get(request.request_type)
-
-                    if handler:
-                        await handler(request)
-                    else:
-                        self._log("Undefined WampRequestType")
-                except ApplicationError as e:
-                    self.logger.error("WampClientAutobahn (ERROR): " + pformat(str(e)))
-
-                    if self._allow_exception:
-                        request.future.set_exception(WaapiRequestFailed(e))
-                    else:
-                        request.future.set_result(None)
-
-                self._log("Done treating request")
-
-                if request.request_type == WampRequestType.STOP:
-                    break
+                    if request.request_type == WampRequestType.STOP:
+                        # Drain everything in flight so that no caller is left waiting on a dropped request
+                        if in_flight:
+                            await asyncio.wait(in_flight)
+                        await self.handle_request(request)
+                        break
+
+                    await in_flight_limit.acquire()
+                except asyncio.CancelledError:
+                    # The connection was lost before the request was sent, let the next session process it
+                    self._decoupler.requeue(request)
+                    raise
+
+                key = self._ordering_key(request)
+                task = asyncio.ensure_future(self._handle_request_after(
+                    ordering_tails.get(key) if key is not None else None,
+                    request
+                ))
+                if key is not None:
+                    ordering_tails[key] = task
+                in_flight.add(task)
+                task.add_done_callback(lambda t, k=key: on_task_done(t, k))
 
+        except asyncio.CancelledError:
+            # The connection was lost, requests are left in the queue for the next session
+            pass
         except RuntimeError:
             # The loop has been shut down by a disconnect
             pass
@@ -128,20 +385,117 @@ class WampClientAutobahn(AkComponent):
     def onDisconnect(self):
         self._log("The client was disconnected.")
 
-        # Stop the asyncio loop, ultimately stopping the runner thread
-        asyncio.get_event_loop().stop()
+        # Stop taking requests from the queue, the runner thread decides whether to stop or reconnect
+        if not self._disconnected.done():
+            self._disconnected.set_result(True)
+        if self._consumer is not None:
+            self._consumer.cancel()
 
 
 class _WampCallbackHandler:
     """
     Wrapper for a callback that unwraps a WAMP response
     """
-    def __init__(self, callback=None):
+    def __init__(self, callback, dispatcher):
+        """
+        :type callback: callable
+        :param dispatcher: Where to call the callback, None to call it directly on the event loop
+        :type dispatcher: EventDispatcher | SerialLane | None
+        """
         assert callable(callback)
         self._callback = callback
+        self._dispatcher = dispatcher
 
     def __call__(self, *args, **kwargs):
         if self._callback and callable(self._callback):
-            # Use a proper thread so that we can nest calls without blocking in the event loop
-            # TODO: Consider using a ThreadPool rather than instantiating a thread each time
-            Thread(target=lambda: self._callback(**kwargs)).start()
+            if self._dispatcher is None:
+                self._callback(**kwargs)
+            else:
+                # Use a worker thread so that we can nest calls without blocking in the event loop
+                self._dispatcher.dispatch(self._callback, **kwargs)
+
+
+class _SharedSubscription:
+    """
+    Subscription on the server shared by every handler subscribed to the same topic with the same options.
+    Events are fanned out to the wrapped callback of each attached handler, in the order they were attached.
+    """
+    def __init__(self, key, uri, options):
+        """
+        :param key: Key identifying the topic and options, see make_key
+        :type key: str
+        :type uri: str
+        :type options: dict
+        """
+        self.key = key
+        self.uri = uri
+        self.options = options
+        self._subscription = None
+        """:type: Subscription | None"""
+        self._previous_subscriptions = []
+        """:type: list[Subscription]"""
+        self._handlers = []
+        """:type: list[(callable, callable)]"""
+
+    @property
+    def subscription(self):
+        """
+        :return: Current subscription on the server
+        :rtype: Subscription | None
+        """
+        return self._subscription
+
+    @subscription.setter
+    def subscription(self, value):
+        # Handlers keep the subscription they received, which remains valid to unsubscribe after reconnecting
+        if self._subscription is not None:
+            self._previous_subscriptions.append(self._subscription)
+        self._subscription = value
+
+    def is_identified_by(self, subscription):
+        """
+        :type subscription: Subscription
+        :return: True if the subscription is the current or a previous subscription of this shared subscription
+        :rtype: bool
+        """
+        return subscription is self._subscription or any(
+            subscription is previous for previous in self._previous_subscriptions)
+
+    @staticmethod
+    def make_key(uri, options):
+        """
+        :type uri: str
+        :type options: dict
+        :return: Key that is equal for the same topic and options, regardless of the order of the options
+        :rtype: str
+        """
+        return uri + json.dumps(options, sort_keys=True, separators=(",", ":"), default=repr)
+
+    def attach(self, callback, wrapped_callback):
+        """
+        :param callback: Callback of the handler, used to detach it
+        :param wrapped_callback: Callback called with the keyword arguments of each event
+        """
+        self._handlers.append((callback, wrapped_callback))
+
+    def detach(self, callback):
+        """
+        :return: True if the callback was attached, False otherwise.
+        :rtype: bool
+        """
+        for index, (attached_callback, _) in enumerate(self._handlers):
+            if attached_callback == callback:
+                del self._handlers[index]
+                return True
+        return False
+
+    def has_handlers(self):
+        return bool(self._handlers)
+
+    def __call__(self, *args, **kwargs):
+        for _, wrapped_callback in list(self._handlers):
+            try:
+                wrapped_callback(**kwargs)
+            except Exception:
+                # A failing inline callback must not prevent the other handlers from receiving the event
+                WampClientAutobahn.logger.exception("Exception in event callback %r", wrapped_callback)
@@ -0,0 +1,126 @@
+import inspect
+from pprint import pprint
+
+from waapi.wamp.async_compatibility import asyncio
+from waapi.wamp.async_decoupled_client import WampClientAutobahn
+from waapi.wamp.transport import WaapiApplicationRunner
+
+
+async def start_native_autobahn_client(url, akcomponent_factory, allow_exception, serializers=None, compression=False,
+                                       stats=None):
+    """
+    Connect a WAMP client on the running asyncio loop and wait for its session to join
+
+    :type url: str
+    :type akcomponent_factory: (config, asyncio.Future, bool) -> WampClientAutobahnNative
+    :type allow_exception: bool
+    :param serializers: WAMP serializers offered to the server, None for the default serializers of autobahn
+    :type serializers: list[autobahn.wamp.interfaces.ISerializer] | None
+    :param compression: Compression of WebSocket messages, True for the default settings, False to disable it (default)
+    :type compression: WebSocketCompression | bool | None
+    :param stats: Statistics updated with the traffic of the connection
+    :type stats: TransportStats | None
+    :return: The joined session, None if the connection failed.
+    :rtype: WampClientAutobahnNative | None
+    """
+    runner = WaapiApplicationRunner(url, u"realm1", serializers, compression, stats)
+    joined = asyncio.get_event_loop().create_future()
+    sessions = []
+
+    def make(config):
+        session = akcomponent_factory(config, joined, allow_exception)
+        sessions.append(session)
+        return session
+
+    try:
+        transport, protocol = await runner.run(make, start_loop=False)
+    except Exception as e:
+        pprint(e)
+        return None
+
+    await asyncio.wait([joined, protocol.is_closed], return_when=asyncio.FIRST_COMPLETED)
+    if joined.done() and joined.result():
+        return sessions[0]
+
+    # The WebSocket closed before the WAMP session could join
+    if sessions:
+        sessions[0].disconnect()
+
+
+class WampClientAutobahnNative(WampClientAutobahn):
+    """
+    Implementation class of a Waapi client using the autobahn library directly on the loop of its caller
+
+    Requests are processed by awaiting handle_request instead of going through an AutobahnClientDecoupler queue, and
+    event callbacks are called on the event loop.
+    """
+    LEAVE_TIMEOUT = 5  # seconds
+
+    def __init__(self, config, joined, allow_exception):
+        """
+        :param config: Autobahn configuration
+        :param joined: Future completed with True when the session joins, False if it disconnected before
+        :type joined: asyncio.Future
+        :param allow_exception: True to allow exception, False to ignore them.
+                                In any case they are logged to stderr.
+        """
+        super(WampClientAutobahnNative, self).__init__(config, None, allow_exception)
+        self._joined = joined
+
+    def has_joined(self):
+        return self._joined.done() and self._joined.result() and not self._disconnected.done()
+
+    def wrap_callback(self, callback):
+        return _AsyncCallbackHandler(callback)
+
+    async def leave_and_wait(self):
+        """
+        Gracefully leave the session and wait for the transport to close.
+        """
+        if not self._disconnected.done():
+            self.leave()
+            try:
+                await asyncio.wait_for(asyncio.shield(self._disconnected), self.LEAVE_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.disconnect()
+
+    async def onJoin(self, details):
+        self._log("Joined!")
+        if not self._joined.done():
+            self._joined.set_result(True)
+
+    def onDisconnect(self):
+        self._log("The client was disconnected.")
+
+        # The loop belongs to the caller: only record the disconnection
+        if not self._joined.done():
+            self._joined.set_result(False)
+        if not self._disconnected.done():
+            self._disconnected.set_result(True)
+
+
+class _AsyncCallbackHandler:
+    """
+    Wrapper for a callback that unwraps a WAMP response on the event loop.
+    Coroutine functions are supported and scheduled as tasks, which allows awaiting other requests from the callback.
+    """
+    def __init__(self, callback=None):
+        assert callable(callback)
+        self._callback = callback
+
+        # The loop only keeps weak references to tasks, which could be collected before they complete
+        self._tasks = set()
+        """:type: set[asyncio.Future]"""
+
+    def __call__(self, *args, **kwargs):
+        if self._callback and callable(self._callback):
+            result = self._callback(**kwargs)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self._tasks.add(task)
+                task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task):
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            WampClientAutobahn.logger.error("Exception in event callback %r", self._callback, exc_info=task.exception())
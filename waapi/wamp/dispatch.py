@@ -0,0 +1,151 @@
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from threading import get_ident, Lock
+
+
+class DispatchMode(Enum):
+    """
+    How the callback of a subscription is called when an event is received
+    """
+    PARALLEL = 0  # On any worker thread, concurrently with other events
+    ORDERED = 1  # On a worker thread, one event at a time in the order they were received
+    INLINE = 2  # Directly on the event loop thread: the callback must be quick and never do blocking requests
+
+
+class EventDispatcher:
+    """
+    Bounded pool of worker threads on which event callbacks are called
+
+    Callbacks are called outside of the event loop, so they can do nested blocking requests on the client.
+    When all workers are busy, events are queued and dispatched to the next available worker in the order they were
+    received, which bounds the number of threads regardless of the rate of events.
+
+    Events dispatched directly may be processed concurrently and complete in any order; dispatch them on a SerialLane
+    created with create_lane to process them one at a time in order.
+    """
+    logger = logging.getLogger("EventDispatcher")
+
+    DEFAULT_MAX_WORKERS = 16
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, ordered=False):
+        """
+        :param max_workers: Maximum number of callbacks called concurrently
+        :type max_workers: int
+        :param ordered: True to call the callback of each subscription one event at a time, in the order the events
+                        were received, on a SerialLane. Different subscriptions still run in parallel.
+        :type ordered: bool
+        """
+        self.ordered = ordered
+        self._worker_idents = set()
+        """:type: set[int]"""
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="WaapiEvent",
+            initializer=self._register_worker
+        )
+
+    def _register_worker(self):
+        with self._lock:
+            self._worker_idents.add(get_ident())
+
+    def is_worker_thread(self):
+        """
+        :return: True if called from one of the worker threads of this dispatcher
+        :rtype: bool
+        """
+        with self._lock:
+            return get_ident() in self._worker_idents
+
+    def dispatch(self, callback, *args, **kwargs):
+        """
+        Call a callback on a worker thread
+
+        :type callback: callable
+        :return: True if the callback was dispatched, False if the dispatcher is shut down
+        :rtype: bool
+        """
+        try:
+            self._executor.submit(self._call, callback, *args, **kwargs)
+            return True
+        except RuntimeError:
+            # Events received while shutting down are dropped
+            return False
+
+    @classmethod
+    def _call(cls, callback, *args, **kwargs):
+        try:
+            callback(*args, **kwargs)
+        except Exception:
+            cls.logger.exception("Exception in event callback %r", callback)
+
+    def create_lane(self):
+        """
+        :return: A new serial lane running on the workers of this dispatcher
+        :rtype: SerialLane
+        """
+        return SerialLane(self)
+
+    def shutdown(self):
+        """
+        Stop accepting events and wait for the events already dispatched to be processed.
+        When called from a worker thread, e.g. a callback disconnecting the client, returns without waiting.
+        """
+        self._executor.shutdown(wait=not self.is_worker_thread())
+
+
+class SerialLane:
+    """
+    FIFO of callbacks called one at a time, in order, on the workers of an EventDispatcher
+
+    A lane occupies at most one worker at a time and yields it periodically, so that many lanes share the workers.
+    """
+    EVENTS_PER_TURN = 32
+
+    def __init__(self, dispatcher):
+        """
+        :type dispatcher: EventDispatcher
+        """
+        self._dispatcher = dispatcher
+        self._queue = deque()
+        """:type: deque[(callable, tuple, dict)]"""
+        self._lock = Lock()
+        self._scheduled = False
+
+    def dispatch(self, callback, *args, **kwargs):
+        """
+        Call a callback after all the callbacks previously dispatched on this lane
+
+        :type callback: callable
+        :return: True if the callback was dispatched, False if the dispatcher is shut down
+        :rtype: bool
+        """
+        with self._lock:
+            self._queue.append((callback, args, kwargs))
+            if self._scheduled:
+                return True
+            self._scheduled = True
+
+        if self._dispatcher.dispatch(self._run):
+            return True
+
+        with self._lock:
+            self._queue.clear()
+            self._scheduled = False
+        return False
+
+    def _run(self):
+        while True:
+            for _ in range(self.EVENTS_PER_TURN):
+                with self._lock:
+                    if not self._queue:
+                        self._scheduled = False
+                        return
+                    callback, args, kwargs = self._queue.popleft()
+                EventDispatcher._call(callback, *args, **kwargs)
+
+            # Yield the worker to other lanes, or keep it if the dispatcher no longer accepts work
+            if self._dispatcher.dispatch(self._run):
+                return
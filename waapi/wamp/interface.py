@@ -28,6 +28,50 @@ class WaapiRequestFailed(Exception):
         return str(self._error)
 
 
+# Remote procedures that do not modify the project or the state of Wwise, which are safe to repeat
+READ_ONLY_URIS = frozenset((
+    u"ak.wwise.core.getInfo",
+    u"ak.wwise.core.getProjectInfo",
+    u"ak.wwise.core.audioSourcePeaks.getMinMaxPeaksInRegion",
+    u"ak.wwise.core.audioSourcePeaks.getMinMaxPeaksInTrimmedRegion",
+    u"ak.wwise.core.log.get",
+    u"ak.wwise.core.mediaPool.get",
+    u"ak.wwise.core.mediaPool.getFields",
+    u"ak.wwise.core.object.diff",
+    u"ak.wwise.core.object.get",
+    u"ak.wwise.core.object.getAttenuationCurve",
+    u"ak.wwise.core.object.getPropertyAndReferenceNames",
+    u"ak.wwise.core.object.getPropertyInfo",
+    u"ak.wwise.core.object.getPropertyNames",
+    u"ak.wwise.core.object.getTypes",
+    u"ak.wwise.core.object.isLinked",
+    u"ak.wwise.core.object.isPropertyEnabled",
+    u"ak.wwise.core.plugin.getList",
+    u"ak.wwise.core.plugin.getProperties",
+    u"ak.wwise.core.plugin.getProperty",
+    u"ak.wwise.core.profiler.getBusses",
+    u"ak.wwise.core.profiler.getCpuUsage",
+    u"ak.wwise.core.profiler.getCursorTime",
+    u"ak.wwise.core.profiler.getGameObjects",
+    u"ak.wwise.core.profiler.getLoadedMedia",
+    u"ak.wwise.core.profiler.getPerformanceMonitor",
+    u"ak.wwise.core.profiler.getRTPCs",
+    u"ak.wwise.core.profiler.getStreamedMedia",
+    u"ak.wwise.core.profiler.getVoiceContributions",
+    u"ak.wwise.core.profiler.getVoices",
+    u"ak.wwise.core.remote.getAvailableConsoles",
+    u"ak.wwise.core.remote.getConnectionStatus",
+    u"ak.wwise.core.soundbank.getInclusions",
+    u"ak.wwise.core.switchContainer.getAssignments",
+    u"ak.wwise.core.transport.getList",
+    u"ak.wwise.core.transport.getState",
+    u"ak.wwise.ui.getSelectedObjects",
+    u"ak.wwise.waapi.getFunctions",
+    u"ak.wwise.waapi.getSchema",
+    u"ak.wwise.waapi.getTopics",
+))
+
+
 class WampRequestType(Enum):
     STOP = 0,
     CALL = 1,
@@ -40,7 +84,8 @@ class WampRequest:
     Structure meant to be used as a payload for requests to a WAMP decoupled client
     """
 
-    def __init__(self, request_type, uri=None, kwargs=None, callback=None, subscription=None, future=None):
+    def __init__(self, request_type, uri=None, kwargs=None, callback=None, subscription=None, future=None,
+                 allow_exception=None):
         """
         :type request_type: WampRequestType
         :type uri: str | None
@@ -49,6 +94,9 @@ class WampRequest:
         :type subscription: Subscription | None
         :param future: Result future to complete upon processing of the request
         :type future: asyncio.Future
+        :param allow_exception: Overrides whether the client completes the future with an exception on failure,
+                                None to use the setting of the client
+        :type allow_exception: bool | None
         """
         self.request_type = request_type
         self.uri = uri
@@ -56,3 +104,4 @@ class WampRequest:
         self.subscription = subscription
         self.callback = callback
         self.future = future
+        self.allow_exception = allow_exception
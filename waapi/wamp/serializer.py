@@ -0,0 +1,154 @@
+import json
+
+from autobahn.wamp.interfaces import IObjectSerializer, ISerializer
+from autobahn.wamp.serializer import Serializer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+JSON_AUTO = "auto"
+JSON_ORJSON = "orjson"
+JSON_UJSON = "ujson"
+JSON_STDLIB = "json"
+JSON_BACKENDS = (JSON_ORJSON, JSON_UJSON, JSON_STDLIB)
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _ujson_dumps(obj):
+    return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+
+def available_json_backends():
+    """
+    :return: Names of the JSON libraries that can be used, fastest first
+    :rtype: list[str]
+    """
+    modules = {JSON_ORJSON: orjson, JSON_UJSON: ujson, JSON_STDLIB: json}
+    return [name for name in JSON_BACKENDS if modules[name] is not None]
+
+
+def json_backend(name=JSON_AUTO):
+    """
+    Functions encoding to and decoding from UTF-8 bytes with a JSON library.
+
+    :param name: One of JSON_BACKENDS, or JSON_AUTO for the fastest library installed
+    :type name: str
+    :return: Name of the library, its dumps and loads functions
+    :rtype: (str, (Any) -> bytes, (bytes) -> Any)
+    :raises: ValueError if the library is unknown or not installed
+    """
+    if name == JSON_AUTO:
+        name = available_json_backends()[0]
+    elif name not in JSON_BACKENDS:
+        raise ValueError("Unknown JSON serializer: {}, expected one of {}".format(
+            name, ", ".join((JSON_AUTO,) + JSON_BACKENDS)))
+    elif name not in available_json_backends():
+        raise ValueError("The {} JSON serializer is not installed".format(name))
+
+    if name == JSON_ORJSON:
+        return name, orjson.dumps, orjson.loads
+    if name == JSON_UJSON:
+        return name, _ujson_dumps, ujson.loads
+    return name, _stdlib_dumps, json.loads
+
+
+class WaapiJsonObjectSerializer:
+    """
+    JSON object serializer of WAMP messages using a pluggable JSON library.
+
+    Payloads are decoded directly from the received bytes. Unlike the JSON serializer of autobahn, binary values are not
+    supported, which WAAPI never uses.
+    """
+    NAME = "json"
+    BINARY = False
+
+    def __init__(self, backend=JSON_AUTO, batched=False):
+        """
+        :param backend: One of JSON_BACKENDS, or JSON_AUTO for the fastest library installed
+        :type backend: str
+        :type batched: bool
+        :raises: ValueError if the library is unknown or not installed
+        """
+        self.backend, self._dumps, self._loads = json_backend(backend)
+        self._batched = batched
+
+    def serialize(self, obj):
+        """
+        Implements :func:`autobahn.wamp.interfaces.IObjectSerializer.serialize`
+        """
+        data = self._dumps(obj)
+        if self._batched:
+            return data + b"\30"
+        return data
+
+    def unserialize(self, payload):
+        """
+        Implements :func:`autobahn.wamp.interfaces.IObjectSerializer.unserialize`
+        """
+        if self._batched:
+            chunks = payload.split(b"\30")[:-1]
+        else:
+            chunks = [payload]
+        if len(chunks) == 0:
+            raise Exception("batch format error")
+        return [self._loads(chunk) for chunk in chunks]
+
+
+IObjectSerializer.register(WaapiJsonObjectSerializer)
+
+
+class WaapiJsonSerializer(Serializer):
+    """
+    WAMP JSON serializer, see WaapiJsonObjectSerializer
+    """
+    SERIALIZER_ID = "json"
+    RAWSOCKET_SERIALIZER_ID = 1
+    PAYLOAD_SERIALIZER_ID = "json"
+    MIME_TYPE = "application/json"
+
+    def __init__(self, backend=JSON_AUTO, batched=False):
+        """
+        :param backend: One of JSON_BACKENDS, or JSON_AUTO for the fastest library installed
+        :type backend: str
+        :type batched: bool
+        :raises: ValueError if the library is unknown or not installed
+        """
+        Serializer.__init__(self, WaapiJsonObjectSerializer(backend, batched))
+        if batched:
+            self.SERIALIZER_ID = "json.batched"
+
+    @property
+    def backend(self):
+        """
+        :return: Name of the JSON library used
+        :rtype: str
+        """
+        return self._serializer.backend
+
+
+ISerializer.register(WaapiJsonSerializer)
+
+
+def make_serializers(serializer):
+    """
+    :param serializer: Name of the JSON library to serialize messages with, see json_backend. None for the default
+                       serializer of autobahn.
+    :type serializer: str | None
+    :return: Serializers to pass to an ApplicationRunner
+    :rtype: list[WaapiJsonSerializer] | None
+    :raises: ValueError if the library is unknown or not installed
+    """
+    if serializer is None:
+        return None
+    return [WaapiJsonSerializer(serializer)]
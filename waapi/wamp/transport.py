@@ -0,0 +1,319 @@
+from threading import Lock
+from time import perf_counter
+
+from autobahn.asyncio.wamp import ApplicationRunner
+from autobahn.asyncio.websocket import WampWebSocketClientFactory, WampWebSocketClientProtocol
+from autobahn.websocket.compress import PerMessageDeflateMixin, PerMessageDeflateOffer, PerMessageDeflateResponse, \
+    PerMessageDeflateResponseAccept
+from autobahn.websocket.protocol import TrafficStats
+from autobahn.websocket.util import parse_url as parse_ws_url
+from autobahn.wamp.types import ComponentConfig
+
+from waapi.wamp.async_compatibility import asyncio
+
+try:
+    from time import thread_time as _cpu_time
+except ImportError:
+    # Before Python 3.7
+    _cpu_time = perf_counter
+
+
+class WebSocketCompression:
+    """
+    Settings of the permessage-deflate compression of WebSocket messages.
+
+    Results of large queries, e.g. ak.wwise.core.object.get or ak.wwise.waapi.getSchema, are JSON that compresses well,
+    which matters when Wwise is reached over a slow link such as an SSH tunnel. The server decides whether to compress
+    its responses once compression is negotiated.
+    """
+    DEFAULT_THRESHOLD = 1024  # bytes
+
+    def __init__(self, window_bits=None, threshold=DEFAULT_THRESHOLD, mem_level=None, no_context_takeover=False):
+        """
+        :param window_bits: Base-two logarithm of the size of the compression window, between 9 and 15. It is requested
+                            from the server for its messages, and used for the messages of the client. Smaller windows
+                            use less memory for a worse compression. None to let the server choose, up to 15.
+        :type window_bits: int | None
+        :param threshold: Messages sent smaller than this size in bytes are not compressed
+        :type threshold: int
+        :param mem_level: Memory level of the compressor of the client, between 1 and 9. None for the zlib default.
+        :type mem_level: int | None
+        :param no_context_takeover: True to compress each message of the client independently of the previous ones, for
+                                    less memory and a worse compression
+        :type no_context_takeover: bool
+        :raises: ValueError if a setting is out of range
+        """
+        if window_bits is not None and window_bits not in PerMessageDeflateMixin.WINDOW_SIZE_PERMISSIBLE_VALUES:
+            raise ValueError("window_bits must be between 9 and 15")
+        if mem_level is not None and mem_level not in PerMessageDeflateMixin.MEM_LEVEL_PERMISSIBLE_VALUES:
+            raise ValueError("mem_level must be between 1 and 9")
+
+        self.window_bits = window_bits
+        self.threshold = threshold
+        self.mem_level = mem_level
+        self.no_context_takeover = no_context_takeover
+
+    @staticmethod
+    def from_option(compression):
+        """
+        :param compression: True for the default settings, False or None to disable compression
+        :type compression: WebSocketCompression | bool | None
+        :rtype: WebSocketCompression | None
+        """
+        if compression is True:
+            return WebSocketCompression()
+        return compression or None
+
+    def offers(self):
+        """
+        :return: permessage-deflate extension offered to the server
+        :rtype: list[PerMessageDeflateOffer]
+        """
+        return [PerMessageDeflateOffer(request_max_window_bits=self.window_bits or 0)]
+
+    def accept(self, response):
+        """
+        :return: Acceptance of the permessage-deflate extension response of the server
+        :rtype: PerMessageDeflateResponseAccept | None
+        """
+        if isinstance(response, PerMessageDeflateResponse):
+            window_bits = self.window_bits
+            if window_bits is not None and response.client_max_window_bits:
+                window_bits = min(window_bits, response.client_max_window_bits)
+            return PerMessageDeflateResponseAccept(
+                response,
+                no_context_takeover=self.no_context_takeover or None,
+                window_bits=window_bits,
+                mem_level=self.mem_level
+            )
+
+
+class TransportStats:
+    """
+    Traffic of the connections of a client, accumulated over its reconnections. Thread-safe.
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self._protocol = None
+        """:type: _WaapiWebSocketClientProtocol | None"""
+        self._compression = None
+        self._traffic = self._traffic_of(None)
+        self._compression_time = {"compress": 0.0, "decompress": 0.0}
+        self._compression_count = {"compress": 0, "decompress": 0}
+
+    @staticmethod
+    def _traffic_of(protocol):
+        """
+        :type protocol: _WaapiWebSocketClientProtocol | None
+        :rtype: dict[str, int]
+        """
+        traffic = protocol.trafficStats if protocol is not None else TrafficStats()
+        return {
+            "bytes_sent": traffic.outgoingOctetsWireLevel,
+            "bytes_received": traffic.incomingOctetsWireLevel,
+            "payload_bytes_sent": traffic.outgoingOctetsAppLevel,
+            "payload_bytes_received": traffic.incomingOctetsAppLevel,
+            "messages_sent": traffic.outgoingWebSocketMessages,
+            "messages_received": traffic.incomingWebSocketMessages,
+        }
+
+    def attach(self, protocol):
+        """
+        :type protocol: _WaapiWebSocketClientProtocol
+        """
+        with self._lock:
+            self._protocol = protocol
+            compressor = protocol._perMessageCompress
+            self._compression = compressor.EXTENSION_NAME if compressor is not None else None
+
+    def detach(self, protocol):
+        """
+        Add the traffic of a closed connection to the totals
+
+        :type protocol: _WaapiWebSocketClientProtocol
+        """
+        with self._lock:
+            if self._protocol is not protocol:
+                return
+            self._protocol = None
+            for key, value in self._traffic_of(protocol).items():
+                self._traffic[key] += value
+
+    def add_compression_time(self, operation, seconds):
+        """
+        :param operation: "compress" or "decompress"
+        :type operation: str
+        :param seconds: CPU time spent on one message
+        :type seconds: float
+        """
+        with self._lock:
+            self._compression_time[operation] += seconds
+            self._compression_count[operation] += 1
+
+    def as_dict(self):
+        """
+        :return: Bytes on the wire and of payloads, number of messages, and CPU time spent in seconds compressing and
+                 decompressing messages, for both directions. The negotiated "compression" extension is None when
+                 messages are not compressed.
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._traffic)
+            for key, value in self._traffic_of(self._protocol).items():
+                stats[key] += value
+            stats["compression"] = self._compression
+            stats["compressed_messages"] = self._compression_count["compress"]
+            stats["decompressed_messages"] = self._compression_count["decompress"]
+            stats["compress_time"] = self._compression_time["compress"]
+            stats["decompress_time"] = self._compression_time["decompress"]
+
+        for direction in ("sent", "received"):
+            payload_bytes = stats["payload_bytes_" + direction]
+            stats["compression_ratio_" + direction] = \
+                float(stats["bytes_" + direction]) / payload_bytes if payload_bytes else None
+        return stats
+
+
+class _TimedPerMessageCompress:
+    """
+    Measure the CPU time spent compressing and decompressing messages by a permessage-compress extension
+    """
+    def __init__(self, compressor, stats):
+        """
+        :type stats: TransportStats
+        """
+        self._compressor = compressor
+        self._stats = stats
+        self._compress_time = 0.0
+        self._decompress_time = 0.0
+
+    def __getattr__(self, name):
+        return getattr(self._compressor, name)
+
+    def start_compress_message(self):
+        self._compress_time = 0.0
+        self._compressor.start_compress_message()
+
+    def compress_message_data(self, data):
+        start = _cpu_time()
+        try:
+            return self._compressor.compress_message_data(data)
+        finally:
+            self._compress_time += _cpu_time() - start
+
+    def end_compress_message(self):
+        start = _cpu_time()
+        try:
+            return self._compressor.end_compress_message()
+        finally:
+            self._stats.add_compression_time("compress", self._compress_time + _cpu_time() - start)
+
+    def start_decompress_message(self):
+        self._decompress_time = 0.0
+        self._compressor.start_decompress_message()
+
+    def decompress_message_data(self, data, *args, **kwargs):
+        start = _cpu_time()
+        try:
+            return self._compressor.decompress_message_data(data, *args, **kwargs)
+        finally:
+            self._decompress_time += _cpu_time() - start
+
+    def end_decompress_message(self):
+        self._compressor.end_decompress_message()
+        self._stats.add_compression_time("decompress", self._decompress_time)
+
+
+class _WaapiWebSocketClientProtocol(WampWebSocketClientProtocol):
+    """
+    WAMP over WebSocket protocol skipping the compression of small messages and measuring its traffic
+    """
+    def onOpen(self):
+        if self._perMessageCompress is not None:
+            self._perMessageCompress = _TimedPerMessageCompress(self._perMessageCompress, self.factory.stats)
+        self.factory.stats.attach(self)
+        super(_WaapiWebSocketClientProtocol, self).onOpen()
+
+    def onClose(self, wasClean, code, reason):
+        self.factory.stats.detach(self)
+        super(_WaapiWebSocketClientProtocol, self).onClose(wasClean, code, reason)
+
+    def sendMessage(self, payload, isBinary=False, fragmentSize=None, sync=False, doNotCompress=False):
+        if len(payload) < self.factory.compression_threshold:
+            doNotCompress = True
+        super(_WaapiWebSocketClientProtocol, self).sendMessage(payload, isBinary, fragmentSize, sync, doNotCompress)
+
+
+class WaapiApplicationRunner(ApplicationRunner):
+    """
+    Runner of WAMP over WebSocket sessions with configurable compression.
+
+    Unlike ApplicationRunner, messages are not limited to 1 MB, which results of large queries exceed.
+    """
+    def __init__(self, url, realm=u"realm1", serializers=None, compression=False, stats=None):
+        """
+        :type url: str
+        :type realm: str
+        :param serializers: WAMP serializers offered to the server, None for the default serializers of autobahn
+        :type serializers: list[autobahn.wamp.interfaces.ISerializer] | None
+        :param compression: Compression of messages, True for the default settings, False to disable it (default)
+        :type compression: WebSocketCompression | bool | None
+        :param stats: Statistics updated with the traffic of the connections
+        :type stats: TransportStats | None
+        """
+        super(WaapiApplicationRunner, self).__init__(url, realm, serializers=serializers)
+        self.compression = WebSocketCompression.from_option(compression)
+        self.stats = stats or TransportStats()
+
+    def run(self, make, start_loop=False, log_level="info"):
+        """
+        Connect a session on the running loop
+
+        :param make: Factory of the session, called with a ComponentConfig
+        :param start_loop: Must be False, the loop is never started by this runner
+        :return: Coroutine completed with the transport and protocol once connected
+        """
+        assert not start_loop, "WaapiApplicationRunner only runs on a running loop"
+
+        def create():
+            return make(ComponentConfig(self.realm, self.extra))
+
+        # Unlike ApplicationRunner, the loop is not set globally for txaio: each client runs on the loop of its thread
+        loop = asyncio.get_event_loop()
+        is_secure, host, port, _, _, _ = parse_ws_url(self.url)
+        transport_factory = WampWebSocketClientFactory(
+            create,
+            loop=loop,
+            url=self.url,
+            serializers=self.serializers,
+            proxy=self.proxy,
+            headers=self.headers
+        )
+        transport_factory.protocol = _WaapiWebSocketClientProtocol
+        transport_factory.stats = self.stats
+        transport_factory.compression_threshold = self.compression.threshold if self.compression else 0
+
+        compression_options = {}
+        if self.compression is not None:
+            compression_options = {
+                "perMessageCompressionOffers": self.compression.offers(),
+                "perMessageCompressionAccept": self.compression.accept
+            }
+
+        # Same settings as ApplicationRunner, without limits on the size of messages
+        transport_factory.setProtocolOptions(
+            maxFramePayloadSize=0,
+            maxMessagePayloadSize=0,
+            autoFragmentSize=65536,
+            failByDrop=False,
+            openHandshakeTimeout=2.5,
+            closeHandshakeTimeout=1.0,
+            tcpNoDelay=True,
+            autoPingInterval=10.0,
+            autoPingTimeout=5.0,
+            autoPingSize=12,
+            **compression_options
+        )
+
+        return loop.create_connection(
+            transport_factory, host, port, ssl=is_secure if self.ssl is None else self.ssl)